@@ -1,42 +1,607 @@
-from fastapi import FastAPI, HTTPException
-import json, os
-from datetime import datetime
+from fastapi import FastAPI, HTTPException, Request, Response, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+import json, os, re, threading, time, gzip, hashlib, sqlite3
+
+import metrics
+import qa_store
+import search
+import section_query
+import snapshot_file
+import storage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 app = FastAPI(title="MBA popular course")
 
 DATA_FILE = "popular_mba_data.json"
+SNAPSHOT_FILE = "popular_mba_data.snap"
+# "json": serve DATA_FILE from memory; "sqlite": serve from the SQLite
+# store (storage.py), sections answered by indexed queries; "mmap": map
+# SNAPSHOT_FILE (snapshot_file.py) and decode only the requested section.
+# Only DATA_FILE is committed; build the other two on deploy with
+# `python scraper.py --build-stores`.
+DATA_BACKEND = os.environ.get("DATA_BACKEND", "json")
+MIN_COMPRESS_SIZE = 1024  # bytes, smaller bodies are sent as-is
+# Bodies are compressed on the request path (snapshot reloads happen under
+# _snapshot_lock): brotli 5 / gzip 6 are within a few % of the max levels
+# in size at a fraction of the time (7 MB document: br 11 3 s vs 0.03 s)
+BROTLI_QUALITY = int(os.environ.get("BROTLI_QUALITY", "5"))
+GZIP_LEVEL = int(os.environ.get("GZIP_LEVEL", "6"))
+SECTION_BODY_CACHE_SIZE = 256  # encoded section bodies kept per snapshot
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes per write when streaming the full document
 
+# 🔹 Operational metrics, served by /metrics (see metrics.py)
+# Each uvicorn worker keeps its own registry; scrape them per worker or
+# aggregate with sum() in Prometheus.
+API_METRICS = metrics.make_registry()
+metrics.describe(API_METRICS, "api_request_seconds", "Request latency per route, until the last body byte is sent")
+metrics.describe(API_METRICS, "api_response_bytes", "Response body size per route")
+metrics.describe(API_METRICS, "api_snapshot_loads_total", "Snapshot lookups: hit, miss (reloaded), rebuilding (previous served) or stale (reload failed)")
+metrics.describe(API_METRICS, "api_body_cache_total", "Encoded body cache lookups")
+metrics.describe(API_METRICS, "api_not_found_total", "Section and course lookups that returned 404")
+metrics.describe(API_METRICS, "api_data_age_seconds", "Seconds since the backend's data file was last replaced (-1: missing)")
+metrics.describe(API_METRICS, "api_snapshot_age_seconds", "Seconds since this worker loaded its snapshot")
 
-def load_data():
-    if not os.path.exists(DATA_FILE):
+# 🔹 In-memory snapshot cache
+# The parsed document is kept in process memory and only re-read when
+# os.stat() reports a different file. The scraper publishes new data with
+# os.replace(), so a refresh always shows up as a new inode / mtime and a
+# reader never sees a half-written file.
+_snapshots = {}
+_snapshot_lock = threading.Lock()
+
+
+def file_signature(st):
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def build_snapshot(path):
+    with open(path, "r", encoding="utf-8") as f:
+        # fstat the open handle so the signature belongs to the exact
+        # file we parse, even if it's swapped while we read it
+        signature = file_signature(os.fstat(f.fileno()))
+        data = json.load(f)
+
+    body = encode_body({"data": data})
+    # The full document is what pollers hit, compress it up front
+    for encoding in ("gzip", "br"):
+        compressed_body(body, encoding)
+
+    return {
+        "signature": signature,
+        "data": data,
+        "index": build_section_index(data),
+        "body": body,
+        "section_bodies": {},
+        "loaded_at": time.time()
+    }
+
+
+# 🔹 Memory-mapped snapshot
+# Bodies are views into the mapping, so workers share the page cache and
+# the document is never materialized as Python objects.
+def build_mmap_snapshot(path):
+    with open(path, "rb") as f:
+        signature = file_signature(os.fstat(f.fileno()))
+        snap = snapshot_file.open_snapshot(f)
+
+    body = {
+        "raw": snapshot_file.block(snap, "body"),
+        "etag": snap["etag"],
+        "gzip": snapshot_file.block(snap, "gzip"),
+        "br": snapshot_file.block(snap, "br")
+    }
+
+    return {
+        "signature": signature,
+        "snap": snap,
+        "body": body,
+        "section_bodies": {},
+        "loaded_at": time.time()
+    }
+
+
+def get_snapshot(path=DATA_FILE, build=build_snapshot):
+    try:
+        signature = file_signature(os.stat(path))
+    except FileNotFoundError:
         raise HTTPException(
             status_code=503,
             detail="Data not generated yet. Please wait."
         )
 
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    snapshot = _snapshots.get(path)
+    if snapshot is not None and snapshot["signature"] == signature:
+        metrics.inc(API_METRICS, "api_snapshot_loads_total", backend=DATA_BACKEND, result="hit")
+        return snapshot
+
+    if not start_rebuild(snapshot):
+        metrics.inc(API_METRICS, "api_snapshot_loads_total", backend=DATA_BACKEND, result="rebuilding")
+        return snapshot
+
+    try:
+        # Another request may have reloaded while we waited for the lock
+        snapshot = _snapshots.get(path)
+        if snapshot is not None and snapshot["signature"] == signature:
+            metrics.inc(API_METRICS, "api_snapshot_loads_total", backend=DATA_BACKEND, result="hit")
+            return snapshot
+
+        try:
+            with metrics.timer(API_METRICS, "api_snapshot_build_seconds", backend=DATA_BACKEND):
+                fresh = build(path)
+        except (OSError, ValueError) as e:
+            if snapshot is None:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Data not generated yet. Please wait."
+                )
+            # Keep serving the last good snapshot
+            print(f"⚠️ Snapshot reload failed, serving previous data: {e}")
+            metrics.inc(API_METRICS, "api_snapshot_loads_total", backend=DATA_BACKEND, result="stale")
+            return snapshot
+
+        # Single reference assignment → in-flight requests keep the old
+        # snapshot object, new requests get the fresh one
+        _snapshots[path] = fresh
+        metrics.inc(API_METRICS, "api_snapshot_loads_total", backend=DATA_BACKEND, result="miss")
+        return fresh
+    finally:
+        _snapshot_lock.release()
+
+
+# One request rebuilds a stale snapshot; the others keep getting the
+# previous one (still valid until the swap) instead of queueing on the
+# lock. Only a worker with nothing loaded yet has to wait.
+def start_rebuild(snapshot):
+    return _snapshot_lock.acquire(blocking=snapshot is None)
+
+
+def load_data():
+    return get_snapshot()["data"]
+
+
+# 🔹 Pre-serialized response bodies
+# Each payload is encoded once per snapshot (same settings as FastAPI's
+# JSONResponse), hashed into a strong ETag, and its gzip / brotli variants
+# are produced on first use and kept alongside it.
+def encode_body(payload):
+    return encode_body_bytes(json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8"))
+
+
+def encode_body_bytes(raw):
+    return {
+        "raw": raw,
+        "etag": hashlib.sha256(raw).hexdigest()[:32],
+        "gzip": None,
+        "br": None
+    }
+
 
-    return data
-
-
-# 🔍 Recursive function to find section by name
-def find_section(data, section_name):
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if key.lower() == section_name.lower():
-                return value
-            result = find_section(value, section_name)
-            if result is not None:
-                return result
-    elif isinstance(data, list):
-        for item in data:
-            result = find_section(item, section_name)
-            if result is not None:
-                return result
+def compressed_body(body, encoding):
+    if body[encoding] is None:
+        if encoding == "gzip":
+            body["gzip"] = gzip.compress(body["raw"], compresslevel=GZIP_LEVEL, mtime=0)
+        elif encoding == "br" and brotli is not None:
+            body["br"] = brotli.compress(body["raw"], quality=BROTLI_QUALITY)
+    return body[encoding]
+
+
+def pick_encoding(accept_encoding):
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token.strip().lower()] = q
+
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
     return None
 
 
+def etag_matches(if_none_match, etag):
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        # "<hash>", "<hash>-gzip" and "<hash>-br" all name the same content
+        if tag.strip('"').split("-")[0] == etag:
+            return True
+    return False
+
+
+# The variant of `body` this client accepts; sets Content-Encoding and
+# the variant's ETag in `headers`
+def negotiated_content(request, body, headers):
+    content = body["raw"]
+    if len(content) >= MIN_COMPRESS_SIZE:
+        encoding = pick_encoding(request.headers.get("accept-encoding", ""))
+        if encoding:
+            content = compressed_body(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["ETag"] = f'"{body["etag"]}-{encoding}"'
+    return content
+
+
+def send_body(request, body):
+    headers = {"ETag": f'"{body["etag"]}"', "Vary": "Accept-Encoding"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, body["etag"]):
+        return Response(status_code=304, headers=headers)
+
+    content = negotiated_content(request, body, headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+# 🔹 Streamed bodies with byte ranges
+# The full document is written out in STREAM_CHUNK_SIZE slices of the
+# pre-encoded bytes (views into the mapping on the mmap backend), so a
+# request never copies the body. A single "bytes=" range is honoured
+# against the selected encoding, which lets clients resume downloads;
+# If-Range falls back to the whole body once the ETag has moved.
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+# (start, end) slice for a Range header, None when it should be ignored
+# (malformed or multiple ranges → full body, as RFC 9110 allows)
+def parse_range(header, size):
+    match = RANGE_RE.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        if int(last) == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - int(last)), size
+
+    start = int(first)
+    if last != "" and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return start, size if last == "" else min(int(last) + 1, size)
+
+
+async def iter_chunks(content, start, end):
+    view = memoryview(content)
+    for offset in range(start, end, STREAM_CHUNK_SIZE):
+        yield view[offset:min(offset + STREAM_CHUNK_SIZE, end)]
+
+
+def stream_body(request, body):
+    headers = {"ETag": f'"{body["etag"]}"', "Vary": "Accept-Encoding", "Accept-Ranges": "bytes"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, body["etag"]):
+        return Response(status_code=304, headers=headers)
+
+    content = negotiated_content(request, body, headers)
+    size = len(content)
+    start, end, status = 0, size, 200
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == headers["ETag"]):
+        try:
+            span = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+        if span is not None:
+            start, end = span
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+
+    headers["Content-Length"] = str(end - start)
+    if request.method == "HEAD":
+        return Response(status_code=status, media_type="application/json", headers=headers)
+    return StreamingResponse(
+        iter_chunks(content, start, end),
+        status_code=status,
+        media_type="application/json",
+        headers=headers
+    )
+
+
+# 🔍 Section index, built once per snapshot
+# "names" maps every lowercased key to all of its paths in depth-first order
+# (so names["author"][0] is what the old recursive walk returned first),
+# "paths" maps every lowercased path like
+# "distance_btech/overviews/overview/highlights" to its node.
+def build_section_index(data):
+    index = {
+        "roots": [key.lower() for key in data] if isinstance(data, dict) else [],
+        "names": {},
+        "paths": {}
+    }
+
+    def walk(node, path):
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            return
+
+        for key, value in items:
+            key = str(key).lower()
+            child_path = f"{path}/{key}" if path else key
+
+            # None values never matched in the old walk, keep it that way
+            if isinstance(node, dict) and value is not None:
+                index["names"].setdefault(key, []).append(child_path)
+            index["paths"][child_path] = value
+            walk(value, child_path)
+
+    walk(data, "")
+    return index
+
+
+# 🔍 Resolve a section name or a "/"-separated path to its matching paths.
+# Paths may be given from the document root or from a course root, e.g.
+# "overviews/overview/highlights".
+def find_section(index, section_name):
+    name = section_name.strip("/").lower()
+
+    if "/" not in name:
+        return index["names"].get(name, [])
+
+    if name in index["paths"]:
+        return [name]
+
+    return [
+        f"{root}/{name}" for root in index["roots"]
+        if f"{root}/{name}" in index["paths"]
+    ]
+
+
+# 🔹 SQLite store connections
+# One read-only connection per worker thread, reopened when the database
+# file is replaced (e.g. by a deploy pulling a new copy).
+_db_local = threading.local()
+
+
+def db_connection(detail="Data store not generated yet. Please wait."):
+    try:
+        signature = file_signature(os.stat(qa_store.DB_FILE))
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail=detail)
+
+    conn = getattr(_db_local, "conn", None)
+    if conn is None or _db_local.signature != signature:
+        if conn is not None:
+            conn.close()
+        conn = qa_store.connect(readonly=True)
+        _db_local.conn, _db_local.signature = conn, signature
+    return conn
+
+
+# 🔹 SQLite-backed snapshot
+# Same shape as the JSON snapshot minus "data" / "index": the full body is
+# stitched from the stored course documents without parsing them, and is
+# rebuilt only when meta.generation moves.
+def get_db_snapshot():
+    conn = db_connection()
+    try:
+        generation = storage.generation(conn)
+    except sqlite3.OperationalError:
+        raise HTTPException(
+            status_code=503,
+            detail="Data not generated yet. Please wait."
+        )
+
+    snapshot = _snapshots.get("sqlite")
+    if snapshot is not None and snapshot["signature"] == generation:
+        metrics.inc(API_METRICS, "api_snapshot_loads_total", backend="sqlite", result="hit")
+        return snapshot
+
+    if not start_rebuild(snapshot):
+        metrics.inc(API_METRICS, "api_snapshot_loads_total", backend="sqlite", result="rebuilding")
+        return snapshot
+
+    try:
+        snapshot = _snapshots.get("sqlite")
+        if snapshot is not None and snapshot["signature"] == generation:
+            metrics.inc(API_METRICS, "api_snapshot_loads_total", backend="sqlite", result="hit")
+            return snapshot
+
+        started = time.perf_counter()
+        raw = ",".join(
+            json.dumps(course_key, ensure_ascii=False) + ":" + document
+            for course_key, document in storage.documents(conn)
+        )
+        body = encode_body_bytes(('{"data":{' + raw + "}}").encode("utf-8"))
+        for encoding in ("gzip", "br"):
+            compressed_body(body, encoding)
+
+        fresh = {
+            "signature": generation,
+            "body": body,
+            "section_bodies": {},
+            "loaded_at": time.time()
+        }
+        _snapshots["sqlite"] = fresh
+        metrics.observe(API_METRICS, "api_snapshot_build_seconds", time.perf_counter() - started, backend="sqlite")
+        metrics.inc(API_METRICS, "api_snapshot_loads_total", backend="sqlite", result="miss")
+        return fresh
+    finally:
+        _snapshot_lock.release()
+
+
+def current_snapshot():
+    if DATA_BACKEND == "sqlite":
+        return get_db_snapshot()
+    if DATA_BACKEND == "mmap":
+        return get_snapshot(SNAPSHOT_FILE, build_mmap_snapshot)
+    return get_snapshot()
+
+
+# 🔍 Search index, built on the first /search against a snapshot.
+# The sqlite backend doesn't need one when FTS5 is available
+# (storage.search_text queries text_fts, built from the same documents).
+# On mmap the index is the one thing held per worker: documents are
+# collected one course slice at a time, but the postings and the text of
+# every FAQ / answer / section stay in memory, roughly the size of the
+# document's text.
+def search_index(snapshot):
+    index = snapshot.get("search")
+    if index is None:
+        with _snapshot_lock:
+            index = snapshot.get("search")
+            if index is None:
+                if "data" in snapshot:
+                    docs = search.collect_documents(snapshot["data"])
+                elif "snap" not in snapshot:
+                    # SQLite without FTS5
+                    docs = search.collect_documents(json.loads(snapshot["body"]["raw"])["data"])
+                else:
+                    snap = snapshot["snap"]
+                    docs = []
+                    for course_key, root in zip(snap["courses"], snap["roots"]):
+                        docs.extend(search.course_documents(course_key, snapshot_file.section_data(snap, root)))
+                index = snapshot["search"] = search.index_documents(docs)
+    return index
+
+
+def find_paths(snapshot, section_name):
+    if DATA_BACKEND == "sqlite":
+        return storage.find_section(db_connection(), section_name)
+    if DATA_BACKEND == "mmap":
+        return snapshot_file.find_section(snapshot["snap"], section_name)
+    return find_section(snapshot["index"], section_name)
+
+
+def node_at(snapshot, path):
+    if DATA_BACKEND == "sqlite":
+        return storage.section_data(db_connection(), path)
+    if DATA_BACKEND == "mmap":
+        return snapshot_file.section_data(snapshot["snap"], path)
+    return snapshot["index"]["paths"][path]
+
+
+# Lowercased, for case-insensitive lookups
+def course_keys(snapshot):
+    if DATA_BACKEND == "sqlite":
+        return storage.roots(db_connection())
+    if DATA_BACKEND == "mmap":
+        return snapshot["snap"]["roots"]
+    return snapshot["index"]["roots"]
+
+
+# As stored in the data, for listing
+def course_names(snapshot):
+    if DATA_BACKEND == "sqlite":
+        return storage.course_keys(db_connection())
+    if DATA_BACKEND == "mmap":
+        return snapshot["snap"]["courses"]
+    return list(snapshot["data"])
+
+
+# (matching paths, node at the first one) for any backend, optionally
+# limited to one course
+def lookup_section(snapshot, section_name, course=None):
+    paths = find_paths(snapshot, section_name)
+    if course is not None:
+        course = course.lower()
+        paths = [p for p in paths if p == course or p.startswith(course + "/")]
+    if not paths:
+        return paths, None
+    try:
+        return paths, node_at(snapshot, paths[0])
+    except KeyError:
+        # Indexed but not in the stored document (sqlite)
+        return [], None
+
+
+# Route template ("/courses/{course_key}") rather than the raw path, so
+# section names don't explode the label set. Latency and size are recorded
+# once the last body chunk has gone out, so streamed responses count in
+# full; HEAD responses send no body and count 0 bytes.
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    labels = {
+        "route": route.path if route is not None else "unmatched",
+        "method": request.method,
+        "status": response.status_code
+    }
+    body = response.body_iterator
+
+    async def observed_body():
+        size = 0
+        try:
+            async for chunk in body:
+                size += len(chunk)
+                yield chunk
+        finally:
+            metrics.observe(API_METRICS, "api_request_seconds", time.perf_counter() - started, **labels)
+            metrics.observe(API_METRICS, "api_response_bytes", 0 if request.method == "HEAD" else size,
+                            metrics.SIZE_BUCKETS, **labels)
+
+    response.body_iterator = observed_body()
+    return response
+
+
+def data_source_file():
+    if DATA_BACKEND == "sqlite":
+        return qa_store.DB_FILE
+    if DATA_BACKEND == "mmap":
+        return SNAPSHOT_FILE
+    return DATA_FILE
+
+
+@app.get("/metrics")
+def get_metrics():
+    now = time.time()
+    # The scraper swaps files in with os.replace(), so mtime is when the
+    # data was last published
+    try:
+        age = now - os.stat(data_source_file()).st_mtime
+    except FileNotFoundError:
+        age = -1
+    metrics.set_gauge(API_METRICS, "api_data_age_seconds", round(age, 3), backend=DATA_BACKEND)
+
+    snapshot = _snapshots.get("sqlite" if DATA_BACKEND == "sqlite" else data_source_file())
+    if snapshot is not None:
+        metrics.set_gauge(API_METRICS, "api_snapshot_age_seconds", round(now - snapshot["loaded_at"], 3),
+                          backend=DATA_BACKEND)
+        metrics.set_gauge(API_METRICS, "api_section_bodies_cached", len(snapshot["section_bodies"]))
+        metrics.set_gauge(API_METRICS, "api_query_bodies_cached", len(snapshot.get("query_bodies", {})))
+
+    return Response(
+        content=metrics.to_prometheus(API_METRICS),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.get("/")
 def root():
     return {
@@ -45,24 +610,161 @@ def root():
     }
 
 
-# 🔹 Full data
-@app.get("/Distance_btech_popular_course")
-def get_all_data():
-    return {
-        "data": load_data()
-    }
+# 🔹 Full data, streamed (HEAD and Range supported for download tools)
+@app.api_route("/Distance_btech_popular_course", methods=["GET", "HEAD"])
+def get_all_data(request: Request):
+    return stream_body(request, current_snapshot()["body"])
 
 
 # 🔹 Access ANY section by name
-@app.get("/Distance_btech_popular_course/{section_name}")
-def get_section_by_name(section_name: str):
-    data = load_data()
-    result = find_section(data, section_name)
+# Optional fields= projection, filter= conditions and limit / offset paging
+# over list sections (see section_query.py)
+@app.get("/Distance_btech_popular_course/{section_name:path}")
+def get_section_by_name(
+    section_name: str,
+    request: Request,
+    fields: Optional[str] = Query(None),
+    filter: Optional[List[str]] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    return section_response(request, section_name, None, fields, filter, limit, offset)
+
+
+# 🔹 Courses by key (one per entry in the scraper's courses.json)
+@app.get("/courses")
+def list_courses():
+    return {"courses": course_names(current_snapshot())}
+
+
+@app.get("/courses/{course_key}")
+def get_course(course_key: str, request: Request):
+    snapshot = current_snapshot()
+    cache_key = f"/courses/{course_key}"
+    body = snapshot["section_bodies"].get(cache_key)
+    metrics.inc(API_METRICS, "api_body_cache_total", cache="section", result="miss" if body is None else "hit")
+    if body is not None:
+        return send_body(request, body)
+
+    path = course_key.lower()
+    if path not in course_keys(snapshot):
+        metrics.inc(API_METRICS, "api_not_found_total", kind="course")
+        raise HTTPException(status_code=404, detail="Course not found")
+
+    try:
+        data = node_at(snapshot, path)
+    except KeyError:
+        metrics.inc(API_METRICS, "api_not_found_total", kind="course")
+        raise HTTPException(status_code=404, detail="Course not found")
+
+    body = encode_body({"course": course_key, "data": data})
+    if len(snapshot["section_bodies"]) < SECTION_BODY_CACHE_SIZE:
+        snapshot["section_bodies"][cache_key] = body
+    return send_body(request, body)
+
+
+@app.get("/courses/{course_key}/{section_name:path}")
+def get_course_section(
+    course_key: str,
+    section_name: str,
+    request: Request,
+    fields: Optional[str] = Query(None),
+    filter: Optional[List[str]] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0)
+):
+    return section_response(request, section_name, course_key, fields, filter, limit, offset)
+
+
+def section_response(request, section_name, course, fields, filter, limit, offset):
+    snapshot = current_snapshot()
+    queried = fields is not None or filter is not None or limit is not None or offset > 0
+    base_key = f"/courses/{course}/{section_name}" if course is not None else section_name
+
+    # Plain lookups and queried ones are cached apart so ad-hoc queries
+    # can't crowd out the section bodies
+    if queried:
+        cache = snapshot.setdefault("query_bodies", {})
+        cache_key = f"{base_key}?{request.url.query}"
+    else:
+        cache, cache_key = snapshot["section_bodies"], base_key
 
-    if result is None:
+    body = cache.get(cache_key)
+    metrics.inc(API_METRICS, "api_body_cache_total", cache="query" if queried else "section",
+                result="miss" if body is None else "hit")
+    if body is not None:
+        return send_body(request, body)
+
+    if course is not None and course.lower() not in course_keys(snapshot):
+        metrics.inc(API_METRICS, "api_not_found_total", kind="course")
+        raise HTTPException(status_code=404, detail="Course not found")
+
+    paths, data = lookup_section(snapshot, section_name, course)
+
+    if not paths:
+        metrics.inc(API_METRICS, "api_not_found_total", kind="section")
         raise HTTPException(status_code=404, detail="Section not found")
 
-    return {
+    page = None
+    if queried:
+        try:
+            data, page = section_query.apply_query(data, fields, filter, limit, offset)
+        except section_query.QueryError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    response = {
         "section": section_name,
-        "data": result
-    }
\ No newline at end of file
+        "data": data
+    }
+
+    # Ambiguous key → first match as before, plus every path so the
+    # client can ask for the exact node it wants
+    if len(paths) > 1:
+        response["matches"] = paths
+
+    if page is not None:
+        response.update(page)
+
+    body = encode_body(response)
+    if len(cache) < SECTION_BODY_CACHE_SIZE:
+        cache[cache_key] = body
+
+    return send_body(request, body)
+
+
+# 🔹 Q&A corpus, paged straight from the SQLite store
+@app.get("/Distance_btech_popular_course_qa")
+def get_qa_posts(
+    source: Optional[str] = Query(None, pattern="^(QA|QAD)$"),
+    after: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500)
+):
+    conn = db_connection("Q&A store not generated yet. Please wait.")
+    posts, next_after = qa_store.page_posts(conn, source, after, limit)
+    return {
+        "posts": posts,
+        "next_after": next_after
+    }
+
+
+# 🔹 Full-text search over FAQs, Q&A answers and section text
+@app.get("/search")
+def search_data(
+    q: str = Query(..., min_length=1, max_length=200),
+    kind: Optional[str] = Query(None, pattern="^(faq|qa|section)$"),
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0)
+):
+    started = time.perf_counter()
+    if DATA_BACKEND == "sqlite" and storage.has_search(db_connection()):
+        total, hits = storage.search_text(db_connection(), q, kind, limit, offset)
+    else:
+        total, hits = search.search(search_index(current_snapshot()), q, kind, limit, offset)
+    return {
+        "query": q,
+        "total": total,
+        "offset": offset,
+        "next_offset": offset + limit if offset + limit < total else None,
+        "took_ms": round((time.perf_counter() - started) * 1000, 3),
+        "results": hits
+    }
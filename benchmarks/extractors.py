@@ -0,0 +1,306 @@
+# Offline extractor benchmark + regression gate.
+#
+# Runs every extractor (scraper.PAGES) against
+#   fixtures   the HTML snapshots in benchmarks/fixtures/
+#   10x, 100x  synthetic pages (fixtures/synthetic.py) with ten / a hundred
+#              times the sections, tables, FAQs and Q&A posts
+# and reports, per page and per course-page section handler: parse time,
+# extract time (CPU time, median of --repeat after --warmup untimed runs)
+# and peak traced memory. Output hashes are recorded too, so a run also
+# tells you whether the result changed.
+#
+#   python benchmarks/extractors.py                    # compare with baseline
+#   python benchmarks/extractors.py --save-baseline    # record a new baseline
+#   python benchmarks/extractors.py --record           # refresh the fixtures
+#                                                      # from html_store captures
+#
+# Exits 1 when a time or peak memory is more than --threshold above the
+# baseline. Times are compared relative to a fixed calibration loop timed
+# next to them, so a host that is slower overall doesn't fail the gate, and
+# only count as a regression when even the fastest repeat is over the
+# baseline median. Pages that still look slower are re-measured --confirm
+# more times and only fail if every round agrees. Record the baseline on
+# the machine (and Python) where the check runs.
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, os.path.join(BENCH_DIR, "fixtures"))
+
+import html_store
+import scraper
+import synthetic
+
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+BASELINE_FILE = os.path.join(BENCH_DIR, "results", "extractors_baseline.json")
+SCALES = {"10x": 10, "100x": 100}
+
+
+def load_fixtures():
+    pages = {}
+    for kind in scraper.PAGES:
+        path = os.path.join(FIXTURES_DIR, f"{kind}.html")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                pages[kind] = f.read()
+    return pages
+
+
+# Copy the latest stored capture of each page of one course over the fixtures
+def record_fixtures(course_key=None):
+    courses = scraper.load_courses()
+    course_key = course_key or next(iter(courses))
+    for kind, url in courses[course_key].items():
+        capture = html_store.latest_capture(url)
+        if capture is None:
+            print(f"⏭️  {kind}: nothing stored for {url}")
+            continue
+        with open(os.path.join(FIXTURES_DIR, f"{kind}.html"), "w", encoding="utf-8") as f:
+            f.write(html_store.load_html(capture["sha256"]))
+        print(f"📥 {kind}: {url} captured {capture['fetched_at']}")
+
+
+# Fixed pure-Python dict / str / list work, the same kind the extractors do.
+# Every timing is also stored relative to it ("*_rel"), so a host that runs
+# slower today (CPU throttling, noisy neighbours) doesn't read as a regression.
+def calibration_workload():
+    for i in range(20000):
+        d = {"k": str(i), "v": [i, i + 1]}
+        " ".join(d["k"] * 3).split()
+
+
+# Timed samples (ms) of `repeat` runs after `warmup` untimed ones, plus the
+# last result. process_time counts this process's CPU only, and the GC is
+# off while a sample runs so a collection of earlier garbage doesn't land
+# in a random repeat.
+def samples_of(repeat, warmup, fn):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.process_time()
+            result = fn()
+            samples.append((time.process_time() - start) * 1000)
+        finally:
+            gc.enable()
+    return samples, result
+
+
+# {"ms", "min_ms", "rel", "min_rel"} (median and fastest repeat, absolute
+# and relative to a calibration run taken right after) plus the result
+def timed(repeat, warmup, fn):
+    samples, result = samples_of(repeat, warmup, fn)
+    unit = statistics.median(samples_of(repeat, 1, calibration_workload)[0])
+    return {
+        "ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "rel": round(statistics.median(samples) / unit, 4),
+        "min_rel": round(min(samples) / unit, 4),
+    }, result
+
+
+def timing_fields(prefix, timing):
+    return {f"{prefix}_{key}": value for key, value in timing.items()}
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def output_hash(result):
+    return hashlib.sha256(json.dumps(result, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+
+# Time and trace each course-page section handler on its own
+def handler_metrics(html, repeat, warmup):
+    soup = scraper.make_soup(html)
+    metrics = {}
+    for tag, container_id, handler in scraper.SECTION_HANDLERS:
+        container = soup.find(tag, id=container_id)
+        if container is None:
+            continue
+        extract, _ = timed(repeat, warmup, lambda: handler(container))
+        metrics[handler.__name__] = {
+            **timing_fields("extract", extract),
+            "peak_kb": round(peak_memory(lambda: handler(container)) / 1024, 1),
+        }
+    return metrics
+
+
+def measure(pages, repeat, warmup):
+    report = {}
+    for kind, html in pages.items():
+        extractor = scraper.PAGES[kind]
+        parse, _ = timed(repeat, warmup, lambda: scraper.make_soup(html))
+        extract, result = timed(repeat, warmup, lambda: extractor(html))
+        report[kind] = {
+            "size_kb": round(len(html) / 1024, 1),
+            **timing_fields("parse", parse),
+            **timing_fields("extract", extract),
+            "peak_kb": round(peak_memory(lambda: extractor(html)) / 1024, 1),
+            "output": output_hash(result),
+        }
+        if kind == "overviews":
+            report[kind]["sections"] = handler_metrics(html, repeat, warmup)
+    return report
+
+
+def print_report(scenario, report):
+    print(f"\n📦 {scenario}")
+    for kind, m in report.items():
+        print(f"  {kind:16} {m['size_kb']:>8.1f} KB  parse {m['parse_ms']:>9.2f} ms  "
+              f"extract {m['extract_ms']:>9.2f} ms  peak {m['peak_kb']:>9.1f} KB")
+        for name, s in m.get("sections", {}).items():
+            print(f"    {name:32} extract {s['extract_ms']:>9.2f} ms  peak {s['peak_kb']:>9.1f} KB")
+
+
+# Yields (label, key, baseline value, current value, current best, ms) for
+# every compared number. Timings compare as "*_rel" against the calibration
+# run ("*_ms" for baselines recorded before it existed); the best is the
+# fastest repeat and ms the larger of the two medians (None for memory).
+def compared_metrics(baseline, results):
+    def values(old, new, metric):
+        if not metric.endswith("_ms"):
+            return metric, old[metric], new[metric], new[metric], None
+        prefix = metric[:-len("_ms")]
+        ms = max(old[metric], new[metric])
+        if f"{prefix}_rel" in old:
+            return f"{prefix}_rel", old[f"{prefix}_rel"], new[f"{prefix}_rel"], new[f"{prefix}_min_rel"], ms
+        return metric, old[metric], new[metric], new[f"{prefix}_min_ms"], ms
+
+    for scenario, report in results.items():
+        for kind, m in report.items():
+            old = baseline.get(scenario, {}).get(kind)
+            if old is None:
+                continue
+            for metric in ("parse_ms", "extract_ms", "peak_kb"):
+                yield (f"{scenario}/{kind}",) + values(old, m, metric)
+            for name, s in m.get("sections", {}).items():
+                old_section = old.get("sections", {}).get(name)
+                if old_section is None:
+                    continue
+                for metric in ("extract_ms", "peak_kb"):
+                    yield (f"{scenario}/{kind}/{name}",) + values(old_section, s, metric)
+
+
+# {(label, key): message} of the numbers over the threshold, plus the
+# pages whose output hash changed
+def check_regressions(baseline, results, threshold, min_ms):
+    failures = {}
+    for label, metric, old, new, best, ms in compared_metrics(baseline["results"], results):
+        # Timings of a few milliseconds are mostly noise
+        if ms is not None and ms < min_ms:
+            continue
+        # Every repeat has to be slower, not just the median
+        if old and best > old * (1 + threshold):
+            failures[label, metric] = f"{label} {metric}: {old} → {new} (+{(new / old - 1) * 100:.0f}%)"
+
+    changed = [
+        f"{scenario}/{kind}"
+        for scenario, report in results.items()
+        for kind, m in report.items()
+        if baseline["results"].get(scenario, {}).get(kind, {}).get("output", m["output"]) != m["output"]
+    ]
+    return failures, changed
+
+
+# Re-measure the pages behind each failure `rounds` more times and keep only
+# the failures that show up again in every round. A real slowdown repeats,
+# a burst of load on a shared host usually doesn't.
+def confirm_regressions(failures, baseline, pages, args):
+    for round_no in range(1, args.confirm + 1):
+        if not failures:
+            break
+        flagged = sorted({tuple(label.split("/")[:2]) for label, _ in failures})
+        print(f"\n🔁 Confirming {len(failures)} regression(s), round {round_no}/{args.confirm}: "
+              + ", ".join("/".join(page) for page in flagged))
+        results = {}
+        for scenario, kind in flagged:
+            results.setdefault(scenario, {}).update(
+                measure({kind: pages[scenario][kind]}, args.repeat, args.warmup))
+        again, _ = check_regressions(baseline, results, args.threshold, args.min_ms)
+        failures = {key: message for key, message in again.items() if key in failures}
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extractor benchmark + regression gate")
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--warmup", type=int, default=2, help="untimed runs before each measurement")
+    parser.add_argument("--scenarios", default="fixtures,10x,100x",
+                        help="comma-separated subset of fixtures,10x,100x")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown / memory growth over the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-ms", type=float, default=5.0,
+                        help="ignore timings below this many ms in the regression check")
+    parser.add_argument("--confirm", type=int, default=2,
+                        help="re-measure regressed pages this many times, fail only if every round regresses")
+    parser.add_argument("--record", action="store_true",
+                        help="replace the fixtures with the latest html_store captures")
+    parser.add_argument("--course", help="course key to record fixtures from (default: first in courses.json)")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.course)
+        return
+
+    print(f"🔬 parser={scraper.PARSER}, median CPU time of {args.repeat} after {args.warmup} warmup run(s)")
+    results = {}
+    pages = {}
+    for scenario in args.scenarios.split(","):
+        pages[scenario] = load_fixtures() if scenario == "fixtures" else synthetic.build_pages(SCALES[scenario])
+        results[scenario] = measure(pages[scenario], args.repeat, args.warmup)
+        print_report(scenario, results[scenario])
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        scraper.write_json_atomic(args.baseline, {
+            "parser": scraper.PARSER,
+            "python": sys.version.split()[0],
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": results,
+        })
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️ No baseline at {args.baseline}, run with --save-baseline first")
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    failures, changed = check_regressions(baseline, results, args.threshold, args.min_ms)
+    for label in changed:
+        print(f"\n🔀 {label}: output differs from the baseline")
+    failures = confirm_regressions(failures, baseline, pages, args)
+    if failures:
+        print(f"\n❌ {len(failures)} regression(s) over {args.threshold * 100:.0f}%:")
+        for failure in failures.values():
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"\n✅ No regression over {args.threshold * 100:.0f}% against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
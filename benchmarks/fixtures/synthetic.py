@@ -0,0 +1,210 @@
+# Synthetic stand-ins for the four scraped pages.
+#
+# Same DOM hooks the extractors look for (section ids, class names, post
+# attributes), with every repeated block - sections, tables, FAQs, Q&A
+# posts - multiplied by `scale`. benchmarks/extractors.py uses scale 10 and
+# 100 to see how the extractors grow with page size.
+#
+#   python benchmarks/fixtures/synthetic.py <dir> [--scale 1]
+
+import argparse
+import os
+
+SYLLABUS_COURSES = ["BTech CSE Syllabus", "BTech Electrical Engineering Syllabus", "BTech Mechanical Engineering Syllabus"]
+SALARY_INDUSTRIES = ["IT & Software", "Automotive", "Aerospace", "Mechanical", "Civil"]
+IIT_CAMPUSES = ["Delhi", "Madras", "Bombay"]
+
+
+def build_table(headers, rows, cols):
+    header = "".join(f"<th>{title}</th>" for title in headers)
+    body = "".join(
+        "<tr>" + "".join(f"<td>r{r}c{c} <a href='/x'>l</a></td>" for c in range(cols)) + "</tr>"
+        for r in range(rows)
+    )
+    return f"<table><tr>{header}</tr>{body}</table>"
+
+
+# One question / answer pair in the markup the course page FAQ blocks use
+def build_faq(i, with_table=False):
+    answer_table = "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>" if with_table else ""
+    return (
+        f"<div class='html-0 c5db62 listener'><span>Q:</span><span>Question {i} about AICTE?</span></div>"
+        f"<div class='_16f53f'><div class='cmsAContent'><p>Answer {i} lateral entry text.</p>{answer_table}</div></div>"
+    )
+
+
+def build_faqs(count, tables=False):
+    return "<div id='sectional-faqs-0'>" + "".join(build_faq(i, tables and i % 2 == 0) for i in range(count)) + "</div>"
+
+
+# ---------------- COURSE PAGE ----------------
+def course_header():
+    return (
+        "<html><body><div class='a54c'><h1>Distance BTech</h1></div>"
+        "<div>Updated on <span>Jan 1, 2026</span></div>"
+        "<div class='be8c'><a href='/author'>Author Name</a><img src='/i.png'>"
+        "<span class='b0fc'>Editor</span><i class='tickIcon'></i></div>"
+    )
+
+
+def overview_section(scale):
+    return (
+        "<div id='wikkiContents_chp_section_overview_0'><p>" + "Overview text that is long enough. " * 3 + "</p>"
+        "<p>Second paragraph is also long enough to count.</p><a href='/jee'>JEE</a>"
+        + build_table(["Particular", "Details"], 5 * scale, 2)
+        + "</div>"
+    )
+
+
+def eligibility_section(scale):
+    return (
+        "<section id='chp_section_eligibility'><h2>Eligibility</h2><p>Eligibility text</p>"
+        + build_table(["Course", "Criteria", "Extra"], 3 * scale, 3)
+        + "<div>" + "".join(build_faq(i) for i in range(3 * scale)) + "</div></section>"
+    )
+
+
+def exams_section(scale):
+    seats = "".join(
+        f"<h4>IIT {campus} BTech Seats</h4>" + build_table(["Branch", "Seats"], 3 * scale, 2)
+        for campus in IIT_CAMPUSES
+    )
+    return (
+        "<div id='wikkiContents_chp_section_popularexams_0'>"
+        + build_table(["Exam", "Dates", "Schedule"], 4 * scale, 3)
+        + "<h3>JEE Main 2025 Cutoff</h3>" + build_table(["Category", "Cutoff"], 4 * scale, 2)
+        + seats + "</div>"
+    )
+
+
+def specializations_section(scale):
+    boxes = "".join(f"<li><a href='/s{i}'>Spec {i}</a><p>{i * 10} colleges</p></li>" for i in range(5 * scale))
+    return (
+        "<section id='chp_section_popularspecialization'><h2 class='tbSec2'>Popular Specializations</h2>"
+        "<div class='photo-widget-full'>Intro to specs</div>"
+        + build_table(["Specialization", "Jobs"], 6 * scale, 2)
+        + "<p>Note - this is a note</p><div class='specialization-box'><ul>" + boxes + "</ul></div>"
+        + build_faqs(2 * scale) + "</section>"
+    )
+
+
+def syllabus_section(scale):
+    semesters = "".join(
+        f"<h3>{course}</h3><p>Desc of {course}</p>" + build_table(["Semester I", "Semester II"], 5, 2)
+        + "<p>Note - syllabus may vary</p>"
+        for course in SYLLABUS_COURSES * scale
+    )
+    return (
+        "<section id='chp_section_coursesyllabus'><h2 class='tbSec2'>Syllabus</h2>"
+        "<p style='text-align: justify;'>Syllabus intro</p>"
+        + semesters
+        + "<h2>B Tech Specialization-Wise Syllabus</h2>" + build_table(["A", "B"], 4 * scale, 2)
+        + "<div><p>Useful Link for B Tech Courses List</p><p>Link one</p><p>Link two</p><p>Link three</p></div>"
+        + build_faqs(2 * scale) + "</section>"
+    )
+
+
+def salary_section(scale):
+    industries = "".join(
+        f"<h4>{industry} BTech Jobs</h4><p>{industry} desc</p>" + build_table(["Job", "Description", "Salary"], 4, 3)
+        + "<p>Note - salaries vary</p>"
+        for industry in SALARY_INDUSTRIES * scale
+    )
+    return (
+        "<section id='chp_section_salary'><h2 class='tbSec2'>Salary</h2>"
+        "<p>BTech is one of the most popular courses in India</p>"
+        "<div><h3>B Tech Salary and Jobs in India</h3><p>Salary desc 1</p><p>Salary desc 2</p>"
+        "<h4>IT & Software B Tech Jobs</h4></div>"
+        + industries
+        + "<h3>BTech Courses Top Recruiters</h3><p>Recruiters desc</p>" + build_table(["A", "B", "C"], 5 * scale, 3)
+        + "<h3>BTech Placements in India</h3><p>Placements desc</p>" + build_table(["College", "Package"], 5 * scale, 2)
+        + "<div><p>Useful Links for B Tech Scope</p><p>Scope 1</p><p>Scope 2</p></div>"
+        + "<div><span>Helpful Links for Jobs for BTech Freshers</span><p>Help 1</p><p>Help 2</p></div>"
+        + "<iframe src='https://www.youtube.com/embed/x' title='Video' width='560' height='315'></iframe>"
+        + build_faqs(2 * scale, tables=True) + "</section>"
+    )
+
+
+def course_page(scale=1):
+    return "".join([
+        course_header(),
+        overview_section(scale),
+        eligibility_section(scale),
+        exams_section(scale),
+        specializations_section(scale),
+        syllabus_section(scale),
+        salary_section(scale),
+        "</body></html>",
+    ])
+
+
+# ---------------- CATEGORY PAGE ----------------
+def popular_college_page(scale=1):
+    toc = "".join(f"<li><a href='#s{i}'>Section {i}</a></li>" for i in range(5 * scale))
+    sections = "".join(
+        f"<h2>Section {i}</h2><p>Text {i}</p><ul><li>a</li><li>b</li></ul>" + build_table(["College", "Fees", "Rank"], 5, 3)
+        for i in range(5 * scale)
+    )
+    return (
+        "<html><body><div id='EdContent_categoryPage'><span class='_2b4b'>12k views</span>"
+        "<h2>Top Colleges</h2><p>Intro para</p><ol class='newTocList'>" + toc + "</ol>"
+        + sections
+        + "<div class='_78c3'><a class='_9b27' href='/au'>Auth</a><img src='/a.png'>"
+        "<p class='_9ad6'>Updated Jan</p></div></div></body></html>"
+    )
+
+
+# ---------------- Q&A PAGES ----------------
+# Two answers per question. post_type "D" alternates discussion and
+# question posts the way the discussion tag page mixes them.
+def qa_post(i, post_type):
+    return (
+        f"<div class='post-col' questionid='{1000 + i // 2}' answerid='{5000 + i}' type='{post_type}'>"
+        f"<div class='col-head'><span>{i} days ago</span></div>"
+        f"<div class='ana-qstn-block'><div class='qstn-row'><a href='/t/{i}'>Tag{i}</a></div></div>"
+        f"<div class='dtl-qstn'><a href='/q/{i}'><div class='wikkiContents'>Question {i // 2} text about AICTE?</div></a></div>"
+        f"<span class='followersCountTextArea' valuecount='{i}'>{i}</span>"
+        f"<div class='right-cl'><span class='viewers-span'>{i}k views</span></div>"
+        f"<div class='avatar-col'><a class='avatar-name' href='/u/{i}'>User {i}</a>"
+        f"<div class='rp-txt'><div class='wikkiContents'><p>Answer {i} lateral entry</p></div></div></div>"
+        f"<a class='up-thumb like-a'>{i}</a><a class='up-thumb like-d'>0</a></div>"
+    )
+
+
+def qa_page(scale=1, page_type="Q"):
+    stats = "".join(f"<div class='ana-cell'><b valuecount='{i * 100}'>{i}</b></div>" for i in range(4))
+    posts = "".join(
+        qa_post(i, page_type if page_type == "Q" else ("Q" if i % 2 else "D"))
+        for i in range(10 * scale)
+    )
+    return (
+        "<html><body><div class='tag-head'><h1 class='tag-p'>B.Tech</h1><p class='tag-bind'>Tag desc</p></div>"
+        "<div class='ana-table'>" + stats + "</div>"
+        + posts + "</body></html>"
+    )
+
+
+# Page kind (scraper.PAGES key) -> HTML
+def build_pages(scale=1):
+    return {
+        "overviews": course_page(scale),
+        "popular_college": popular_college_page(scale),
+        "QA": qa_page(scale),
+        "QAD": qa_page(scale, page_type="D"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic pages")
+    parser.add_argument("output_dir")
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for kind, html in build_pages(args.scale).items():
+        with open(os.path.join(args.output_dir, f"{kind}.html"), "w", encoding="utf-8") as f:
+            f.write(html)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+# API load test + latency regression gate.
+#
+# Starts api:app under uvicorn with N workers, drives it with a mix of
+#   /                                         health check
+#   /Distance_btech_popular_course            full document
+#   /Distance_btech_popular_course/<section>  sections, names and paths taken
+#                                             from the served data, plus misses
+# from --concurrency client threads, then reports p50 / p95 / p99 latency,
+# throughput and the RSS of every uvicorn worker (from /proc).
+#
+#   python benchmarks/loadtest.py --workers 2 --concurrency 32 --duration 20
+#   python benchmarks/loadtest.py --synthetic 10 --backend mmap
+#   python benchmarks/loadtest.py --save-baseline
+#
+# --data-dir serves an existing popular_mba_data.json (default: repo root);
+# --synthetic N builds one from the benchmark fixtures scaled N times (with
+# the .snap and .db next to it, for every DATA_BACKEND). Each run is saved
+# under benchmarks/results/ and compared with the baseline: exit 1 when
+# p95 / p99 grow or throughput drops by more than --threshold.
+
+import argparse
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import urllib3
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, "fixtures"))
+
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE_FILE = os.path.join(RESULTS_DIR, "loadtest_baseline.json")
+DATA_FILE = "popular_mba_data.json"
+SECTION_ROUTE = "/Distance_btech_popular_course"
+
+# Share of requests per kind of URL
+MIX = {
+    "root": 0.05,
+    "full": 0.10,
+    "section": 0.55,  # top-level sections and course-relative paths
+    "name": 0.25,     # bare key names, resolved through the name index
+    "miss": 0.05,     # 404s
+}
+
+
+# ---------------- DATA ----------------
+def build_synthetic_data(data_dir, scale):
+    import scraper
+    import snapshot_file
+    import storage
+    import synthetic
+
+    pages = synthetic.build_pages(scale)
+    course = scraper.assemble_course({kind: scraper.PAGES[kind](html) for kind, html in pages.items()})
+    data = {"Distance_BTech": course}
+
+    scraper.write_json_atomic(os.path.join(data_dir, DATA_FILE), data)
+    snapshot_file.write_snapshot(data, os.path.join(data_dir, "popular_mba_data.snap"))
+    storage.save_dataset(data, os.path.join(data_dir, "popular_mba_data.db"))
+    return data
+
+
+# Weighted URL list drawn from the data actually being served
+def build_url_mix(data, total=2000, seed=7):
+    import api
+
+    index = api.build_section_index(data)
+    rng = random.Random(seed)
+    roots = index["roots"]
+
+    sections = [
+        path.split("/", 1)[1] for path in index["paths"]
+        if "/" in path and path.split("/", 1)[0] in roots and 1 <= path.count("/") <= 3
+    ]
+    # A name with "/" in it is read as a path by the API, never a name
+    names = [name for name in index["names"] if not name.isdigit() and "/" not in name]
+
+    urls = []
+    for kind, share in MIX.items():
+        for _ in range(int(total * share)):
+            if kind == "root":
+                urls.append((kind, "/"))
+            elif kind == "full":
+                urls.append((kind, SECTION_ROUTE))
+            elif kind == "section" and sections:
+                urls.append((kind, f"{SECTION_ROUTE}/{rng.choice(sections)}"))
+            elif kind == "name" and names:
+                urls.append((kind, f"{SECTION_ROUTE}/{rng.choice(names)}"))
+            elif kind == "miss":
+                urls.append((kind, f"{SECTION_ROUTE}/no_such_section_{rng.randrange(1000)}"))
+    rng.shuffle(urls)
+    return urls
+
+
+# ---------------- SERVER ----------------
+# The listening socket is bound here and handed over with --fd. With
+# --workers > 1 uvicorn binds it with proto 0, so asyncio never sets
+# TCP_NODELAY on the accepted connections, and every keep-alive response
+# (headers and body go out as two writes) stalls ~40 ms on the client's
+# delayed ACK. Linux copies TCP_NODELAY from the listener to each accepted
+# socket, so setting it once here fixes every worker.
+def listen_socket(port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.bind(("127.0.0.1", port))
+    return sock
+
+
+def start_server(data_dir, port, workers, backend):
+    env = dict(os.environ, DATA_BACKEND=backend, PYTHONPATH=REPO_DIR)
+    env["DATA_DB"] = os.path.join(data_dir, "popular_mba_data.db")
+    sock = listen_socket(port)
+    try:
+        return subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "api:app", "--fd", str(sock.fileno()),
+             "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+            cwd=data_dir, env=env, pass_fds=[sock.fileno()], start_new_session=True
+        )
+    finally:
+        # The server holds its own copy
+        sock.close()
+
+
+def wait_until_up(http, base_url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if http.request("GET", base_url + "/", retries=False, timeout=1).status == 200:
+                return
+        except urllib3.exceptions.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not come up in {timeout}s")
+
+
+def stop_server(server):
+    os.killpg(server.pid, signal.SIGTERM)
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        os.killpg(server.pid, signal.SIGKILL)
+
+
+def child_pids(pid):
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # ppid is the 2nd field after the ")" closing the command name
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return children
+
+
+def memory_kb(pid):
+    usage = {}
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith(("VmRSS:", "VmHWM:")):
+                    usage[line.split(":")[0]] = int(line.split()[1])
+    except OSError:
+        pass
+    return {"rss_kb": usage.get("VmRSS"), "peak_rss_kb": usage.get("VmHWM")}
+
+
+def cmdline(pid):
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read().replace(b"\0", b" ").decode("utf-8", "replace")
+    except OSError:
+        return ""
+
+
+# uvicorn --workers N: the supervisor's children are the workers (plus
+# multiprocessing's resource tracker, which is skipped)
+def worker_memory(server, workers):
+    pids = [pid for pid in child_pids(server.pid) if "resource_tracker" not in cmdline(pid)]
+    if workers == 1 and not pids:
+        pids = [server.pid]
+    return {str(pid): memory_kb(pid) for pid in pids}
+
+
+# ---------------- LOAD ----------------
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    low = int(k)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (k - low)
+
+
+def summarize(latencies):
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        "max_ms": round(max(latencies) * 1000, 3) if latencies else None,
+    }
+
+
+def run_load(base_url, urls, concurrency, duration, gzip_share=0.5):
+    http = urllib3.PoolManager(maxsize=concurrency, retries=False, timeout=urllib3.Timeout(connect=5, read=30))
+    stop_at = time.monotonic() + duration
+    samples = []  # (kind, seconds, status)
+    lock = threading.Lock()
+
+    def client(worker_id):
+        rng = random.Random(worker_id)
+        local = []
+        i = worker_id
+        while time.monotonic() < stop_at:
+            kind, path = urls[i % len(urls)]
+            i += concurrency
+            headers = {"Accept-Encoding": "gzip"} if rng.random() < gzip_share else {"Accept-Encoding": "identity"}
+            start = time.perf_counter()
+            try:
+                status = http.request("GET", base_url + path, headers=headers, preload_content=True).status
+            except urllib3.exceptions.HTTPError:
+                status = None
+            local.append((kind, time.perf_counter() - start, status))
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    expected = {"miss": 404}
+    errors = sum(1 for kind, _, status in samples if status != expected.get(kind, 200))
+    report = {
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 1),
+        "errors": errors,
+        "overall": summarize([seconds for _, seconds, _ in samples]),
+        "by_kind": {
+            kind: summarize([seconds for k, seconds, _ in samples if k == kind])
+            for kind in MIX
+        },
+    }
+    return report
+
+
+# ---------------- BASELINE ----------------
+def write_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def check_regressions(baseline, result, threshold):
+    failures = []
+    old, new = baseline["load"], result["load"]
+    for metric in ("p95_ms", "p99_ms"):
+        if old["overall"][metric] and new["overall"][metric] > old["overall"][metric] * (1 + threshold):
+            failures.append(f"{metric}: {old['overall'][metric]} → {new['overall'][metric]}")
+    if new["throughput_rps"] < old["throughput_rps"] * (1 - threshold):
+        failures.append(f"throughput: {old['throughput_rps']} → {new['throughput_rps']} req/s")
+    if new["errors"] > old["errors"]:
+        failures.append(f"errors: {old['errors']} → {new['errors']}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API load test + latency regression gate")
+    parser.add_argument("--workers", type=int, default=2, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=16, help="client threads")
+    parser.add_argument("--duration", type=float, default=15, help="seconds of load")
+    parser.add_argument("--warmup", type=float, default=2, help="seconds of load before measuring")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--backend", default="json", choices=["json", "sqlite", "mmap"])
+    parser.add_argument("--data-dir", default=REPO_DIR)
+    parser.add_argument("--synthetic", type=int, metavar="SCALE",
+                        help="serve synthetic data built from the fixtures at this scale")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    tmp = None
+    if args.synthetic:
+        tmp = tempfile.TemporaryDirectory(prefix="loadtest-")
+        args.data_dir = tmp.name
+        data = build_synthetic_data(tmp.name, args.synthetic)
+    else:
+        with open(os.path.join(args.data_dir, DATA_FILE), "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    urls = build_url_mix(data)
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"🚀 {args.workers} worker(s), backend={args.backend}, {args.concurrency} clients, "
+          f"{args.duration:.0f}s, {len(urls)} URLs in the mix")
+
+    server = start_server(args.data_dir, args.port, args.workers, args.backend)
+    try:
+        wait_until_up(urllib3.PoolManager(), base_url)
+        if args.warmup:
+            run_load(base_url, urls, args.concurrency, args.warmup)
+        load = run_load(base_url, urls, args.concurrency, args.duration)
+        memory = worker_memory(server, args.workers)
+    finally:
+        stop_server(server)
+        if tmp is not None:
+            tmp.cleanup()
+
+    result = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "settings": {
+            "workers": args.workers, "concurrency": args.concurrency, "duration": args.duration,
+            "backend": args.backend, "synthetic": args.synthetic, "data_kb": round(len(json.dumps(data)) / 1024, 1),
+            "tcp_nodelay": True,
+        },
+        "load": load,
+        "workers": memory,
+    }
+
+    overall = load["overall"]
+    print(f"\n📈 {overall['requests']} requests, {load['throughput_rps']} req/s, {load['errors']} error(s)")
+    print(f"   p50 {overall['p50_ms']} ms   p95 {overall['p95_ms']} ms   p99 {overall['p99_ms']} ms")
+    for kind, s in load["by_kind"].items():
+        if s["requests"]:
+            print(f"   {kind:8} {s['requests']:>7}  p50 {s['p50_ms']:>8} ms  p95 {s['p95_ms']:>8} ms  p99 {s['p99_ms']:>8} ms")
+    for pid, m in memory.items():
+        print(f"🧠 worker {pid}: RSS {m['rss_kb']} KB (peak {m['peak_rss_kb']} KB)")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"loadtest_{time.strftime('%Y%m%dT%H%M%S')}.json")
+    write_json(path, result)
+    print(f"💾 Results saved to {path}")
+
+    if args.save_baseline:
+        write_json(args.baseline, result)
+        print(f"💾 Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️ No baseline at {args.baseline}, run with --save-baseline first")
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["settings"] != result["settings"]:
+        print(f"⚠️ Baseline was recorded with different settings, not comparing: {baseline['settings']}")
+        return
+
+    failures = check_regressions(baseline, result, args.threshold)
+    if failures:
+        print(f"\n❌ {len(failures)} regression(s) over {args.threshold * 100:.0f}%:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"\n✅ No regression over {args.threshold * 100:.0f}% against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Parser backend parity check + parse benchmark.
+#
+# Runs every extractor against saved HTML pages with each installed
+# BeautifulSoup backend, checks the JSON output is identical to the
+# html.parser baseline, and reports parse / extract time per page.
+#
+#   python benchmarks/parsers.py <html_dir> [--repeat 5]
+#
+# <html_dir> holds one file per page, named after the scraper.PAGES keys:
+# overviews.html, popular_college.html, QA.html, QAD.html
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser backend parity check + parse benchmark")
+    parser.add_argument("html_dir")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    backends = [b for b in scraper.PARSER_BACKENDS if scraper.parser_available(b)]
+    mismatches = 0
+
+    for name, extractor in scraper.PAGES.items():
+        path = os.path.join(args.html_dir, f"{name}.html")
+        if not os.path.exists(path):
+            print(f"⏭️  {name}: no {path}")
+            continue
+
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        print(f"\n📄 {name} ({len(html) / 1024:.0f} KB)")
+        baseline = None
+
+        for backend in ["html.parser"] + [b for b in backends if b != "html.parser"]:
+            scraper.PARSER = backend
+            parse_time, _ = best_of(args.repeat, lambda: scraper.make_soup(html))
+            total_time, result = best_of(args.repeat, lambda: extractor(html))
+            output = json.dumps(result, sort_keys=True, ensure_ascii=False)
+
+            if baseline is None:
+                baseline = output
+                status = "baseline"
+            elif output == baseline:
+                status = "identical"
+            else:
+                status = "❌ DIFFERS"
+                mismatches += 1
+
+            print(
+                f"  {backend:<12} parse {parse_time * 1000:8.1f} ms   "
+                f"parse+extract {total_time * 1000:8.1f} ms   {status}"
+            )
+
+    if mismatches:
+        print(f"\n❌ {mismatches} backend output(s) differ from html.parser")
+        sys.exit(1)
+    print("\n✅ All backends produce identical output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# /search parity check across DATA_BACKENDs.
+#
+# Writes one dataset as popular_mba_data.json, .snap and .db into a temp
+# directory, then asks api.search_data the same queries on the json, mmap
+# and sqlite backends: totals, the top --top hits (kind, ref, ids) and
+# their scores have to agree, for every query with and without a kind=
+# filter. Exits 1 on any difference.
+#
+#   python benchmarks/search_parity.py                       # repo data
+#   python benchmarks/search_parity.py --data some.json
+#   python benchmarks/search_parity.py --synthetic 10
+#   python benchmarks/search_parity.py --query "lateral entry" --query jee
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, "fixtures"))
+
+import api
+import qa_store
+import scraper
+import snapshot_file
+import storage
+
+BACKENDS = ("json", "mmap", "sqlite")
+KINDS = (None, "faq", "qa", "section")
+QUERIES = (
+    "engineering",
+    "distance education",
+    "jee",
+    "aicte lateral",
+    "lateral entry",
+    "salary",
+    "syllabus semester",
+    '"b tech" course',
+)
+SCORE_TOLERANCE = 1e-3
+
+
+def load_data(args):
+    if args.synthetic:
+        import synthetic
+
+        pages = synthetic.build_pages(args.synthetic)
+        course = scraper.assemble_course({kind: scraper.PAGES[kind](html) for kind, html in pages.items()})
+        return {"Distance_BTech": course}
+    with open(args.data, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_stores(data, data_dir):
+    scraper.write_json_atomic(os.path.join(data_dir, api.DATA_FILE), data)
+    snapshot_file.write_snapshot(data, os.path.join(data_dir, api.SNAPSHOT_FILE))
+    storage.save_dataset(data, os.path.join(data_dir, os.path.basename(qa_store.DB_FILE)))
+
+
+def ask(backend, query, kind, top):
+    api.DATA_BACKEND = backend
+    api._snapshots.clear()
+    return api.search_data(q=query, kind=kind, limit=top, offset=0)
+
+
+def hit_key(hit):
+    return hit["kind"], hit["ref"], hit.get("questionid"), hit.get("answerid")
+
+
+# Differences between the json answer and every other backend's
+def compare(query, kind, answers):
+    label = f"{query!r}" + (f" kind={kind}" if kind else "")
+    expected = answers["json"]
+    problems = []
+    for backend in BACKENDS[1:]:
+        answer = answers[backend]
+        if answer["total"] != expected["total"]:
+            problems.append(f"{label}: total json={expected['total']} {backend}={answer['total']}")
+        expected_keys = [hit_key(hit) for hit in expected["results"]]
+        keys = [hit_key(hit) for hit in answer["results"]]
+        if keys != expected_keys:
+            problems.append(f"{label}: top hits differ on {backend}\n    json   {expected_keys}\n    "
+                            f"{backend:6} {keys}")
+            continue
+        for hit, expected_hit in zip(answer["results"], expected["results"]):
+            if abs(hit["score"] - expected_hit["score"]) > SCORE_TOLERANCE * max(1.0, abs(expected_hit["score"])):
+                problems.append(f"{label}: score of {hit_key(hit)} json={expected_hit['score']} "
+                                f"{backend}={hit['score']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/search parity check across data backends")
+    parser.add_argument("--data", default=os.path.join(REPO_DIR, api.DATA_FILE))
+    parser.add_argument("--synthetic", type=int, help="use the benchmark fixtures scaled N times instead")
+    parser.add_argument("--query", action="append", help="query to check (repeatable, default: a built-in set)")
+    parser.add_argument("--top", type=int, default=10, help="hits compared per query")
+    args = parser.parse_args()
+
+    data = load_data(args)
+    queries = args.query or QUERIES
+    problems = []
+
+    with tempfile.TemporaryDirectory(prefix="search-parity-") as data_dir:
+        cwd = os.getcwd()
+        qa_store.DB_FILE = os.path.join(data_dir, os.path.basename(qa_store.DB_FILE))
+        write_stores(data, data_dir)
+        os.chdir(data_dir)
+        try:
+            if not storage.has_search(api.db_connection()):
+                print("⚠️ SQLite built without FTS5, the sqlite backend uses the in-memory index")
+            for query in queries:
+                for kind in KINDS:
+                    answers = {backend: ask(backend, query, kind, args.top) for backend in BACKENDS}
+                    found = compare(query, kind, answers)
+                    problems.extend(found)
+                    print(f"{'❌' if found else '✅'} {query!r:24} {kind or 'any':8} "
+                          f"total {answers['json']['total']}")
+        finally:
+            api._db_local.conn.close()
+            os.chdir(cwd)
+
+    if problems:
+        print(f"\n❌ {len(problems)} difference(s) between backends:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print(f"\n✅ json, mmap and sqlite agree on {len(queries)} queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Table engine benchmark.
+#
+# Times scraper.table_rows / table_records (row and columnar output) against
+# the per-cell get_text loop the extractors used before, on a synthetic
+# table of the given size.
+#
+#   python benchmarks/tables.py [--rows 2000] [--cols 6] [--repeat 5]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+
+
+def build_table(rows, cols):
+    header = "".join(f"<th>Column {c}</th>" for c in range(cols))
+    body = "".join(
+        "<tr>" + "".join(f"<td>row {r} <a href='/x'>cell {c}</a></td>" for c in range(cols)) + "</tr>"
+        for r in range(rows)
+    )
+    return scraper.make_soup(f"<table><tr>{header}</tr>{body}</table>").table
+
+
+# The loop that used to be copy-pasted across the extractors
+def legacy_records(table):
+    headers = [th.get_text(" ", strip=True) for th in table.find_all("th")]
+    rows_data = []
+    for row in table.find_all("tr")[1:]:
+        cols = row.find_all(["td", "th"])
+        row_dict = {}
+        for idx, col in enumerate(cols):
+            key = headers[idx] if idx < len(headers) else f"col_{idx}"
+            row_dict[key] = col.get_text(" ", strip=True)
+        rows_data.append(row_dict)
+    return headers, rows_data
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Table engine benchmark")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--cols", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    table = build_table(args.rows, args.cols)
+    print(f"📊 {args.rows} x {args.cols} table, parser={scraper.PARSER}")
+
+    legacy_time, legacy = best_of(args.repeat, lambda: legacy_records(table))
+    records_time, records = best_of(args.repeat, lambda: scraper.table_records(table))
+    columnar_time, _ = best_of(args.repeat, lambda: scraper.table_records(table, columnar=True))
+    rows_time, _ = best_of(args.repeat, lambda: scraper.table_rows(table))
+
+    for label, elapsed in [
+        ("legacy per-cell loop", legacy_time),
+        ("table_records", records_time),
+        ("table_records columnar", columnar_time),
+        ("table_rows", rows_time),
+    ]:
+        print(f"  {label:<24} {elapsed * 1000:8.1f} ms  ({legacy_time / elapsed:4.2f}x)")
+
+    if legacy != records:
+        print("❌ table_records output differs from the legacy loop")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+# Content-addressed store of every fetched page.
+#
+#   html_store/objects/ab/abcdef....html.gz   gzip'd HTML, named by sha256
+#   html_store/index.jsonl                    one line per capture:
+#                                             {"url", "fetched_at", "sha256", "size"}
+#
+# Identical HTML is stored once no matter how often it's fetched. The
+# directory is gitignored; the scheduled workflow keeps it in the Actions
+# cache between runs (download it from there to replay production pages).
+HTML_STORE_DIR = os.environ.get("HTML_STORE_DIR", "html_store")
+
+_index_lock = threading.Lock()
+
+
+def object_path(sha256, store_dir=None):
+    store_dir = store_dir or HTML_STORE_DIR
+    return os.path.join(store_dir, "objects", sha256[:2], f"{sha256}.html.gz")
+
+
+def save_page(url, html, fetched_at=None, store_dir=None):
+    store_dir = store_dir or HTML_STORE_DIR
+    raw = html.encode("utf-8")
+    sha256 = hashlib.sha256(raw).hexdigest()
+    fetched_at = fetched_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    path = object_path(sha256, store_dir)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(gzip.compress(raw, mtime=0))
+        os.replace(tmp, path)
+
+    record = {"url": url, "fetched_at": fetched_at, "sha256": sha256, "size": len(raw)}
+    with _index_lock:
+        with open(os.path.join(store_dir, "index.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    return record
+
+
+def load_html(sha256, store_dir=None):
+    with open(object_path(sha256, store_dir), "rb") as f:
+        return gzip.decompress(f.read()).decode("utf-8")
+
+
+def iter_captures(url=None, store_dir=None):
+    path = os.path.join(store_dir or HTML_STORE_DIR, "index.jsonl")
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if url is None or record["url"] == url:
+                yield record
+
+
+# Latest capture of `url` fetched at or before `at` (ISO timestamp), or None
+def latest_capture(url, at=None, store_dir=None):
+    latest = None
+    for record in iter_captures(url, store_dir):
+        if at is not None and record["fetched_at"] > at:
+            continue
+        if latest is None or record["fetched_at"] >= latest["fetched_at"]:
+            latest = record
+    return latest
@@ -0,0 +1,180 @@
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+# Small in-process metrics registry shared by the scraper and the API.
+#
+#   counters     monotonically increasing totals
+#   gauges       last value set
+#   histograms   count / sum / max plus cumulative buckets (seconds, bytes…)
+#
+# Every series is keyed by (name, sorted label pairs). A registry exports
+# as plain JSON (run reports) or in the Prometheus text format (node
+# exporter textfile collector, /metrics).
+
+TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+LABEL_ESCAPE_RE = re.compile(r'([\\"])')
+
+
+def make_registry():
+    return {
+        "lock": threading.Lock(),
+        "counters": {},
+        "gauges": {},
+        "histograms": {},
+        "help": {},
+    }
+
+
+def series_key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def describe(registry, name, text):
+    registry["help"][name] = text
+
+
+def inc(registry, name, value=1, **labels):
+    key = series_key(name, labels)
+    with registry["lock"]:
+        registry["counters"][key] = registry["counters"].get(key, 0) + value
+
+
+def set_gauge(registry, name, value, **labels):
+    with registry["lock"]:
+        registry["gauges"][series_key(name, labels)] = value
+
+
+def observe(registry, name, value, buckets=TIME_BUCKETS, **labels):
+    key = series_key(name, labels)
+    with registry["lock"]:
+        histogram = registry["histograms"].get(key)
+        if histogram is None:
+            histogram = registry["histograms"][key] = {
+                "buckets": tuple(buckets),
+                "counts": [0] * len(buckets),
+                "count": 0,
+                "sum": 0.0,
+                "max": 0.0,
+            }
+        for i, bound in enumerate(histogram["buckets"]):
+            if value <= bound:
+                histogram["counts"][i] += 1
+        histogram["count"] += 1
+        histogram["sum"] += value
+        histogram["max"] = max(histogram["max"], value)
+
+
+# with timer(REGISTRY, "scrape_phase_seconds", phase="parse"): ...
+@contextmanager
+def timer(registry, name, **labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(registry, name, time.perf_counter() - start, **labels)
+
+
+def reset(registry):
+    with registry["lock"]:
+        for kind in ("counters", "gauges", "histograms"):
+            registry[kind].clear()
+
+
+# ---------------- EXPORT ----------------
+def labels_dict(key):
+    return dict(key[1])
+
+
+# {"counters": [{"name", "labels", "value"}], "gauges": [...],
+#  "histograms": [{"name", "labels", "count", "sum", "max", "buckets": {le: n}}]}
+def to_json(registry):
+    with registry["lock"]:
+        counters = sorted(registry["counters"].items())
+        gauges = sorted(registry["gauges"].items())
+        histograms = sorted(
+            (key, dict(h, counts=list(h["counts"]))) for key, h in registry["histograms"].items()
+        )
+
+    return {
+        "counters": [{"name": k[0], "labels": labels_dict(k), "value": v} for k, v in counters],
+        "gauges": [{"name": k[0], "labels": labels_dict(k), "value": v} for k, v in gauges],
+        "histograms": [
+            {
+                "name": k[0],
+                "labels": labels_dict(k),
+                "count": h["count"],
+                "sum": round(h["sum"], 6),
+                "max": round(h["max"], 6),
+                "buckets": {str(bound): n for bound, n in zip(h["buckets"], h["counts"])},
+            }
+            for k, h in histograms
+        ],
+    }
+
+
+def escape_label(value):
+    return LABEL_ESCAPE_RE.sub(r"\\\1", value).replace("\n", "\\n")
+
+
+def format_labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{escape_label(v)}"' for k, v in pairs) + "}"
+
+
+def format_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def to_prometheus(registry):
+    with registry["lock"]:
+        counters = sorted(registry["counters"].items())
+        gauges = sorted(registry["gauges"].items())
+        histograms = sorted(
+            (key, dict(h, counts=list(h["counts"]))) for key, h in registry["histograms"].items()
+        )
+        help_text = dict(registry["help"])
+
+    lines = []
+    declared = set()
+
+    def declare(name, kind):
+        if name in declared:
+            return
+        declared.add(name)
+        if name in help_text:
+            lines.append(f"# HELP {name} {help_text[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for (name, pairs), value in counters:
+        declare(name, "counter")
+        lines.append(f"{name}{format_labels(pairs)} {format_value(value)}")
+    for (name, pairs), value in gauges:
+        declare(name, "gauge")
+        lines.append(f"{name}{format_labels(pairs)} {format_value(value)}")
+    for (name, pairs), h in histograms:
+        declare(name, "histogram")
+        for bound, n in zip(h["buckets"], h["counts"]):
+            lines.append(f"{name}_bucket{format_labels(pairs + (('le', format_value(float(bound))),))} {n}")
+        lines.append(f"{name}_bucket{format_labels(pairs + (('le', '+Inf'),))} {h['count']}")
+        lines.append(f"{name}_sum{format_labels(pairs)} {format_value(h['sum'])}")
+        lines.append(f"{name}_count{format_labels(pairs)} {h['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+# Atomic write, so the textfile collector never reads half a file
+def write_textfile(registry, path):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(to_prometheus(registry))
+    os.replace(tmp, path)
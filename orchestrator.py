@@ -0,0 +1,185 @@
+import asyncio
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Asyncio scheduler for scrape jobs.
+#
+# Fetching (HTTP / Selenium) and extracting stay blocking and run on a
+# thread pool; the event loop only decides *when* each fetch may start:
+#
+#   concurrency   at most this many fetches in flight, across all hosts
+#   rate / burst  token bucket per host: `rate` fetches per second on
+#                 average, up to `burst` back to back
+#   retries       transient failures are retried with full-jitter
+#                 exponential backoff (random 0 .. min(cap, base * 2^n));
+#                 a server-sent Retry-After is honoured as a floor
+#   breaker       after `breaker_threshold` consecutive failures a host is
+#                 left alone for `breaker_cooldown` seconds; jobs for it
+#                 fail fast, then a single probe decides whether to close
+
+RATE = float(os.environ.get("SCRAPER_RATE", "1.0"))  # fetches / second / host
+BURST = int(os.environ.get("SCRAPER_BURST", "2"))
+RETRIES = int(os.environ.get("SCRAPER_RETRIES", "3"))
+BACKOFF_BASE = float(os.environ.get("SCRAPER_BACKOFF_BASE", "1.0"))
+BACKOFF_CAP = float(os.environ.get("SCRAPER_BACKOFF_CAP", "30"))
+BREAKER_THRESHOLD = int(os.environ.get("SCRAPER_BREAKER_THRESHOLD", "5"))
+BREAKER_COOLDOWN = float(os.environ.get("SCRAPER_BREAKER_COOLDOWN", "60"))
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+class Throttled(Exception):
+    # Raised by a fetch the server asked us to slow down on (429 / 503)
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def make_limits(concurrency, rate=None, burst=None, retries=None, backoff_base=None, backoff_cap=None,
+                breaker_threshold=None, breaker_cooldown=None):
+    return {
+        "concurrency": concurrency,
+        "rate": rate if rate is not None else RATE,
+        "burst": burst if burst is not None else BURST,
+        "retries": retries if retries is not None else RETRIES,
+        "backoff_base": backoff_base if backoff_base is not None else BACKOFF_BASE,
+        "backoff_cap": backoff_cap if backoff_cap is not None else BACKOFF_CAP,
+        "breaker_threshold": breaker_threshold if breaker_threshold is not None else BREAKER_THRESHOLD,
+        "breaker_cooldown": breaker_cooldown if breaker_cooldown is not None else BREAKER_COOLDOWN,
+        "buckets": {},
+        "breakers": {},
+        "stats": {"fetches": 0, "retries": 0, "throttled": 0, "short_circuited": 0, "waited": 0.0},
+    }
+
+
+# ---------------- TOKEN BUCKET ----------------
+async def take_token(limits, host):
+    bucket = limits["buckets"].setdefault(host, {
+        "tokens": float(limits["burst"]),
+        "updated": time.monotonic(),
+        "lock": asyncio.Lock(),
+    })
+    if limits["rate"] <= 0:
+        return
+
+    # The lock queues callers so tokens are handed out first come, first served
+    async with bucket["lock"]:
+        while True:
+            now = time.monotonic()
+            bucket["tokens"] = min(
+                float(limits["burst"]),
+                bucket["tokens"] + (now - bucket["updated"]) * limits["rate"]
+            )
+            bucket["updated"] = now
+            if bucket["tokens"] >= 1:
+                bucket["tokens"] -= 1
+                return
+            wait = (1 - bucket["tokens"]) / limits["rate"]
+            limits["stats"]["waited"] += wait
+            await asyncio.sleep(wait)
+
+
+# ---------------- CIRCUIT BREAKER ----------------
+def breaker_for(limits, host):
+    return limits["breakers"].setdefault(host, {"failures": 0, "open_until": 0.0, "probing": False})
+
+
+def breaker_allows(limits, host):
+    breaker = breaker_for(limits, host)
+    if breaker["failures"] < limits["breaker_threshold"]:
+        return True
+    if time.monotonic() < breaker["open_until"] or breaker["probing"]:
+        return False
+    # Cooled down → let one request through to test the host
+    breaker["probing"] = True
+    return True
+
+
+def record_success(limits, host):
+    breaker = breaker_for(limits, host)
+    breaker.update(failures=0, open_until=0.0, probing=False)
+
+
+def record_failure(limits, host):
+    breaker = breaker_for(limits, host)
+    breaker["failures"] += 1
+    breaker["probing"] = False
+    if breaker["failures"] >= limits["breaker_threshold"]:
+        breaker["open_until"] = time.monotonic() + limits["breaker_cooldown"]
+        print(f"🚧 {host}: {breaker['failures']} failures in a row, pausing it for {limits['breaker_cooldown']:.0f}s")
+
+
+def backoff_delay(limits, attempt, retry_after=None):
+    delay = random.uniform(0, min(limits["backoff_cap"], limits["backoff_base"] * 2 ** attempt))
+    return max(delay, retry_after or 0)
+
+
+# ---------------- JOBS ----------------
+# job: {"key", "url", "fetch": () -> page, "extract": page -> result}
+# Returns the job's result, or raises its last error.
+async def run_job(limits, semaphore, executor, job, retryable):
+    loop = asyncio.get_running_loop()
+    host = urlsplit(job["url"]).netloc
+    attempt = 0
+
+    while True:
+        if not breaker_allows(limits, host):
+            limits["stats"]["short_circuited"] += 1
+            raise CircuitOpen(f"{host} circuit open, skipped {job['url']}")
+
+        try:
+            async with semaphore:
+                await take_token(limits, host)
+                limits["stats"]["fetches"] += 1
+                page = await loop.run_in_executor(executor, job["fetch"])
+        except retryable as e:
+            record_failure(limits, host)
+            retry_after = getattr(e, "retry_after", None)
+            if isinstance(e, Throttled):
+                limits["stats"]["throttled"] += 1
+            if attempt >= limits["retries"]:
+                raise
+            delay = backoff_delay(limits, attempt, retry_after)
+            attempt += 1
+            limits["stats"]["retries"] += 1
+            print(f"🔁 {job['url']}: {type(e).__name__}, retry {attempt}/{limits['retries']} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+        except Exception:
+            # Not a host problem: don't count it, but free the probe slot
+            breaker_for(limits, host)["probing"] = False
+            raise
+
+        record_success(limits, host)
+        # Extraction is CPU work, it doesn't hold a fetch slot
+        return await loop.run_in_executor(executor, job["extract"], page)
+
+
+async def run_all(jobs, limits, retryable):
+    semaphore = asyncio.Semaphore(limits["concurrency"])
+    # Threads for every in-flight fetch plus room for extractions
+    with ThreadPoolExecutor(max_workers=limits["concurrency"] * 2) as executor:
+        outcomes = await asyncio.gather(
+            *(run_job(limits, semaphore, executor, job, retryable) for job in jobs),
+            return_exceptions=True
+        )
+    return {job["key"]: outcome for job, outcome in zip(jobs, outcomes)}
+
+
+# {job key: result or the exception it finally failed with}
+def run_jobs(jobs, limits, retryable=(Throttled,)):
+    return asyncio.run(run_all(jobs, limits, tuple(retryable) + (Throttled,)))
+
+
+def print_summary(limits):
+    stats = limits["stats"]
+    print(
+        f"🚦 {stats['fetches']} fetch(es), {stats['retries']} retried, "
+        f"{stats['throttled']} throttled, {stats['short_circuited']} skipped by the breaker, "
+        f"{stats['waited']:.1f}s waiting on rate limits"
+    )
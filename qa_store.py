@@ -0,0 +1,130 @@
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+# Append-only SQLite store for the Q&A corpus.
+#
+# One row per post, keyed by the questionid / answerid DOM attributes. Rows
+# are never deleted: a post seen again is only rewritten when its counts
+# (followers, views, votes) or text changed. `id` grows in first-seen
+# order and doubles as the paging cursor, so readers stream the corpus in
+# fixed-size pages instead of loading it.
+DB_FILE = os.environ.get("DATA_DB", "popular_mba_data.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS qa_posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    questionid TEXT NOT NULL,
+    answerid TEXT NOT NULL,
+    type TEXT,
+    question_text TEXT,
+    answer_text TEXT,
+    author_name TEXT,
+    author_url TEXT,
+    tags TEXT,
+    posted_time TEXT,
+    followers INTEGER,
+    views INTEGER,
+    upvotes INTEGER,
+    downvotes INTEGER,
+    first_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    UNIQUE (source, questionid, answerid)
+);
+CREATE INDEX IF NOT EXISTS qa_posts_source_id ON qa_posts (source, id);
+"""
+
+POST_FIELDS = (
+    "type", "question_text", "answer_text", "author_name", "author_url", "tags",
+    "posted_time", "followers", "views", "upvotes", "downvotes",
+)
+
+UPSERT_SQL = f"""
+INSERT INTO qa_posts (source, questionid, answerid, {", ".join(POST_FIELDS)}, first_seen, updated_at)
+VALUES (:source, :questionid, :answerid, {", ".join(":" + f for f in POST_FIELDS)}, :seen_at, :seen_at)
+ON CONFLICT (source, questionid, answerid) DO UPDATE SET
+    {", ".join(f"{f} = excluded.{f}" for f in POST_FIELDS)},
+    updated_at = excluded.updated_at
+WHERE {" OR ".join(f"{f} IS NOT excluded.{f}" for f in POST_FIELDS)}
+"""
+
+
+def connect(path=None, readonly=False):
+    path = path or DB_FILE
+    if readonly:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def init_schema(conn):
+    conn.executescript(SCHEMA)
+
+
+# Flatten the scraper's QA (question → answers) and QAD (flat list) output
+# into one record per post
+def posts_from_result(source, result):
+    posts = []
+    for question in (result or {}).get("questions", []):
+        for answer in question.get("answers", [question]):
+            questionid = question.get("questionid")
+            answerid = answer.get("answerid")
+            if not questionid or not answerid:
+                continue
+            author = answer.get("author") or {}
+            posts.append({
+                "source": source,
+                "questionid": questionid,
+                "answerid": answerid,
+                "type": answer.get("type", "Q"),
+                "question_text": question.get("question_text"),
+                "answer_text": answer.get("answer_text"),
+                "author_name": author.get("name"),
+                "author_url": author.get("profile_url"),
+                "tags": json.dumps(question.get("tags", []), ensure_ascii=False),
+                "posted_time": answer.get("posted_time"),
+                "followers": question.get("followers"),
+                "views": question.get("views"),
+                "upvotes": answer.get("upvotes"),
+                "downvotes": answer.get("downvotes"),
+            })
+    return posts
+
+
+# Returns (inserted, updated)
+def upsert_posts(conn, posts, seen_at=None):
+    seen_at = seen_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+    before = conn.total_changes
+    existing = conn.execute("SELECT COUNT(*) FROM qa_posts").fetchone()[0]
+    conn.executemany(UPSERT_SQL, [{**post, "seen_at": seen_at} for post in posts])
+    inserted = conn.execute("SELECT COUNT(*) FROM qa_posts").fetchone()[0] - existing
+    return inserted, conn.total_changes - before - inserted
+
+
+def row_to_post(row):
+    post = dict(row)
+    post["tags"] = json.loads(post["tags"] or "[]")
+    return post
+
+
+# Keyset paging: posts with id > after, oldest first. Returns (posts, next cursor or None)
+def page_posts(conn, source=None, after=0, limit=50):
+    if source:
+        rows = conn.execute(
+            "SELECT * FROM qa_posts WHERE source = ? AND id > ? ORDER BY id LIMIT ?",
+            (source, after, limit + 1)
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT * FROM qa_posts WHERE id > ? ORDER BY id LIMIT ?",
+            (after, limit + 1)
+        ).fetchall()
+
+    posts = [row_to_post(row) for row in rows[:limit]]
+    next_after = posts[-1]["id"] if len(rows) > limit else None
+    return posts, next_after
@@ -1,20 +1,220 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 import time
 import json
 import re
+import os
+import queue
+import threading
+import subprocess
+import functools
+import hashlib
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import atexit
+import urllib3
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from concurrent.futures import ProcessPoolExecutor
+import html_store
+import metrics
+import orchestrator
+import snapshot_file
+import storage
+
+# Courses to scrape: course key -> its pages (see load_courses)
+COURSES_FILE = os.environ.get("SCRAPER_COURSES", "courses.json")
+# One <course key>.json per course is written here next to FINAL_FILE
+COURSE_OUTPUT_DIR = os.environ.get("SCRAPER_COURSE_DIR", "courses")
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# What each kind of page must show before we read it:
+#   anchor   - CSS selector the extractor depends on (browser wait)
+#   marker   - same anchor as a regex, to check raw HTTP responses cheaply
+#   timeout  - per-page browser timeout (seconds)
+#   empty_ok - a loaded page without the anchor is a valid empty result
+#              (tag page with no posts yet); otherwise it's an error page
+#              and the fetch is retried (PageUnavailable)
+#   crawl    - infinite-scroll tag page, walked with crawl_tag_pages()
+PAGE_READY = {
+    "overviews": {
+        "anchor": "#wikkiContents_chp_section_overview_0",
+        "marker": r"""id=["']?wikkiContents_chp_section_overview_0\b""",
+        "timeout": 20,
+    },
+    "popular_college": {
+        "anchor": "#EdContent_categoryPage",
+        "marker": r"""id=["']?EdContent_categoryPage\b""",
+        "timeout": 20,
+    },
+    "QA": {
+        "anchor": "div.post-col[questionid][answerid][type='Q']",
+        "marker": r"<div[^>]*\bquestionid=",
+        "timeout": 10,
+        "empty_ok": True,
+        "crawl": True,
+    },
+    "QAD": {
+        "anchor": "div.post-col[questionid][answerid]",
+        "marker": r"<div[^>]*\bquestionid=",
+        "timeout": 10,
+        "empty_ok": True,
+        "crawl": True,
+    },
+}
+
+# url -> page kind (PAGE_READY key), filled by load_courses()
+PAGE_KINDS = {}
+
+
+def ready_for(url):
+    return PAGE_READY.get(PAGE_KINDS.get(url), {})
+
+
+QUIET_PERIOD = 0.5  # DOM + network must be still this long to count as settled
+
+# Number of pages scraped at the same time, one headless browser each
+SCRAPER_WORKERS = int(os.environ.get("SCRAPER_WORKERS", "4"))
+
+# Try a plain HTTP GET before starting a browser (set to 0 to always use Chrome)
+HTTP_FIRST = os.environ.get("SCRAPER_HTTP_FIRST", "1") != "0"
+HTTP_TIMEOUT = urllib3.Timeout(connect=5, read=20)
+THROTTLE_STATUSES = (429, 503)
+
+
+
+class PageUnavailable(Exception):
+    # 5xx response, or a browser load without the content we wait for
+    pass
+
+
+# Failures worth another attempt after a backoff (see orchestrator.py)
+TRANSIENT_ERRORS = (TimeoutException, WebDriverException, urllib3.exceptions.HTTPError,
+                    orchestrator.Throttled, PageUnavailable)
+
+http = urllib3.PoolManager(
+    maxsize=SCRAPER_WORKERS,
+    headers={
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    },
+    # Redirects only: the orchestrator owns retries, so each one is rate
+    # limited, backed off and seen by the circuit breaker
+    retries=urllib3.Retry(connect=0, read=0, status=0, other=0, redirect=5),
+    timeout=HTTP_TIMEOUT,
+)
+
+# BeautifulSoup tree builder used by every extractor: "lxml" (C, fastest),
+# "html5lib" (browser-grade, slowest) or "html.parser" (stdlib)
+PARSER_BACKENDS = ("lxml", "html5lib", "html.parser")
+PARSER = os.environ.get("SCRAPER_PARSER", "lxml")
+
+# Infinite-scroll batches loaded per tag page per run (1 = first screen only)
+QA_MAX_PAGES = int(os.environ.get("SCRAPER_QA_MAX_PAGES", "10"))
+
+# Write every run into the SQLite store (storage.py): course documents,
+# the section index, normalized tables, full-text index and Q&A posts.
+# SCRAPER_QA_STORE is the older name of the switch.
+SQLITE_STORE = os.environ.get("SCRAPER_SQLITE_STORE", os.environ.get("SCRAPER_QA_STORE", "1")) != "0"
+
+# Keep a compressed copy of every fetched page in html_store/ for replay
+CAPTURE_HTML = os.environ.get("SCRAPER_CAPTURE_HTML", "1") != "0"
+
+# url -> {"via": "http" | "browser", "seconds": ..., "reason": ...} for the current run
+FETCH_LOG = {}
+
+CHROME_BINARY = "/usr/bin/chromium"
+
+# Resolved chromedriver path, cached on disk per installed Chromium version so
+# repeat runs don't hit the network (CHROMEDRIVER_PATH skips resolution)
+DRIVER_CACHE_FILE = os.environ.get(
+    "CHROMEDRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "mba-scraper", "chromedriver.json"),
+)
+
+# Keep browsers alive between scrape_mba_colleges() calls (long-lived
+# service, see serve(); implied by --serve)
+KEEP_WARM = os.environ.get("SCRAPER_KEEP_WARM", "0") == "1"
+
+# One entry per browser launch: how long driver resolution and launch took
+DRIVER_STARTUPS = []
+
+# Phase timings and coverage counts of the current run (metrics.py), saved
+# into REPORT_FILE and as a Prometheus textfile for node_exporter
+SCRAPE_METRICS = metrics.make_registry()
+METRICS_FILE = os.environ.get("SCRAPER_METRICS_FILE", "scrape_metrics.prom")
+metrics.describe(SCRAPE_METRICS, "scrape_phase_seconds", "Time spent per scrape phase")
+metrics.describe(SCRAPE_METRICS, "scrape_section_seconds", "Time spent per course-page section handler")
+metrics.describe(SCRAPE_METRICS, "scrape_extract_seconds", "Time spent per page extractor")
+metrics.describe(SCRAPE_METRICS, "scrape_items", "Items extracted per course")
+
+
+# with phase("navigate"): ... → scrape_phase_seconds{phase="navigate"}
+def phase(name):
+    return metrics.timer(SCRAPE_METRICS, "scrape_phase_seconds", phase=name)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def chromium_version():
+    try:
+        output = subprocess.run(
+            [CHROME_BINARY, "--version"],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+    return match.group(1) if match else None
+
+
+def resolve_driver_path():
+    global _driver_path
+
+    with _driver_path_lock:
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path, True
+
+        if os.environ.get("CHROMEDRIVER_PATH"):
+            _driver_path = os.environ["CHROMEDRIVER_PATH"]
+            return _driver_path, True
+
+        version = chromium_version()
+        try:
+            with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+
+        # Only trust the cache for the Chromium build it was resolved for
+        if version and cached.get("browser_version") == version and os.path.exists(cached.get("driver_path", "")):
+            _driver_path = cached["driver_path"]
+            return _driver_path, True
+
+        _driver_path = ChromeDriverManager().install()
+
+        if version:
+            try:
+                os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+                with open(DRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+                    json.dump({"browser_version": version, "driver_path": _driver_path}, f)
+            except OSError as e:
+                print(f"⚠️ Could not cache chromedriver path: {e}")
+
+        return _driver_path, False
 
-PCOMBA_O_URL="https://www.shiksha.com/distance-b-e-b-tech-chp"
-PCOMBA_P_URL = "https://www.shiksha.com/engineering/colleges/distance-correspondence-b-tech-colleges-india?sby=popularity&rf=filters"
-PCOMBA_QN_URL = "https://www.shiksha.com/tags/b-tech-tdp-413"
-PCOMBA_QND_URL = "https://www.shiksha.com/tags/b-tech-tdp-413?type=discussion"
 
 def create_driver():
     options = Options()
@@ -27,792 +227,1137 @@ def create_driver():
     options.add_argument("--window-size=1920,1080")
 
     # Optional but good
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    options.add_argument(f"user-agent={USER_AGENT}")
 
     # Important for Ubuntu runner
-    options.binary_location = "/usr/bin/chromium"
+    options.binary_location = CHROME_BINARY
+
+    start = time.perf_counter()
+    driver_path, cached = resolve_driver_path()
+    resolved = time.perf_counter()
 
-    service = Service(ChromeDriverManager().install())
+    service = Service(driver_path)
 
-    return webdriver.Chrome(
+    driver = webdriver.Chrome(
         service=service,
         options=options
     )
 
+    DRIVER_STARTUPS.append({
+        "driver_path_cached": cached,
+        "resolve_seconds": round(resolved - start, 3),
+        "launch_seconds": round(time.perf_counter() - resolved, 3),
+    })
+    metrics.observe(SCRAPE_METRICS, "scrape_phase_seconds", time.perf_counter() - start, phase="driver_create")
+    del DRIVER_STARTUPS[:-100]
+    return driver
+
 
 # ---------------- UTILITIES ----------------
+# Number of DOM nodes + number of network resources fetched so far.
+# When neither moves for QUIET_PERIOD the page is considered settled.
+ACTIVITY_JS = (
+    "return [document.getElementsByTagName('*').length,"
+    " performance.getEntriesByType('resource').length];"
+)
+
+
+def wait_for_quiet(driver, timeout, quiet=QUIET_PERIOD):
+    state = {"activity": None, "since": time.monotonic()}
+
+    def settled(d):
+        activity = d.execute_script(ACTIVITY_JS)
+        now = time.monotonic()
+        if activity != state["activity"]:
+            state["activity"], state["since"] = activity, now
+            return False
+        return now - state["since"] >= quiet
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(settled)
+        return True
+    except TimeoutException:
+        # Pages with endless trackers never go fully quiet, that's fine
+        return False
+
+
+def wait_until_ready(driver, url):
+    ready = ready_for(url)
+    timeout = ready.get("timeout", 15)
+    deadline = time.monotonic() + timeout
+
+    def remaining():
+        return max(0.1, deadline - time.monotonic())
+
+    WebDriverWait(driver, remaining(), poll_frequency=0.1).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+    anchor = ready.get("anchor")
+    if anchor:
+        try:
+            WebDriverWait(driver, remaining(), poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, anchor))
+            )
+        except TimeoutException:
+            return False
+
+    wait_for_quiet(driver, remaining())
+    return True
+
+
+# Navigate and return the HTML once the page is ready. A page that never
+# finishes loading raises TimeoutException; one that loads without its
+# anchor raises PageUnavailable, unless the page kind is empty_ok.
+def load_page(driver, url):
+    with phase("navigate"):
+        driver.get(url)
+    with phase("wait"):
+        ready = wait_until_ready(driver, url)
+    if not ready:
+        if not ready_for(url).get("empty_ok"):
+            raise PageUnavailable(f"{url}: {ready_for(url)['anchor']} never showed up")
+        print(f"📭 {url}: nothing posted yet")
+    with phase("page_source"):
+        return driver.page_source
+
+
+@functools.lru_cache(maxsize=None)
+def parser_available(parser):
+    try:
+        BeautifulSoup("", parser)
+        return True
+    except FeatureNotFound:
+        return False
+
+
+def make_soup(html, parser=None):
+    parser = parser or PARSER
+    if parser not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {parser}")
+    if not parser_available(parser):
+        parser = "html.parser"
+    with phase("parse"):
+        return BeautifulSoup(html, parser)
+
+
+# ---------------- FETCH ----------------
+# Server-rendered pages don't need Chrome: try a pooled HTTP GET first and
+# only fall back to the browser when the page's marker isn't in the HTML.
+# Returns a page dict {"html", "etag", "last_modified", "not_modified"}
+# or None plus the reason. `validators` are the ETag / Last-Modified we saw
+# last time; a 304 comes back as not_modified with no HTML.
+def fetch_http(url, validators=None):
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    # Connection errors propagate: the orchestrator retries them with
+    # backoff, a browser wouldn't reach the host either
+    with phase("http_fetch"):
+        response = http.request("GET", url, headers=headers or None)
+
+    page = {
+        "html": None,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "not_modified": response.status == 304,
+    }
+    if page["not_modified"]:
+        return page, None
+
+    # The server wants us to slow down: back off instead of retrying the
+    # same page with a browser
+    if response.status in THROTTLE_STATUSES:
+        retry_after = response.headers.get("Retry-After", "")
+        raise orchestrator.Throttled(
+            f"{url}: http status {response.status}",
+            int(retry_after) if retry_after.isdigit() else None
+        )
+
+    if response.status >= 500:
+        raise PageUnavailable(f"{url}: http status {response.status}")
+
+    if response.status != 200:
+        return None, f"http status {response.status}"
+
+    charset = "utf-8"
+    content_type = response.headers.get("Content-Type", "")
+    if "charset=" in content_type:
+        charset = content_type.split("charset=")[-1].split(";")[0].strip()
+
+    page["html"] = response.data.decode(charset, errors="replace")
+    return page, None
+
+
+def has_marker(url, html):
+    marker = ready_for(url).get("marker")
+    return marker is None or re.search(marker, html) is not None
+
+
+def fetch_page(pool, url, validators=None, known_ids=None):
+    start = time.perf_counter()
+    reason = "http disabled"
+    crawl = ready_for(url).get("crawl") and QA_MAX_PAGES > 1
+
+    if crawl:
+        # Later batches only exist after scrolling in a real browser
+        reason = "paginated crawl"
+    elif HTTP_FIRST:
+        page, reason = fetch_http(url, validators)
+        if page is not None:
+            if page["not_modified"] or has_marker(url, page["html"]):
+                FETCH_LOG[url] = {"via": "http", "seconds": round(time.perf_counter() - start, 3)}
+                print(f"🌐 {url} fetched over HTTP" + (" (304 not modified)" if page["not_modified"] else ""))
+                return page
+            reason = "marker missing from HTTP response (client-side rendered?)"
+
+    driver = acquire_driver(pool)
+    try:
+        if crawl:
+            html = crawl_tag_pages(driver, url, known_ids)
+        else:
+            html = load_page(driver, url)
+    except (TimeoutException, PageUnavailable):
+        release_driver(pool, driver)
+        raise
+    except Exception:
+        release_driver(pool, driver, healthy=False)
+        raise
+    release_driver(pool, driver)
+
+    FETCH_LOG[url] = {
+        "via": "browser",
+        "seconds": round(time.perf_counter() - start, 3),
+        "reason": reason,
+    }
+    print(f"🧭 {url} fetched with browser ({reason})")
+    return {"html": html, "etag": None, "last_modified": None, "not_modified": False}
+
+
+# ---------------- TAG PAGE CRAWLER ----------------
+# Tag pages load older posts as you scroll. Walk them batch by batch (newest
+# first), stop at the first batch containing a post we already stored, and
+# never load more than max_pages batches.
+POST_IDS_JS = (
+    "return Array.from(document.querySelectorAll('div.post-col[questionid][answerid]'))"
+    ".map(e => e.getAttribute('questionid') + ':' + e.getAttribute('answerid'));"
+)
+
+
+def crawl_tag_pages(driver, url, known_ids=None, max_pages=None):
+    max_pages = max_pages or QA_MAX_PAGES
+    known_ids = known_ids or set()
+
+    load_page(driver, url)
+
+    seen = set()
+    for page in range(1, max_pages + 1):
+        new_ids = [post_id for post_id in driver.execute_script(POST_IDS_JS) if post_id not in seen]
+        seen.update(new_ids)
+
+        if not new_ids:
+            break
+        if any(post_id in known_ids for post_id in new_ids):
+            print(f"⏹️  {url}: reached stored posts after {page} batch(es)")
+            break
+        if page == max_pages:
+            print(f"⏹️  {url}: page cap ({max_pages}) reached")
+            break
+
+        with phase("scroll"):
+            scroll_to_bottom(driver, scroll_times=1, pause=ready_for(url).get("timeout", 10))
+
+    with phase("page_source"):
+        return driver.page_source
+
+
+# "questionid:answerid" of every post already in an extracted result
+def post_ids(result):
+    ids = set()
+    for question in (result or {}).get("questions", []):
+        for post in question.get("answers", [question]):
+            if question.get("questionid") and post.get("answerid"):
+                ids.add(f"{question['questionid']}:{post['answerid']}")
+    return ids
+
+
+def merge_posts(new_posts, old_posts, key_fields, text_fields):
+    ids = {tuple(p.get(f) for f in key_fields) for p in new_posts}
+    texts = {tuple(str(p.get(f)) for f in text_fields) for p in new_posts}
+    merged = list(new_posts)
+    for post in old_posts:
+        key = tuple(post.get(f) for f in key_fields)
+        if all(key):
+            if key in ids:
+                continue
+        # Posts stored before ids were recorded are matched on their text
+        elif tuple(str(post.get(f)) for f in text_fields) in texts:
+            continue
+        merged.append(post)
+    return merged
+
+
+# New crawl first, then every stored post it didn't reach
+def merge_qa(new, previous):
+    new_questions = new.get("questions", [])
+    by_id = {q["questionid"]: q for q in new_questions if q.get("questionid")}
+    by_text = {q["question_text"]: q for q in new_questions}
+
+    merged = list(new_questions)
+    for old in (previous or {}).get("questions", []):
+        current = by_id.get(old.get("questionid")) or by_text.get(old.get("question_text"))
+        if current is None:
+            merged.append(old)
+            continue
+        current["answers"] = merge_posts(
+            current["answers"], old.get("answers", []),
+            ("answerid",), ("answer_text", "posted_time")
+        )
+
+    return {**new, "questions": merged}
+
+
+def merge_qad(new, previous):
+    return {**new, "questions": merge_posts(
+        new.get("questions", []), (previous or {}).get("questions", []),
+        ("questionid", "answerid"), ("question_text", "answer_text")
+    )}
+
+
 def scroll_to_bottom(driver, scroll_times=3, pause=1.5):
     for _ in range(scroll_times):
+        height = driver.execute_script("return document.body.scrollHeight;")
         driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
-        time.sleep(pause)
+        # pause is now an upper bound: stop waiting as soon as more
+        # content has been appended
+        try:
+            WebDriverWait(driver, pause, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.body.scrollHeight;") > height
+            )
+        except TimeoutException:
+            break
+
+
+# ---------------- TABLES ----------------
+# One table engine for every extractor. Rows are read once, rowspan /
+# colspan cells are repeated into every slot they cover, and ragged rows
+# are kept instead of being dropped or raising IndexError.
+MAX_SPAN = 100
+HIGHLIGHT_COLUMNS = ["Particular", "Details"]
+JOB_PROFILE_COLUMNS = ["job_profile", "job_description", "average_salary"]
+
+
+def span(cell, attr):
+    try:
+        return max(1, min(int(cell.get(attr, 1)), MAX_SPAN))
+    except (TypeError, ValueError):
+        return 1
+
+
+# Grid of cell elements, one list per non-empty <tr>
+def table_cells(table):
+    grid = []
+    carried = {}  # column -> [cell, rows still covered] from a rowspan above
+
+    def carry(row, col):
+        while col in carried:
+            cell, left = carried[col]
+            row.append(cell)
+            if left == 1:
+                del carried[col]
+            else:
+                carried[col][1] -= 1
+            col += 1
+        return col
+
+    for tr in table.find_all("tr"):
+        row = []
+        col = 0
+        for cell in tr.find_all(["td", "th"], recursive=False):
+            col = carry(row, col)
+            rowspan = span(cell, "rowspan")
+            for _ in range(span(cell, "colspan")):
+                row.append(cell)
+                if rowspan > 1:
+                    carried[col] = [cell, rowspan - 1]
+                col += 1
+        carry(row, col)
+
+        if row:
+            grid.append(row)
+
+    return grid
+
+
+# Grid of cell texts
+def table_rows(table, separator=" "):
+    return [
+        [cell.get_text(separator, strip=True) for cell in row]
+        for row in table_cells(table)
+    ]
+
+
+# First row = header. Returns (headers, records), one dict per body row.
+# Cells without a header get "col_<index>" so wide rows keep their data.
+# columnar=True returns {header: [values...]} instead, padded with None.
+def table_records(table, separator=" ", header_separator=None, columnar=False):
+    grid = table_cells(table)
+    if not grid:
+        return [], {} if columnar else []
+
+    if header_separator is None:
+        header_separator = separator
+    headers = [cell.get_text(header_separator, strip=True) for cell in grid[0]]
+    body = [[cell.get_text(separator, strip=True) for cell in row] for row in grid[1:]]
+
+    width = max([len(headers)] + [len(row) for row in body])
+    keys = [
+        headers[i] if i < len(headers) and headers[i] else f"col_{i}"
+        for i in range(width)
+    ]
+
+    if columnar:
+        return headers, {
+            key: [row[i] if i < len(row) else None for row in body]
+            for i, key in enumerate(keys)
+        }
 
+    return headers, [
+        {keys[i]: value for i, value in enumerate(row)}
+        for row in body
+    ]
 
-def extract_course_data(driver):
-    driver.get(PCOMBA_O_URL)
-    time.sleep(5)
-    wait = WebDriverWait(driver, 15)
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    data = {}
+# Rows as dicts under fixed field names, for tables whose header row doesn't
+# name the fields we publish. Same ragged-row rules as table_records: extra
+# cells go under "col_<index>", short rows keep the cells they have. Rows
+# without any cell are skipped.
+def named_records(rows, names):
+    return [
+        {(names[i] if i < len(names) else f"col_{i}"): value for i, value in enumerate(row)}
+        for row in rows if row
+    ]
 
-    # -------------------------------
-    # Course Name
-    course_name_div = soup.find("div", class_="a54c")
-    if course_name_div:
-        h1 = course_name_div.find("h1")
-        data["title"] = h1.text.strip() if h1 else None
 
-    # -------------------------------
-    # Updated date
-    updated_div = soup.find("div", string=lambda x: x and "Updated on" in x)
-    if updated_div:
-        span = updated_div.find("span")
-        data["updated_on"] = span.text.strip() if span else None
+# ---------------- COURSE PAGE SECTIONS ----------------
+# Handlers run in registration order, which is also the key order of the
+# extracted JSON. Adding a section = registering one more handler.
+SECTION_ID_RE = re.compile(r"^(wikkiContents_)?chp_section_")
+SECTION_HANDLERS = []
 
-    # -------------------------------
-    # Author info
-    author_block = soup.find("div", class_="be8c")
-    if author_block:
-        data["author"] = {
-            "name": author_block.find("a").text.strip() if author_block.find("a") else None,
-            "profile": author_block.find("a")["href"] if author_block.find("a") else None,
-            "image": author_block.find("img")["src"] if author_block.find("img") else None,
-            "role": author_block.find("span", class_="b0fc").text.strip() if author_block.find("span", class_="b0fc") else None,
-            "verified": True if author_block.find("i", class_="tickIcon") else False
-        }
 
-    # =====================================================
-    # OVERVIEW SECTION
-    # =====================================================
-    overview_div = soup.find("div", id="wikkiContents_chp_section_overview_0")
-    if overview_div:
-
-        paragraphs = []
-        for p in overview_div.find_all("p")[:2]:
-            text = p.get_text(" ", strip=True)
-            if text and len(text) > 30:
-                paragraphs.append(text)
-
-        links = []
-        for a in overview_div.find_all("a", href=True):
-            links.append({
-                "title": a.get_text(strip=True),
-                "url": a["href"]
-            })
+def section_handler(tag, container_id):
+    def register(handler):
+        SECTION_HANDLERS.append((tag, container_id, handler))
+        return handler
+    return register
 
-        highlight_rows = []
-        for table in overview_div.find_all("table"):
-            for row in table.find_all("tr")[1:]:
-                cols = row.find_all(["td", "th"])
-                if len(cols) == 2:
-                    highlight_rows.append({
-                        "Particular": cols[0].get_text(" ", strip=True),
-                        "Details": cols[1].get_text(" ", strip=True)
-                    })
-
-        data["overview"] = {
-            "description": paragraphs,
-            "important_links": links,
-            "highlights": {
-                "columns": ["Particular", "Details"],
-                "rows": highlight_rows
-            }
+
+# =====================================================
+# OVERVIEW SECTION
+# =====================================================
+@section_handler("div", "wikkiContents_chp_section_overview_0")
+def handle_overview(overview_div):
+    data = {}
+
+    paragraphs = []
+    for p in overview_div.find_all("p")[:2]:
+        text = p.get_text(" ", strip=True)
+        if text and len(text) > 30:
+            paragraphs.append(text)
+
+    links = []
+    for a in overview_div.find_all("a", href=True):
+        links.append({
+            "title": a.get_text(strip=True),
+            "url": a["href"]
+        })
+
+    highlight_rows = []
+    for table in overview_div.find_all("table"):
+        highlight_rows.extend(named_records(table_rows(table)[1:], HIGHLIGHT_COLUMNS))
+
+    width = max([len(HIGHLIGHT_COLUMNS)] + [len(row) for row in highlight_rows])
+    data["overview"] = {
+        "description": paragraphs,
+        "important_links": links,
+        "highlights": {
+            "columns": HIGHLIGHT_COLUMNS + [f"col_{i}" for i in range(len(HIGHLIGHT_COLUMNS), width)],
+            "rows": highlight_rows
         }
+    }
 
-    # =====================================================
-    # ELIGIBILITY SECTION
-    # =====================================================
-    eligibility_div = soup.find("section", id="chp_section_eligibility")
-    if eligibility_div:
-        content = []
+    return data
 
-        # Grab all relevant elements recursively
-        for elem in eligibility_div.find_all(["h1","h2","h3","h4","h5","h6","p","table","div"], recursive=True):
-            if elem.name in ["h1","h2","h3","h4","h5","h6"]:
-                content.append({
-                    "text": elem.get_text(" ", strip=True)
-                })
 
-            elif elem.name == "table":
-                headers = [th.get_text(" ", strip=True) for th in elem.find_all("th")]
-                rows_data = []
-                for row in elem.find_all("tr")[1:]:
-                    cols = row.find_all(["td", "th"])
-                    row_dict = {}
-                    for idx, col in enumerate(cols):
-                        key = headers[idx] if idx < len(headers) else f"col_{idx}"
-                        row_dict[key] = col.get_text(" ", strip=True)
-                    rows_data.append(row_dict)
-                content.append({
-                    "headers": headers,
-                    "rows": rows_data
-                })
+# =====================================================
+# ELIGIBILITY SECTION
+# =====================================================
+@section_handler("section", "chp_section_eligibility")
+def handle_eligibility(eligibility_div):
+    data = {}
 
-        faq_blocks = eligibility_div.find_all("div", class_="html-0 c5db62 listener")
-        for faq in faq_blocks:
-            # Extract question
-            question_span = faq.find("span", string=lambda x: x and x.strip().startswith("Q:"))
-            question_text = None
-            if question_span:
-                # The actual question text is in the next span after "Q:"
-                spans = faq.find_all("span")
-                if len(spans) > 1:
-                    question_text = spans[1].get_text(" ", strip=True)
-
-            # Extract answer
-            answer_div = faq.find_next_sibling("div", class_="_16f53f")
-            answer_text = ""
-            if answer_div:
-                # Get all paragraph texts inside answer div
-                paragraphs = answer_div.find_all("p")
-                if paragraphs:
-                    answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
-                else:
-                    # Fallback: get all text inside answer div
-                    answer_text = answer_div.get_text(" ", strip=True)
-
-            if question_text and answer_text:
-                content.append({
-                    "question": question_text,
-                    "answer": answer_text
-                })
+    content = []
 
-        data["eligibility_admission"] = content
-
-    # =====================================================
-    # POPULAR EXAMS & IIT SEATS
-    # =====================================================
-    popular_div = soup.find("div", id="wikkiContents_chp_section_popularexams_0")
-    if popular_div:
-        # 1. Popular Entrance Exams
-        exams_table = popular_div.find("table")
-        exams = []
-        if exams_table:
-            rows = exams_table.find_all("tr")[1:]  # skip header
-            for row in rows:
-                cols = row.find_all("td")
-                if len(cols) == 3:
-                    exams.append({
-                        "exam_name": cols[0].get_text(strip=True),
-                        "exam_dates": cols[1].get_text(strip=True),
-                        "exam_schedule_link": cols[2].find("a")["href"] if cols[2].find("a") else None
-                    })
-        data["popular_exams"] = exams
-
-        # 2. JEE Main Cutoff
-        cutoff_table = popular_div.find("h3", string=lambda x: x and "JEE Main 2025 Cutoff" in x)
-        cutoff_data = []
-        if cutoff_table:
-            table = cutoff_table.find_next("table")
-            if table:
-                headers = [th.get_text(strip=True) for th in table.find_all("th")]
-                for row in table.find_all("tr")[1:]:
-                    cols = row.find_all("td")
-                    cutoff_data.append({headers[i]: cols[i].get_text(strip=True) for i in range(len(cols))})
-        data["jee_main_cutoff_2025"] = cutoff_data
-
-        # 3. IIT Seats (Delhi, Madras, Bombay)
-        iit_seats = {}
-        for h4 in popular_div.find_all("h4"):
-            if "IIT" in h4.text and "BTech Seats" in h4.text:
-                iit_name = h4.text.replace("BTech Seats","").strip()
-                table = h4.find_next("table")
-                seats = []
-                if table:
-                    headers = [th.get_text(strip=True) for th in table.find_all("th")]
-                    for row in table.find_all("tr")[1:]:
-                        cols = row.find_all("td")
-                        seats.append({headers[i]: cols[i].get_text(strip=True) for i in range(len(cols))})
-                iit_seats[iit_name] = seats
-        data["iit_btech_seats"] = iit_seats
-
-    # =====================================================
-    # POPULAR SPECIALIZATIONS SECTION
-    # =====================================================
-    popular_specialization_div = soup.find("section", id="chp_section_popularspecialization")
-    if popular_specialization_div:
-        content = []
-        
-        # Main heading
-        main_heading = popular_specialization_div.find("h2", class_="tbSec2")
-        if main_heading:
+    # Grab all relevant elements recursively
+    for elem in eligibility_div.find_all(["h1","h2","h3","h4","h5","h6","p","table","div"], recursive=True):
+        if elem.name in ["h1","h2","h3","h4","h5","h6"]:
             content.append({
-                "text": main_heading.get_text(" ", strip=True)
+                "text": elem.get_text(" ", strip=True)
             })
-        
-        # Introductory text
-        intro_div = popular_specialization_div.find("div", class_="photo-widget-full")
-        if intro_div:
-            intro_text = intro_div.get_text(" ", strip=True)
-            if intro_text:
-                content.append({
-                    "text": intro_text
-                })
-        
-        # Specializations table
-        specializations_table = popular_specialization_div.find("table")
-        if specializations_table:
-            # Extract table headers
-            headers = [th.get_text(" ", strip=True) for th in specializations_table.find_all("th")]
-            
-            # Extract table rows
-            rows_data = []
-            for row in specializations_table.find_all("tr")[1:]:  # Skip header row
-                cols = row.find_all(["td", "th"])
-                row_dict = {}
-                
-                for idx, col in enumerate(cols):
-                    key = headers[idx] if idx < len(headers) else f"col_{idx}"
-                    row_dict[key] = col.get_text(" ", strip=True)
-                
-                rows_data.append(row_dict)
-            
+
+        elif elem.name == "table":
+            headers, rows_data = table_records(elem)
             content.append({
-                "title": "BTech Specializations and Jobs",
                 "headers": headers,
                 "rows": rows_data
             })
-        
-        # Note text
-        note_p = popular_specialization_div.find("p", string=lambda x: x and "Note" in x)
-        if note_p:
+
+    faq_blocks = eligibility_div.find_all("div", class_="html-0 c5db62 listener")
+    for faq in faq_blocks:
+        # Extract question
+        question_span = faq.find("span", string=lambda x: x and x.strip().startswith("Q:"))
+        question_text = None
+        if question_span:
+            # The actual question text is in the next span after "Q:"
+            spans = faq.find_all("span")
+            if len(spans) > 1:
+                question_text = spans[1].get_text(" ", strip=True)
+
+        # Extract answer
+        answer_div = faq.find_next_sibling("div", class_="_16f53f")
+        answer_text = ""
+        if answer_div:
+            # Get all paragraph texts inside answer div
+            paragraphs = answer_div.find_all("p")
+            if paragraphs:
+                answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
+            else:
+                # Fallback: get all text inside answer div
+                answer_text = answer_div.get_text(" ", strip=True)
+
+        if question_text and answer_text:
             content.append({
-                "text": note_p.get_text(" ", strip=True)
+                "question": question_text,
+                "answer": answer_text
             })
-        
-        # Popular specializations list
-        specialization_box = popular_specialization_div.find("div", class_="specialization-box")
-        if specialization_box:
-            specializations_list = []
-            for li in specialization_box.find_all("li"):
-                link = li.find("a", href=True)
-                college_count = li.find("p")
-                
-                if link:
-                    specializations_list.append({
-                        "specialization": link.get_text(strip=True),
-                        "college_count": college_count.get_text(strip=True) if college_count else None
-                    })
-            
-            if specializations_list:
-                content.append({
-                    "title": "Popular Specializations by College Count",
-                    "specializations": specializations_list
-                })
-        
-        # FAQs
-        faq_section = popular_specialization_div.find("div", id="sectional-faqs-0")
-        if faq_section:
-            faqs = []
-            faq_blocks = faq_section.find_all("div", class_="html-0 c5db62 listener")
-            
-            for faq_block in faq_blocks:
-                # Extract question
-                question_spans = faq_block.find_all("span")
-                question_text = None
-                if len(question_spans) >= 2:
-                    question_text = question_spans[1].get_text(" ", strip=True)
-                
-                # Extract answer from next sibling div
-                answer_div = faq_block.find_next_sibling("div", class_="_16f53f")
-                answer_text = ""
-                if answer_div:
-                    answer_content = answer_div.find("div", class_="cmsAContent")
-                    if answer_content:
-                        paragraphs = answer_content.find_all("p")
-                        if paragraphs:
-                            answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
-                        else:
-                            answer_text = answer_content.get_text(" ", strip=True)
-                
-                if question_text:
-                    faqs.append({
-                        "question": question_text,
-                        "answer": answer_text if answer_text else None
-                    })
-            
-            if faqs:
-                content.append({
-                    "questions": faqs
+
+    data["eligibility_admission"] = content
+
+    return data
+
+
+# =====================================================
+# POPULAR EXAMS & IIT SEATS
+# =====================================================
+@section_handler("div", "wikkiContents_chp_section_popularexams_0")
+def handle_popular_exams(popular_div):
+    data = {}
+
+    # 1. Popular Entrance Exams
+    exams_table = popular_div.find("table")
+    exams = []
+    if exams_table:
+        for cols in table_cells(exams_table)[1:]:  # skip header
+            if len(cols) == 3:
+                exams.append({
+                    "exam_name": cols[0].get_text(strip=True),
+                    "exam_dates": cols[1].get_text(strip=True),
+                    "exam_schedule_link": cols[2].find("a")["href"] if cols[2].find("a") else None
                 })
-        
-        # Add the entire content to data dictionary
-        data["popular_specializations"] = content
-
-    # =====================================================
-    # BTECH SYLLABUS & SUBJECTS SECTION
-    # =====================================================
-    syllabus_div = soup.find("section", id="chp_section_coursesyllabus")
-    if syllabus_div:
-        content = []
-        
-        # Main heading
-        main_heading = syllabus_div.find("h2", class_="tbSec2")
-        if main_heading:
-            content.append({
-                "text": main_heading.get_text(" ", strip=True)
-            })
-        
-        # Introductory text
-        intro_p = syllabus_div.find("p", style="text-align: justify;")
-        if intro_p:
+    data["popular_exams"] = exams
+
+    # 2. JEE Main Cutoff
+    cutoff_table = popular_div.find("h3", string=lambda x: x and "JEE Main 2025 Cutoff" in x)
+    cutoff_data = []
+    if cutoff_table:
+        table = cutoff_table.find_next("table")
+        if table:
+            _, cutoff_data = table_records(table, separator="")
+    data["jee_main_cutoff_2025"] = cutoff_data
+
+    # 3. IIT Seats (Delhi, Madras, Bombay)
+    iit_seats = {}
+    for h4 in popular_div.find_all("h4"):
+        if "IIT" in h4.text and "BTech Seats" in h4.text:
+            iit_name = h4.text.replace("BTech Seats","").strip()
+            table = h4.find_next("table")
+            seats = []
+            if table:
+                _, seats = table_records(table, separator="")
+            iit_seats[iit_name] = seats
+    data["iit_btech_seats"] = iit_seats
+
+    return data
+
+
+# =====================================================
+# POPULAR SPECIALIZATIONS SECTION
+# =====================================================
+@section_handler("section", "chp_section_popularspecialization")
+def handle_popular_specializations(popular_specialization_div):
+    data = {}
+
+    content = []
+
+    # Main heading
+    main_heading = popular_specialization_div.find("h2", class_="tbSec2")
+    if main_heading:
+        content.append({
+            "text": main_heading.get_text(" ", strip=True)
+        })
+
+    # Introductory text
+    intro_div = popular_specialization_div.find("div", class_="photo-widget-full")
+    if intro_div:
+        intro_text = intro_div.get_text(" ", strip=True)
+        if intro_text:
             content.append({
-                "text": intro_p.get_text(" ", strip=True)
+                "text": intro_text
             })
-        
-        # Extract all specialization syllabus sections
-        specializations = []
-        
-        # Find all syllabus sections (CSE, Electrical, Mechanical, AI)
-        syllabus_headings = syllabus_div.find_all(["h3", "h2"])
-        for heading in syllabus_headings:
-            heading_text = heading.get_text(" ", strip=True)
-            
-            # Check if this is a specialization syllabus heading
-            if any(keyword in heading_text for keyword in ["BTech CSE Syllabus", "BTech Electrical Engineering Syllabus", 
-                                                          "BTech Mechanical Engineering Syllabus", "BTech in Artificial Intelligence Syllabus",
-                                                          "B Tech Specialization-Wise Syllabus"]):
-                
-                specialization_section = {
-                    "title": heading_text,
-                    "description": "",
-                    "semester_tables": []
-                }
-                
-                # Get description after heading
-                desc_p = heading.find_next("p")
-                if desc_p:
-                    specialization_section["description"] = desc_p.get_text(" ", strip=True)
-                
-                # Get syllabus table after heading
-                table = heading.find_next("table")
-                if table:
-                    # Extract table data without links
-                    table_data = []
-                    
-                    # Process all rows
-                    for row in table.find_all("tr"):
-                        row_data = []
-                        for cell in row.find_all(["td", "th"]):
-                            # Get only text, remove links
-                            cell_text = cell.get_text(" ", strip=True)
-                            row_data.append(cell_text)
-                        
-                        if row_data:  # Only add non-empty rows
-                            table_data.append(row_data)
-                    
-                    if table_data:
-                        specialization_section["semester_tables"] = table_data
-                
-                # Add note if present
-                note_p = heading.find_next("p", string=lambda x: x and "Note -" in x)
-                if note_p:
-                    specialization_section["note"] = note_p.get_text(" ", strip=True)
-                
-                specializations.append(specialization_section)
-        
-        # Add specialization-wise syllabus links as text only
-        links_section = syllabus_div.find("h2", string=lambda x: x and "B Tech Specialization-Wise Syllabus" in x)
-        if links_section:
-            links_table = links_section.find_next("table")
-            if links_table:
-                specialization_links = []
-                
-                # Process all rows
-                rows = links_table.find_all("tr")
-                for row in rows[1:]:  # Skip header row
-                    cols = row.find_all(["td", "th"])
-                    if len(cols) >= 2:
-                        # Get left and right column texts
-                        left_text = cols[0].get_text(" ", strip=True)
-                        right_text = cols[1].get_text(" ", strip=True) if len(cols) > 1 else ""
-                        
-                        if left_text:
-                            specialization_links.append(left_text)
-                        if right_text:
-                            specialization_links.append(right_text)
-                
-                if specialization_links:
-                    content.append({
-                        "title": "Specialization-Wise Syllabus (Text Only)",
-                        "syllabus_list": specialization_links
-                    })
-        
-        # Useful links as text only
-        useful_links_section = syllabus_div.find("p", string=lambda x: x and "Useful Link for B Tech Courses List" in x)
-        if not useful_links_section:
-            useful_links_section = syllabus_div.find("span", string=lambda x: x and "Useful Link for B Tech Courses List" in x)
-        
-        if useful_links_section:
-            useful_links = []
-            
-            # Get the next 2 paragraphs after the heading
-            next_elem = useful_links_section.find_next_sibling()
-            link_count = 0
-            
-            while next_elem and link_count < 2:
-                if next_elem.name == "p":
-                    link_text = next_elem.get_text(" ", strip=True)
-                    if link_text:
-                        useful_links.append(link_text)
-                        link_count += 1
-                next_elem = next_elem.find_next_sibling()
-            
-            if useful_links:
-                content.append({
-                    "title": "Useful Information",
-                    "info_items": useful_links
-                })
-        
-        # FAQs
-        faq_section = syllabus_div.find("div", id="sectional-faqs-0")
-        if faq_section:
-            faqs = []
-            faq_blocks = faq_section.find_all("div", class_="html-0 c5db62 listener")
-            
-            for faq_block in faq_blocks:
-                # Extract question
-                question_spans = faq_block.find_all("span")
-                question_text = None
-                if len(question_spans) >= 2:
-                    question_text = question_spans[1].get_text(" ", strip=True)
-                
-                # Extract answer from next sibling div
-                answer_div = faq_block.find_next_sibling("div", class_="_16f53f")
-                answer_text = ""
-                if answer_div:
-                    answer_content = answer_div.find("div", class_="cmsAContent")
-                    if answer_content:
-                        paragraphs = answer_content.find_all("p")
-                        if paragraphs:
-                            answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
-                        else:
-                            answer_text = answer_content.get_text(" ", strip=True)
-                
-                if question_text:
-                    faqs.append({
-                        "question": question_text,
-                        "answer": answer_text if answer_text else None
-                    })
-            
-            if faqs:
-                content.append({
-                    "questions": faqs
+
+    # Specializations table
+    specializations_table = popular_specialization_div.find("table")
+    if specializations_table:
+        headers, rows_data = table_records(specializations_table)
+
+        content.append({
+            "title": "BTech Specializations and Jobs",
+            "headers": headers,
+            "rows": rows_data
+        })
+
+    # Note text
+    note_p = popular_specialization_div.find("p", string=lambda x: x and "Note" in x)
+    if note_p:
+        content.append({
+            "text": note_p.get_text(" ", strip=True)
+        })
+
+    # Popular specializations list
+    specialization_box = popular_specialization_div.find("div", class_="specialization-box")
+    if specialization_box:
+        specializations_list = []
+        for li in specialization_box.find_all("li"):
+            link = li.find("a", href=True)
+            college_count = li.find("p")
+
+            if link:
+                specializations_list.append({
+                    "specialization": link.get_text(strip=True),
+                    "college_count": college_count.get_text(strip=True) if college_count else None
                 })
-        
-        # Add specializations to content
-        if specializations:
-            content.append({
-                "title": "BTech Syllabus by Specialization",
-                "specializations": specializations
-            })
-        
-        # Add the entire content to data dictionary
-        data["btech_syllabus"] = content
-
-    # =====================================================
-    # BTECH SALARY & CAREER SCOPE SECTION (NEW SECTION ADDED)
-    # =====================================================
-    salary_div = soup.find("section", id="chp_section_salary")
-    if salary_div:
-        content = []
-        
-        # Main heading
-        main_heading = salary_div.find("h2", class_="tbSec2")
-        if main_heading:
+
+        if specializations_list:
             content.append({
-                "text": main_heading.get_text(" ", strip=True)
+                "title": "Popular Specializations by College Count",
+                "specializations": specializations_list
             })
-        
-        # Introductory paragraph
-        intro_p = salary_div.find("p", string=lambda x: x and "BTech is one of the most popular courses" in x)
-        if intro_p:
+
+    # FAQs
+    faq_section = popular_specialization_div.find("div", id="sectional-faqs-0")
+    if faq_section:
+        faqs = []
+        faq_blocks = faq_section.find_all("div", class_="html-0 c5db62 listener")
+
+        for faq_block in faq_blocks:
+            # Extract question
+            question_spans = faq_block.find_all("span")
+            question_text = None
+            if len(question_spans) >= 2:
+                question_text = question_spans[1].get_text(" ", strip=True)
+
+            # Extract answer from next sibling div
+            answer_div = faq_block.find_next_sibling("div", class_="_16f53f")
+            answer_text = ""
+            if answer_div:
+                answer_content = answer_div.find("div", class_="cmsAContent")
+                if answer_content:
+                    paragraphs = answer_content.find_all("p")
+                    if paragraphs:
+                        answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
+                    else:
+                        answer_text = answer_content.get_text(" ", strip=True)
+
+            if question_text:
+                faqs.append({
+                    "question": question_text,
+                    "answer": answer_text if answer_text else None
+                })
+
+        if faqs:
             content.append({
-                "text": intro_p.get_text(" ", strip=True)
+                "questions": faqs
             })
-        
-        # B Tech Salary and Jobs in India section
-        salary_jobs_heading = salary_div.find("h3", string=lambda x: x and "B Tech Salary and Jobs in India" in x)
-        if salary_jobs_heading:
-            salary_section = {
-                "title": salary_jobs_heading.get_text(" ", strip=True),
-                "description": "",
-                "industry_jobs": []
-            }
-            
-            # Get description after heading
-            next_elem = salary_jobs_heading.find_next_sibling()
-            description_parts = []
-            while next_elem and next_elem.name != "h4":
-                if next_elem.name == "p":
-                    description_parts.append(next_elem.get_text(" ", strip=True))
-                next_elem = next_elem.find_next_sibling()
-            
-            if description_parts:
-                salary_section["description"] = " ".join(description_parts)
-            
-            content.append(salary_section)
-        
-        # Extract all industry job tables
-        industry_sections = []
-        
-        # Find all industry job sections (IT & Software, Automotive, Aerospace, etc.)
-        industry_headings = salary_div.find_all("h4")
-        for heading in industry_headings:
-            heading_text = heading.get_text(" ", strip=True)
-            
-            if any(keyword in heading_text for keyword in ["IT & Software", "Automotive", "Aerospace", 
-                                                         "Electrical & Electronics", "Mechanical", "Civil"]):
-                industry_section = {
-                    "industry": heading_text.replace("B Tech Jobs", "").replace("BTech Jobs", "").strip(),
-                    "description": "",
-                    "job_profiles": []
-                }
-                
-                # Get description after heading
-                desc_p = heading.find_next("p")
-                if desc_p:
-                    industry_section["description"] = desc_p.get_text(" ", strip=True)
-                
-                # Get job table after heading
-                table = heading.find_next("table")
-                if table:
-                    # Extract table headers
-                    headers = []
-                    header_row = table.find("tr")
-                    if header_row:
-                        for th in header_row.find_all(["th", "td"]):
-                            headers.append(th.get_text(" ", strip=True))
-                    
-                    # Extract job profiles data
-                    rows = table.find_all("tr")[1:]  # Skip header row
-                    for row in rows:
-                        cols = row.find_all(["td", "th"])
-                        if len(cols) >= 3:
-                            job_profile = {
-                                "job_profile": cols[0].get_text(" ", strip=True),
-                                "job_description": cols[1].get_text(" ", strip=True),
-                                "average_salary": cols[2].get_text(" ", strip=True)
-                            }
-                            industry_section["job_profiles"].append(job_profile)
-                
-                # Add note if present
-                note_p = heading.find_next("p", string=lambda x: x and "Note -" in x)
-                if note_p:
-                    industry_section["note"] = note_p.get_text(" ", strip=True)
-                
-                industry_sections.append(industry_section)
-        
-        # BTech Courses Top Recruiters section
-        recruiters_heading = salary_div.find("h3", string=lambda x: x and "BTech Courses Top Recruiters" in x)
-        if recruiters_heading:
-            recruiters_section = {
-                "title": recruiters_heading.get_text(" ", strip=True),
+
+    # Add the entire content to data dictionary
+    data["popular_specializations"] = content
+
+    return data
+
+
+# =====================================================
+# BTECH SYLLABUS & SUBJECTS SECTION
+# =====================================================
+@section_handler("section", "chp_section_coursesyllabus")
+def handle_syllabus(syllabus_div):
+    data = {}
+
+    content = []
+
+    # Main heading
+    main_heading = syllabus_div.find("h2", class_="tbSec2")
+    if main_heading:
+        content.append({
+            "text": main_heading.get_text(" ", strip=True)
+        })
+
+    # Introductory text
+    intro_p = syllabus_div.find("p", style="text-align: justify;")
+    if intro_p:
+        content.append({
+            "text": intro_p.get_text(" ", strip=True)
+        })
+
+    # Extract all specialization syllabus sections
+    specializations = []
+
+    # Find all syllabus sections (CSE, Electrical, Mechanical, AI)
+    syllabus_headings = syllabus_div.find_all(["h3", "h2"])
+    for heading in syllabus_headings:
+        heading_text = heading.get_text(" ", strip=True)
+
+        # Check if this is a specialization syllabus heading
+        if any(keyword in heading_text for keyword in ["BTech CSE Syllabus", "BTech Electrical Engineering Syllabus", 
+                                                      "BTech Mechanical Engineering Syllabus", "BTech in Artificial Intelligence Syllabus",
+                                                      "B Tech Specialization-Wise Syllabus"]):
+
+            specialization_section = {
+                "title": heading_text,
                 "description": "",
-                "recruiters_table": []
+                "semester_tables": []
             }
-            
+
             # Get description after heading
-            desc_p = recruiters_heading.find_next("p")
+            desc_p = heading.find_next("p")
             if desc_p:
-                recruiters_section["description"] = desc_p.get_text(" ", strip=True)
-            
-#             # Get recruiters table
-            table = recruiters_heading.find_next("table")
+                specialization_section["description"] = desc_p.get_text(" ", strip=True)
+
+            # Get syllabus table after heading
+            table = heading.find_next("table")
             if table:
-                table_data = []
-                rows = table.find_all("tr")
-                for row in rows:
-                    row_data = []
-                    for cell in row.find_all(["td", "th"]):
-                        row_data.append(cell.get_text(" ", strip=True))
-                    if row_data:
-                        table_data.append(row_data)
-                
-                recruiters_section["recruiters_table"] = table_data
-            
+                # Text only, links dropped
+                table_data = table_rows(table)
+
+                if table_data:
+                    specialization_section["semester_tables"] = table_data
+
             # Add note if present
-            note_p = recruiters_heading.find_next("p", string=lambda x: x and "Note -" in x)
+            note_p = heading.find_next("p", string=lambda x: x and "Note -" in x)
             if note_p:
-                recruiters_section["note"] = note_p.get_text(" ", strip=True)
-            
-            content.append(recruiters_section)
-        
-        # BTech Placements in India section
-        placements_heading = salary_div.find("h3", string=lambda x: x and "BTech Placements in India" in x)
-        if placements_heading:
-            placements_section = {
-                "title": placements_heading.get_text(" ", strip=True),
+                specialization_section["note"] = note_p.get_text(" ", strip=True)
+
+            specializations.append(specialization_section)
+
+    # Add specialization-wise syllabus links as text only
+    links_section = syllabus_div.find("h2", string=lambda x: x and "B Tech Specialization-Wise Syllabus" in x)
+    if links_section:
+        links_table = links_section.find_next("table")
+        if links_table:
+            specialization_links = []
+
+            for cols in table_rows(links_table)[1:]:  # Skip header row
+                # Every non-empty cell, left to right
+                specialization_links.extend(text for text in cols if text)
+
+            if specialization_links:
+                content.append({
+                    "title": "Specialization-Wise Syllabus (Text Only)",
+                    "syllabus_list": specialization_links
+                })
+
+    # Useful links as text only
+    useful_links_section = syllabus_div.find("p", string=lambda x: x and "Useful Link for B Tech Courses List" in x)
+    if not useful_links_section:
+        useful_links_section = syllabus_div.find("span", string=lambda x: x and "Useful Link for B Tech Courses List" in x)
+
+    if useful_links_section:
+        useful_links = []
+
+        # Get the next 2 paragraphs after the heading
+        next_elem = useful_links_section.find_next_sibling()
+        link_count = 0
+
+        while next_elem and link_count < 2:
+            if next_elem.name == "p":
+                link_text = next_elem.get_text(" ", strip=True)
+                if link_text:
+                    useful_links.append(link_text)
+                    link_count += 1
+            next_elem = next_elem.find_next_sibling()
+
+        if useful_links:
+            content.append({
+                "title": "Useful Information",
+                "info_items": useful_links
+            })
+
+    # FAQs
+    faq_section = syllabus_div.find("div", id="sectional-faqs-0")
+    if faq_section:
+        faqs = []
+        faq_blocks = faq_section.find_all("div", class_="html-0 c5db62 listener")
+
+        for faq_block in faq_blocks:
+            # Extract question
+            question_spans = faq_block.find_all("span")
+            question_text = None
+            if len(question_spans) >= 2:
+                question_text = question_spans[1].get_text(" ", strip=True)
+
+            # Extract answer from next sibling div
+            answer_div = faq_block.find_next_sibling("div", class_="_16f53f")
+            answer_text = ""
+            if answer_div:
+                answer_content = answer_div.find("div", class_="cmsAContent")
+                if answer_content:
+                    paragraphs = answer_content.find_all("p")
+                    if paragraphs:
+                        answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
+                    else:
+                        answer_text = answer_content.get_text(" ", strip=True)
+
+            if question_text:
+                faqs.append({
+                    "question": question_text,
+                    "answer": answer_text if answer_text else None
+                })
+
+        if faqs:
+            content.append({
+                "questions": faqs
+            })
+
+    # Add specializations to content
+    if specializations:
+        content.append({
+            "title": "BTech Syllabus by Specialization",
+            "specializations": specializations
+        })
+
+    # Add the entire content to data dictionary
+    data["btech_syllabus"] = content
+
+    return data
+
+
+# =====================================================
+# BTECH SALARY & CAREER SCOPE SECTION (NEW SECTION ADDED)
+# =====================================================
+@section_handler("section", "chp_section_salary")
+def handle_salary(salary_div):
+    data = {}
+
+    content = []
+
+    # Main heading
+    main_heading = salary_div.find("h2", class_="tbSec2")
+    if main_heading:
+        content.append({
+            "text": main_heading.get_text(" ", strip=True)
+        })
+
+    # Introductory paragraph
+    intro_p = salary_div.find("p", string=lambda x: x and "BTech is one of the most popular courses" in x)
+    if intro_p:
+        content.append({
+            "text": intro_p.get_text(" ", strip=True)
+        })
+
+    # B Tech Salary and Jobs in India section
+    salary_jobs_heading = salary_div.find("h3", string=lambda x: x and "B Tech Salary and Jobs in India" in x)
+    if salary_jobs_heading:
+        salary_section = {
+            "title": salary_jobs_heading.get_text(" ", strip=True),
+            "description": "",
+            "industry_jobs": []
+        }
+
+        # Get description after heading
+        next_elem = salary_jobs_heading.find_next_sibling()
+        description_parts = []
+        while next_elem and next_elem.name != "h4":
+            if next_elem.name == "p":
+                description_parts.append(next_elem.get_text(" ", strip=True))
+            next_elem = next_elem.find_next_sibling()
+
+        if description_parts:
+            salary_section["description"] = " ".join(description_parts)
+
+        content.append(salary_section)
+
+    # Extract all industry job tables
+    industry_sections = []
+
+    # Find all industry job sections (IT & Software, Automotive, Aerospace, etc.)
+    industry_headings = salary_div.find_all("h4")
+    for heading in industry_headings:
+        heading_text = heading.get_text(" ", strip=True)
+
+        if any(keyword in heading_text for keyword in ["IT & Software", "Automotive", "Aerospace", 
+                                                     "Electrical & Electronics", "Mechanical", "Civil"]):
+            industry_section = {
+                "industry": heading_text.replace("B Tech Jobs", "").replace("BTech Jobs", "").strip(),
                 "description": "",
-                "placements_table": []
+                "job_profiles": []
             }
-            
+
             # Get description after heading
-            desc_p = placements_heading.find_next("p")
+            desc_p = heading.find_next("p")
             if desc_p:
-                placements_section["description"] = desc_p.get_text(" ", strip=True)
-            
-            # Get placements table
-            table = placements_heading.find_next("table")
+                industry_section["description"] = desc_p.get_text(" ", strip=True)
+
+            # Get job table after heading
+            table = heading.find_next("table")
             if table:
-                table_data = []
-                rows = table.find_all("tr")
-                for row in rows:
-                    row_data = []
-                    for cell in row.find_all(["td", "th"]):
-                        row_data.append(cell.get_text(" ", strip=True))
-                    if row_data:
-                        table_data.append(row_data)
-                
-                placements_section["placements_table"] = table_data
-            
+                # Extract job profiles data
+                industry_section["job_profiles"].extend(
+                    named_records(table_rows(table)[1:], JOB_PROFILE_COLUMNS)  # Skip header row
+                )
+
             # Add note if present
-            note_p = placements_heading.find_next("p", string=lambda x: x and "Note -" in x)
+            note_p = heading.find_next("p", string=lambda x: x and "Note -" in x)
             if note_p:
-                placements_section["note"] = note_p.get_text(" ", strip=True)
-            
-            content.append(placements_section)
-        
-        # Useful links as text only
-        useful_links_heading = salary_div.find("p", string=lambda x: x and "Useful Links for B Tech Scope" in x)
-        if not useful_links_heading:
-            useful_links_heading = salary_div.find("span", string=lambda x: x and "Useful Links for B Tech Scope" in x)
-        
-        if useful_links_heading:
-            useful_links = []
-            
-            # Get the next 2 paragraphs after the heading
-            next_elem = useful_links_heading.find_next_sibling()
-            link_count = 0
-            
-            while next_elem and link_count < 2:
-                if next_elem.name == "p":
-                    link_text = next_elem.get_text(" ", strip=True)
-                    if link_text:
-                        useful_links.append(link_text)
-                        link_count += 1
-                next_elem = next_elem.find_next_sibling()
-            
-            if useful_links:
-                content.append({
-                    "title": "Useful Links for B Tech Scope",
-                    "info_items": useful_links
-                })
-        
-        # Helpful links as text only
-        helpful_links_heading = salary_div.find("p", string=lambda x: x and "Helpful Links for Jobs for BTech Freshers" in x)
-        if not helpful_links_heading:
-            helpful_links_heading = salary_div.find("span", string=lambda x: x and "Helpful Links for Jobs for BTech Freshers" in x)
-        
-        if helpful_links_heading:
-            helpful_links = []
-            
-            # Get the next 2 paragraphs after the heading
-            next_elem = helpful_links_heading.find_next_sibling()
-            link_count = 0
-            
-            while next_elem and link_count < 2:
-                if next_elem.name == "p":
-                    link_text = next_elem.get_text(" ", strip=True)
-                    if link_text:
-                        helpful_links.append(link_text)
-                        link_count += 1
-                next_elem = next_elem.find_next_sibling()
-            
-            if helpful_links:
-                content.append({
-                    "title": "Helpful Links for BTech Freshers Jobs",
-                    "info_items": helpful_links
-                })
-        
-        # YouTube video iframe
-        youtube_iframe = salary_div.find("iframe")
-        if youtube_iframe and "youtube.com" in youtube_iframe.get("src", ""):
+                industry_section["note"] = note_p.get_text(" ", strip=True)
+
+            industry_sections.append(industry_section)
+
+    # BTech Courses Top Recruiters section
+    recruiters_heading = salary_div.find("h3", string=lambda x: x and "BTech Courses Top Recruiters" in x)
+    if recruiters_heading:
+        recruiters_section = {
+            "title": recruiters_heading.get_text(" ", strip=True),
+            "description": "",
+            "recruiters_table": []
+        }
+
+        # Get description after heading
+        desc_p = recruiters_heading.find_next("p")
+        if desc_p:
+            recruiters_section["description"] = desc_p.get_text(" ", strip=True)
+
+#             # Get recruiters table
+        table = recruiters_heading.find_next("table")
+        if table:
+            recruiters_section["recruiters_table"] = table_rows(table)
+
+        # Add note if present
+        note_p = recruiters_heading.find_next("p", string=lambda x: x and "Note -" in x)
+        if note_p:
+            recruiters_section["note"] = note_p.get_text(" ", strip=True)
+
+        content.append(recruiters_section)
+
+    # BTech Placements in India section
+    placements_heading = salary_div.find("h3", string=lambda x: x and "BTech Placements in India" in x)
+    if placements_heading:
+        placements_section = {
+            "title": placements_heading.get_text(" ", strip=True),
+            "description": "",
+            "placements_table": []
+        }
+
+        # Get description after heading
+        desc_p = placements_heading.find_next("p")
+        if desc_p:
+            placements_section["description"] = desc_p.get_text(" ", strip=True)
+
+        # Get placements table
+        table = placements_heading.find_next("table")
+        if table:
+            placements_section["placements_table"] = table_rows(table)
+
+        # Add note if present
+        note_p = placements_heading.find_next("p", string=lambda x: x and "Note -" in x)
+        if note_p:
+            placements_section["note"] = note_p.get_text(" ", strip=True)
+
+        content.append(placements_section)
+
+    # Useful links as text only
+    useful_links_heading = salary_div.find("p", string=lambda x: x and "Useful Links for B Tech Scope" in x)
+    if not useful_links_heading:
+        useful_links_heading = salary_div.find("span", string=lambda x: x and "Useful Links for B Tech Scope" in x)
+
+    if useful_links_heading:
+        useful_links = []
+
+        # Get the next 2 paragraphs after the heading
+        next_elem = useful_links_heading.find_next_sibling()
+        link_count = 0
+
+        while next_elem and link_count < 2:
+            if next_elem.name == "p":
+                link_text = next_elem.get_text(" ", strip=True)
+                if link_text:
+                    useful_links.append(link_text)
+                    link_count += 1
+            next_elem = next_elem.find_next_sibling()
+
+        if useful_links:
             content.append({
-                "title": youtube_iframe.get("title", "Tips to Find Job as a Fresh BTech graduate"),
-                "src": youtube_iframe["src"],
-                "width": youtube_iframe.get("width", "560"),
-                "height": youtube_iframe.get("height", "315")
+                "title": "Useful Links for B Tech Scope",
+                "info_items": useful_links
             })
-        
-        # FAQs
-        faq_section = salary_div.find("div", id="sectional-faqs-0")
-        if faq_section:
-            faqs = []
-            faq_blocks = faq_section.find_all("div", class_="html-0 c5db62 listener")
-            
-            for faq_block in faq_blocks:
-                # Extract question
-                question_spans = faq_block.find_all("span")
-                question_text = None
-                if len(question_spans) >= 2:
-                    question_text = question_spans[1].get_text(" ", strip=True)
-                
-                # Extract answer from next sibling div
-                answer_div = faq_block.find_next_sibling("div", class_="_16f53f")
-                answer_text = ""
-                if answer_div:
-                    answer_content = answer_div.find("div", class_="cmsAContent")
-                    if answer_content:
-                        paragraphs = answer_content.find_all("p")
-                        if paragraphs:
-                            answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
-                        else:
-                            answer_text = answer_content.get_text(" ", strip=True)
-                    
-                    # Extract tables from answer if any
-                    answer_tables = []
-                    for table in answer_div.find_all("table"):
-                        table_data = []
-                        rows = table.find_all("tr")
-                        for row in rows:
-                            row_data = []
-                            for cell in row.find_all(["td", "th"]):
-                                row_data.append(cell.get_text(" ", strip=True))
-                            if row_data:
-                                table_data.append(row_data)
-                        
-                        if table_data:
-                            answer_tables.append(table_data)
-                
-                if question_text:
-                    faq_item = {
-                        "question": question_text,
-                        "answer": answer_text if answer_text else None
-                    }
-                    
-                    if answer_tables:
-                        faq_item["tables"] = answer_tables
-                    
-                    faqs.append(faq_item)
-            
-            if faqs:
-                content.append({
-                    "questions": faqs
-                })
-        
-        # Add industry sections to content
-        if industry_sections:
+
+    # Helpful links as text only
+    helpful_links_heading = salary_div.find("p", string=lambda x: x and "Helpful Links for Jobs for BTech Freshers" in x)
+    if not helpful_links_heading:
+        helpful_links_heading = salary_div.find("span", string=lambda x: x and "Helpful Links for Jobs for BTech Freshers" in x)
+
+    if helpful_links_heading:
+        helpful_links = []
+
+        # Get the next 2 paragraphs after the heading
+        next_elem = helpful_links_heading.find_next_sibling()
+        link_count = 0
+
+        while next_elem and link_count < 2:
+            if next_elem.name == "p":
+                link_text = next_elem.get_text(" ", strip=True)
+                if link_text:
+                    helpful_links.append(link_text)
+                    link_count += 1
+            next_elem = next_elem.find_next_sibling()
+
+        if helpful_links:
             content.append({
-                "title": "Industry-wise BTech Jobs and Salaries",
-                "industries": industry_sections
+                "title": "Helpful Links for BTech Freshers Jobs",
+                "info_items": helpful_links
             })
-        
-        # Add the entire content to data dictionary
-        data["btech_salary_career"] = content
+
+    # YouTube video iframe
+    youtube_iframe = salary_div.find("iframe")
+    if youtube_iframe and "youtube.com" in youtube_iframe.get("src", ""):
+        content.append({
+            "title": youtube_iframe.get("title", "Tips to Find Job as a Fresh BTech graduate"),
+            "src": youtube_iframe["src"],
+            "width": youtube_iframe.get("width", "560"),
+            "height": youtube_iframe.get("height", "315")
+        })
+
+    # FAQs
+    faq_section = salary_div.find("div", id="sectional-faqs-0")
+    if faq_section:
+        faqs = []
+        faq_blocks = faq_section.find_all("div", class_="html-0 c5db62 listener")
+
+        for faq_block in faq_blocks:
+            # Extract question
+            question_spans = faq_block.find_all("span")
+            question_text = None
+            if len(question_spans) >= 2:
+                question_text = question_spans[1].get_text(" ", strip=True)
+
+            # Extract answer from next sibling div
+            answer_div = faq_block.find_next_sibling("div", class_="_16f53f")
+            answer_text = ""
+            if answer_div:
+                answer_content = answer_div.find("div", class_="cmsAContent")
+                if answer_content:
+                    paragraphs = answer_content.find_all("p")
+                    if paragraphs:
+                        answer_text = " ".join(p.get_text(" ", strip=True) for p in paragraphs)
+                    else:
+                        answer_text = answer_content.get_text(" ", strip=True)
+
+                # Extract tables from answer if any
+                answer_tables = []
+                for table in answer_div.find_all("table"):
+                    table_data = table_rows(table)
+                    if table_data:
+                        answer_tables.append(table_data)
+
+            if question_text:
+                faq_item = {
+                    "question": question_text,
+                    "answer": answer_text if answer_text else None
+                }
+
+                if answer_tables:
+                    faq_item["tables"] = answer_tables
+
+                faqs.append(faq_item)
+
+        if faqs:
+            content.append({
+                "questions": faqs
+            })
+
+    # Add industry sections to content
+    if industry_sections:
+        content.append({
+            "title": "Industry-wise BTech Jobs and Salaries",
+            "industries": industry_sections
+        })
+
+    # Add the entire content to data dictionary
+    data["btech_salary_career"] = content
 
     return data
 
 
-def extract_popular_data(driver):
-    driver.get(PCOMBA_P_URL)
-    time.sleep(5)
-    wait = WebDriverWait(driver, 15)
+def extract_course_data(html):
+    soup = make_soup(html)
+    data = {}
+
+    # -------------------------------
+    # Course Name
+    course_name_div = soup.find("div", class_="a54c")
+    if course_name_div:
+        h1 = course_name_div.find("h1")
+        data["title"] = h1.text.strip() if h1 else None
+
+    # -------------------------------
+    # Updated date
+    updated_div = soup.find("div", string=lambda x: x and "Updated on" in x)
+    if updated_div:
+        span = updated_div.find("span")
+        data["updated_on"] = span.text.strip() if span else None
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+    # -------------------------------
+    # Author info
+    author_block = soup.find("div", class_="be8c")
+    if author_block:
+        data["author"] = {
+            "name": author_block.find("a").text.strip() if author_block.find("a") else None,
+            "profile": author_block.find("a")["href"] if author_block.find("a") else None,
+            "image": author_block.find("img")["src"] if author_block.find("img") else None,
+            "role": author_block.find("span", class_="b0fc").text.strip() if author_block.find("span", class_="b0fc") else None,
+            "verified": True if author_block.find("i", class_="tickIcon") else False
+        }
+
+    # Single pass: collect every chp_section_* container in one sweep of
+    # the document, then hand each subtree to its registered handler
+    containers = {}
+    for element in soup.find_all(["section", "div"], id=SECTION_ID_RE):
+        containers.setdefault((element.name, element["id"]), element)
+
+    for tag, container_id, handler in SECTION_HANDLERS:
+        container = containers.get((tag, container_id))
+        if container is not None:
+            with metrics.timer(SCRAPE_METRICS, "scrape_section_seconds", section=handler.__name__):
+                data.update(handler(container))
+
+    return data
+
+
+def extract_popular_data(html):
+    soup = make_soup(html)
     data = {}
 
     main = soup.find("div", id="EdContent_categoryPage")
@@ -886,19 +1431,7 @@ def extract_popular_data(driver):
 
             # Table
             elif sibling.name == "table":
-                table_data = []
-                rows = sibling.find_all("tr")
-
-                headers = [th.get_text(strip=True) for th in rows[0].find_all("th")]
-
-                for row in rows[1:]:
-                    cols = row.find_all("td")
-                    if len(cols) == len(headers):
-                        row_data = {
-                            headers[i]: cols[i].get_text(" ", strip=True)
-                            for i in range(len(headers))
-                        }
-                        table_data.append(row_data)
+                _, table_data = table_records(sibling, header_separator="")
 
                 section["content"].append({
                    
@@ -927,17 +1460,8 @@ def extract_popular_data(driver):
 
     return data
 
-def scrape_shiksha_qa(driver):
-    driver.get(PCOMBA_QN_URL)
-    try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.post-col[questionid][answerid][type='Q']"))
-        )
-    except:
-        print("No Q&A blocks loaded!")
-        return {}
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def scrape_shiksha_qa(html):
+    soup = make_soup(html)
 
     result = {
         "tag_name": None,
@@ -966,8 +1490,15 @@ def scrape_shiksha_qa(driver):
             result["stats"][key] = value
 
     questions_dict = {}
+    seen_posts = set()
 
     for post in soup.select("div.post-col[questionid][answerid][type='Q']"):
+        # Infinite scroll can render the same post twice
+        post_id = (post.get("questionid"), post.get("answerid"))
+        if post_id in seen_posts:
+            continue
+        seen_posts.add(post_id)
+
         q_text_el = post.select_one("div.dtl-qstn .wikkiContents")
         if not q_text_el:
             continue
@@ -1003,11 +1534,13 @@ def scrape_shiksha_qa(driver):
         # Group by question
         if question_text not in questions_dict:
             questions_dict[question_text] = {
+                "questionid": post_id[0],
                 "tags": tags,
                 "followers": followers,
                 "answers": []
             }
         questions_dict[question_text]["answers"].append({
+            "answerid": post_id[1],
             "author": {"name": author_name, "profile_url": author_url},
             "answer_text": answer_text,
             "upvotes": upvotes,
@@ -1018,6 +1551,7 @@ def scrape_shiksha_qa(driver):
     # Convert dict to list
     for q_text, data in questions_dict.items():
         result["questions"].append({
+            "questionid": data["questionid"],
             "question_text": q_text,
             "tags": data["tags"],
             "followers": data["followers"],
@@ -1027,9 +1561,8 @@ def scrape_shiksha_qa(driver):
     return result
 
 
-def scrape_tag_cta_D_block(driver):
-    driver.get(PCOMBA_QND_URL)
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def scrape_tag_cta_D_block(html):
+    soup = make_soup(html)
 
     result = {
         "questions": []  # store all Q&A and discussion blocks
@@ -1037,10 +1570,18 @@ def scrape_tag_cta_D_block(driver):
 
     # Scrape all Q&A and discussion blocks
     qa_blocks = soup.select("div.post-col[questionid][answerid][type='Q'], div.post-col[questionid][answerid][type='D']")
+    seen_posts = set()
     for block in qa_blocks:
+        post_id = (block.get("questionid"), block.get("answerid"))
+        if post_id in seen_posts:
+            continue
+        seen_posts.add(post_id)
+
         block_type = block.get("type", "Q")
         qa_data = {
-          
+            "questionid": post_id[0],
+            "answerid": post_id[1],
+            "type": block_type,
             "posted_time": None,
             "tags": [],
             "question_text": None,
@@ -1107,34 +1648,498 @@ def scrape_tag_cta_D_block(driver):
 
 
     
-def scrape_mba_colleges():
-    driver = create_driver()
+# Page kind -> extractor taking that page's HTML
+PAGES = {
+    "overviews": extract_course_data,
+    "popular_college": extract_popular_data,
+    "QA": scrape_shiksha_qa,
+    "QAD": scrape_tag_cta_D_block,
+}
+
+
+# 🔹 Course config
+# COURSES_FILE maps each course key (the top-level key in the output) to
+# its pages:
+#   chp         course home page            → overviews
+#   category    college listing page        → popular_college
+#   tag         Q&A tag page                → QA
+#   discussion  optional, defaults to the tag page's discussion tab → QAD
+def course_pages(course):
+    tag = course["tag"]
+    return {
+        "overviews": course["chp"],
+        "popular_college": course["category"],
+        "QA": tag,
+        "QAD": course.get("discussion") or tag + ("&" if "?" in tag else "?") + "type=discussion",
+    }
+
+
+# Returns {course key: {page kind: url}}
+def load_courses(path=None):
+    path = path or COURSES_FILE
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    courses = {}
+    for course_key, course in config.items():
+        missing = [key for key in ("chp", "category", "tag") if not course.get(key)]
+        if missing:
+            raise ValueError(f"{path}: course {course_key} is missing {', '.join(missing)}")
+        courses[course_key] = course_pages(course)
+        for kind, url in courses[course_key].items():
+            PAGE_KINDS[url] = kind
+    return courses
+
+
+# Crawled pages keep the posts earlier runs collected
+PAGE_MERGE = {
+    "QA": merge_qa,
+    "QAD": merge_qad,
+}
+
+
+# ---------------- PARALLEL SCRAPE ----------------
+# Bounded driver pool: at most `size` browsers exist at once, a driver is
+# reused by the next page once its current page is done. Drivers are only
+# started when a page actually needs the browser.
+_warm_pool = None
+
+
+def make_driver_pool(size):
+    return {
+        "size": size,
+        "idle": queue.Queue(),
+        "all": [],
+        "starting": 0,
+        "lock": threading.Lock(),
+        "stats": {"cold": 0, "warm": 0},
+    }
+
+
+def get_driver_pool(size):
+    global _warm_pool
+
+    if not KEEP_WARM:
+        return make_driver_pool(size)
 
-      
+    if _warm_pool is None:
+        _warm_pool = make_driver_pool(size)
+    else:
+        _warm_pool["size"] = max(_warm_pool["size"], size)
+    return _warm_pool
 
+
+def driver_alive(driver):
     try:
-       data = {
-              "Distance_BTech":{
-                   "overviews":extract_course_data(driver),
-                   "popular_college":extract_popular_data(driver),
-                    "QAN":{
-                        "QA":scrape_shiksha_qa(driver),
-                        "QAD":scrape_tag_cta_D_block(driver),
-                    }
-                   }
-                }
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+def acquire_driver(pool):
+    pool_full = False
+    while True:
+        try:
+            if pool_full:
+                # Wait for a driver to come back (or a slot to free up
+                # if a broken one gets discarded)
+                driver = pool["idle"].get(timeout=1)
+            else:
+                driver = pool["idle"].get_nowait()
+        except queue.Empty:
+            driver = None
+
+        if driver is not None:
+            # Warm drivers may have died while sitting idle
+            if driver_alive(driver):
+                pool["stats"]["warm"] += 1
+                return driver
+            release_driver(pool, driver, healthy=False)
+            continue
 
-    finally:
+        with pool["lock"]:
+            can_start = len(pool["all"]) + pool["starting"] < pool["size"]
+            if can_start:
+                pool["starting"] += 1
+
+        if can_start:
+            # Launch outside the lock so workers start browsers in parallel
+            try:
+                driver = create_driver()
+            finally:
+                with pool["lock"]:
+                    pool["starting"] -= 1
+            with pool["lock"]:
+                pool["all"].append(driver)
+            pool["stats"]["cold"] += 1
+            return driver
+
+        pool_full = True
+
+
+def release_driver(pool, driver, healthy=True):
+    if healthy:
+        pool["idle"].put(driver)
+        return
+
+    # A page that blew up may leave the browser in a bad state
+    with pool["lock"]:
+        if driver in pool["all"]:
+            pool["all"].remove(driver)
+    try:
         driver.quit()
-    
+    except Exception:
+        pass
+
+
+# Start browsers ahead of time so the first pages get a warm driver
+def prewarm_driver_pool(pool, count=None):
+    count = min(count or pool["size"], pool["size"])
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        drivers = list(executor.map(lambda _: acquire_driver(pool), range(count)))
+    for driver in drivers:
+        release_driver(pool, driver)
+    pool["stats"] = {"cold": 0, "warm": 0}
+
+
+def close_driver_pool(pool):
+    global _warm_pool
+
+    with pool["lock"]:
+        drivers, pool["all"] = pool["all"], []
+    while not pool["idle"].empty():
+        pool["idle"].get_nowait()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    if pool is _warm_pool:
+        _warm_pool = None
+
+
+# Warm browsers outlive scrape_mba_colleges(); quit them when the process ends
+@atexit.register
+def close_warm_pool():
+    if _warm_pool is not None:
+        close_driver_pool(_warm_pool)
+
+
+def print_driver_summary(pool):
+    stats = pool["stats"]
+    if not stats["cold"] and not stats["warm"]:
+        return
+    launches = DRIVER_STARTUPS[-stats["cold"]:] if stats["cold"] else []
+    launch_time = sum(entry["resolve_seconds"] + entry["launch_seconds"] for entry in launches)
+    print(
+        f"🚗 Drivers: {stats['cold']} cold start(s) ({launch_time:.2f}s), "
+        f"{stats['warm']} warm reuse(s)"
+    )
+
+
+# ---------------- INCREMENTAL SCRAPE ----------------
+# The manifest remembers, per URL: when we fetched it, a hash of the raw
+# HTML, HTTP validators and a hash per extracted section. A page whose HTML
+# (or 304) says it's unchanged reuses last run's output instead of being
+# re-extracted, and section hashes tell us exactly what changed.
+MANIFEST_FILE = "scrape_manifest.json"
+REPORT_FILE = "scrape_report.json"
+
+# page name -> {section: "added" | "changed" | "unchanged" | "removed"} for the current run
+SCRAPE_REPORT = {}
+
+
+def content_hash(value):
+    if not isinstance(value, (str, bytes)):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return hashlib.sha256(value).hexdigest()
+
+
+def section_hashes(result):
+    if not isinstance(result, dict):
+        return {}
+    return {key: content_hash(value) for key, value in result.items()}
+
+
+def compare_sections(old_hashes, new_hashes):
+    report = {}
+    for key, digest in new_hashes.items():
+        if key not in old_hashes:
+            report[key] = "added"
+        else:
+            report[key] = "unchanged" if old_hashes[key] == digest else "changed"
+    for key in old_hashes:
+        if key not in new_hashes:
+            report[key] = "removed"
+    return report
+
+
+def load_json_file(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json_atomic(path, data, indent=2):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+# Fetch step of a page job, retried by the orchestrator on transient errors.
+# Validators are only sent when there is a real extraction to fall back on:
+# an empty previous result (e.g. a page that failed on an older version)
+# must be fetched and extracted again.
+def fetch_page_job(pool, url, previous=None, entry=None, merge=None):
+    return fetch_page(
+        pool, url,
+        entry if previous else None,
+        post_ids(previous) if merge else None
+    )
+
+
+# Extract step. Returns (result, manifest entry). `previous` is last run's
+# output for this page, `entry` its manifest entry; both None on a first run.
+# An empty `previous` is never reused, the page is extracted again.
+def extract_page_job(page, url, extractor, previous=None, entry=None, merge=None):
+    entry = entry or {}
+    html_hash = entry.get("html_sha256") if page["not_modified"] else content_hash(page["html"])
+    if CAPTURE_HTML and not page["not_modified"]:
+        html_store.save_page(url, page["html"])
+    if previous and html_hash == entry.get("html_sha256"):
+        print(f"⏭️  {url} unchanged, reusing last extraction")
+        result = previous
+    else:
+        with metrics.timer(SCRAPE_METRICS, "scrape_extract_seconds", extractor=extractor.__name__):
+            result = extractor(page["html"])
+        if merge and previous:
+            result = merge(result, previous)
+
+    return result, {
+        "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "via": FETCH_LOG.get(url, {}).get("via"),
+        "html_sha256": html_hash,
+        "etag": page["etag"] or (entry.get("etag") if page["not_modified"] else None),
+        "last_modified": page["last_modified"] or (entry.get("last_modified") if page["not_modified"] else None),
+        "sections": section_hashes(result),
+    }
+
+
+# Final outcome of a job as returned by orchestrator.run_jobs → (result, entry or None)
+def job_outcome(outcome, url, extractor):
+    if isinstance(outcome, TimeoutException):
+        print(f"❌ {url}: expected content never loaded")
+    elif isinstance(outcome, (orchestrator.CircuitOpen, orchestrator.Throttled, PageUnavailable,
+                              urllib3.exceptions.HTTPError)):
+        print(f"❌ {outcome}")
+    elif isinstance(outcome, Exception):
+        # One bad page must not take the whole run down
+        print(f"❌ {extractor.__name__} failed: {outcome}")
+    else:
+        return outcome
+    return {}, None
+
+
+def page_results(data, course_key):
+    course = (data or {}).get(course_key) or {}
+    qan = course.get("QAN") or {}
+    return {
+        "overviews": course.get("overviews"),
+        "popular_college": course.get("popular_college"),
+        "QA": qan.get("QA"),
+        "QAD": qan.get("QAD"),
+    }
+
+
+# What one course's pages yielded, recorded as scrape_items{course, item}
+def coverage_counts(results):
+    overviews = results.get("overviews") or {}
+    counts = {"sections": len(overviews), "faqs": 0, "table_rows": 0}
+
+    for section, content in overviews.items():
+        for _, node in storage.iter_nodes(content):
+            if "question" in node and "answer" in node:
+                counts["faqs"] += 1
+            for key in ("rows", "semester_tables", "recruiters_table", "placements_table"):
+                if isinstance(node.get(key), list):
+                    counts["table_rows"] += len(node[key])
+    counts["table_rows"] += len(overviews.get("jee_main_cutoff_2025") or [])
+    counts["table_rows"] += sum(len(rows) for rows in (overviews.get("iit_btech_seats") or {}).values())
+
+    popular = results.get("popular_college") or {}
+    counts["colleges"] = sum(
+        len(item["data"])
+        for section in popular.get("sections") or []
+        for item in section.get("content") or []
+        if isinstance(item.get("data"), list)
+    )
+
+    questions = (results.get("QA") or {}).get("questions") or []
+    counts["qa_questions"] = len(questions)
+    counts["qa_answers"] = sum(len(q.get("answers") or []) for q in questions)
+    counts["qad_posts"] = len((results.get("QAD") or {}).get("questions") or [])
+    return counts
+
+
+# Every page of every course is one job; all jobs share the driver pool
+# and the HTTP pool, and orchestrator.py paces them (concurrency cap,
+# per-host rate limit, retries, circuit breaker). `previous` / `manifest`
+# enable incremental mode; the
+# manifest is updated in place and SCRAPE_REPORT says what changed per
+# "<course>/<page>".
+def scrape_mba_colleges(workers=None, previous=None, manifest=None, courses=None):
+    courses = courses if courses is not None else load_courses()
+    jobs = [
+        (course_key, kind, url)
+        for course_key, pages in courses.items()
+        for kind, url in pages.items()
+    ]
+    workers = max(1, min(workers or SCRAPER_WORKERS, len(jobs)))
+    pool = get_driver_pool(workers)
+    pool["stats"] = {"cold": 0, "warm": 0}
+    limits = orchestrator.make_limits(workers)
+
+    manifest = manifest if manifest is not None else {}
+
+    FETCH_LOG.clear()
+    SCRAPE_REPORT.clear()
+    metrics.reset(SCRAPE_METRICS)
+    try:
+        tasks = []
+        for course_key, kind, url in jobs:
+            previous_page = page_results(previous, course_key).get(kind) if previous is not None else None
+            args = (previous_page, manifest.get(url), PAGE_MERGE.get(kind))
+            tasks.append({
+                "key": (course_key, kind),
+                "url": url,
+                "fetch": functools.partial(fetch_page_job, pool, url, *args),
+                "extract": functools.partial(extract_page_job, url=url, extractor=PAGES[kind],
+                                             previous=args[0], entry=args[1], merge=args[2]),
+            })
+        outcomes = orchestrator.run_jobs(tasks, limits, TRANSIENT_ERRORS)
+
+        results = {course_key: {} for course_key in courses}
+        for course_key, kind, url in jobs:
+            name = f"{course_key}/{kind}"
+            results[course_key][kind], entry = job_outcome(outcomes[(course_key, kind)], url, PAGES[kind])
+            if entry is None:
+                # Keep last run's output (and its manifest entry) so a
+                # transient failure is neither a data change nor a wipe
+                previous_page = page_results(previous, course_key).get(kind) if previous is not None else None
+                if previous_page:
+                    results[course_key][kind] = previous_page
+                SCRAPE_REPORT[name] = {"*": "failed"}
+                metrics.inc(SCRAPE_METRICS, "scrape_pages_total", course=course_key, page=kind, status="failed")
+                continue
+            metrics.inc(SCRAPE_METRICS, "scrape_pages_total", course=course_key, page=kind,
+                        status="ok", via=entry["via"] or "unknown")
+            SCRAPE_REPORT[name] = compare_sections(
+                manifest.get(url, {}).get("sections", {}), entry["sections"]
+            )
+            manifest[url] = entry
+
+        for course_key, course_results in results.items():
+            for item, count in coverage_counts(course_results).items():
+                metrics.set_gauge(SCRAPE_METRICS, "scrape_items", count, course=course_key, item=item)
+    finally:
+        for stat, value in limits["stats"].items():
+            metrics.set_gauge(SCRAPE_METRICS, "scrape_orchestrator", value, stat=stat)
+        orchestrator.print_summary(limits)
+        print_driver_summary(pool)
+        if not KEEP_WARM:
+            close_driver_pool(pool)
+
+    return {course_key: assemble_course(course_results) for course_key, course_results in results.items()}
+
+
+def assemble_course(results):
+    return {
+        "overviews": results["overviews"],
+        "popular_college": results["popular_college"],
+        "QAN": {
+            "QA": results["QA"],
+            "QAD": results["QAD"],
+        }
+    }
+
+
+# ---------------- REPLAY ----------------
+# Re-run the extractors on stored HTML, no browser or network involved.
+def replay(at=None, courses=None):
+    courses = courses if courses is not None else load_courses()
+    data = {}
+    for course_key, pages in courses.items():
+        results = {}
+        for kind, url in pages.items():
+            capture = html_store.latest_capture(url, at)
+            if capture is None:
+                print(f"⚠️ No stored HTML for {url}")
+                results[kind] = {}
+                continue
+            results[kind] = PAGES[kind](html_store.load_html(capture["sha256"]))
+        data[course_key] = assemble_course(results)
     return data
 
 
+def replay_capture(job):
+    capture, kind = job
+    return PAGES[kind](html_store.load_html(capture["sha256"]))
+
+
+# Re-extract every stored capture into <output_dir>/<course>/<page>/<fetched_at>.json,
+# one process per CPU
+def replay_history(output_dir, workers=None, courses=None):
+    courses = courses if courses is not None else load_courses()
+    targets = {}
+    for course_key, pages in courses.items():
+        for kind, url in pages.items():
+            targets.setdefault(url, []).append((course_key, kind))
+
+    jobs = [(c, targets[c["url"]]) for c in html_store.iter_captures() if c["url"] in targets]
+    # A URL shared by several courses is extracted once
+    work = [(capture, names[0][1]) for capture, names in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for (capture, names), result in zip(jobs, executor.map(replay_capture, work, chunksize=4)):
+            stamp = capture["fetched_at"].replace(":", "")
+            for course_key, kind in names:
+                path = os.path.join(output_dir, course_key, kind, f"{stamp}.json")
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                write_json_atomic(path, result)
+    print(f"✅ Re-extracted {len(jobs)} stored page(s) into {output_dir}")
+
+
+# Total time per phase, slowest first
+def print_phase_summary():
+    histograms = [h for h in metrics.to_json(SCRAPE_METRICS)["histograms"]
+                  if h["name"] in ("scrape_phase_seconds", "scrape_section_seconds")]
+    print("⏱️  Phases:")
+    for h in sorted(histograms, key=lambda h: -h["sum"]):
+        label = h["labels"].get("phase") or h["labels"].get("section")
+        print(f"  {label:32} {h['sum']:>8.2f}s total  {h['count']:>4}x  max {h['max']:.2f}s")
+
+
+def print_scrape_report():
+    for name, sections in SCRAPE_REPORT.items():
+        changed = [key for key, status in sections.items() if status != "unchanged"]
+        if not changed:
+            print(f"  {name}: unchanged")
+            continue
+        print(f"  {name}: " + ", ".join(f"{key} {sections[key]}" for key in changed))
+
 
-import os
 
 TEMP_FILE = "popular_mba_data.tmp.json"
 FINAL_FILE = "popular_mba_data.json"
+# mmap-able binary copy of FINAL_FILE for the API (snapshot_file.py)
+SNAPSHOT_FILE = "popular_mba_data.snap"
+WRITE_SNAPSHOT = os.environ.get("SCRAPER_WRITE_SNAPSHOT", "1") != "0"
 UPDATE_INTERVAL = 6 * 60 * 60  # 6 hours
 
 def auto_update_scraper():
@@ -1146,16 +2151,118 @@ def auto_update_scraper():
     #         return
 
     print("🔄 Scraping started")
-    data = scrape_mba_colleges()
-    with open(TEMP_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-    # Atomic swap → replaces old file with new one safely
-    os.replace(TEMP_FILE, FINAL_FILE)
+    previous = load_json_file(FINAL_FILE, None)
+    manifest = load_json_file(MANIFEST_FILE, {})
+
+    run_start = time.perf_counter()
+    data = scrape_mba_colleges(previous=previous, manifest=manifest)
+    with phase("serialize"):
+        output = json.dumps(data, indent=2, ensure_ascii=False)
+        previous_output = json.dumps(previous, indent=2, ensure_ascii=False) if previous is not None else None
+    data_changed = output != previous_output
+
+    print("📋 Section report:")
+    print_scrape_report()
+    write_json_atomic(MANIFEST_FILE, manifest)
+
+    if not data_changed:
+        print("⏭️  No section changed, data file left untouched")
+    else:
+        with phase("write_json"):
+            with open(TEMP_FILE, "w", encoding="utf-8") as f:
+                f.write(output)
+
+            # Atomic swap → replaces old file with new one safely
+            os.replace(TEMP_FILE, FINAL_FILE)
+
+        print("✅ Data scraped & saved successfully (atomic write)")
+
+    # One file per course, rewritten only when that course changed
+    os.makedirs(COURSE_OUTPUT_DIR, exist_ok=True)
+    for course_key, course in data.items():
+        path = os.path.join(COURSE_OUTPUT_DIR, f"{course_key}.json")
+        if course != (previous or {}).get(course_key) or not os.path.exists(path):
+            with phase("write_json"):
+                write_json_atomic(path, course)
+
+    if WRITE_SNAPSHOT and (data_changed or not os.path.exists(SNAPSHOT_FILE)):
+        with phase("write_snapshot"):
+            snapshot_file.write_snapshot(data, SNAPSHOT_FILE)
+        print(f"🗜️  Binary snapshot written to {SNAPSHOT_FILE}")
+
+    if SQLITE_STORE:
+        with phase("sqlite"):
+            inserted, updated = storage.save_dataset(data)
+        print(f"🗄️  SQLite store updated: {inserted} new Q&A post(s), {updated} updated")
+
+    browser_pages = sum(1 for entry in FETCH_LOG.values() if entry["via"] == "browser")
+    print(f"📊 {len(FETCH_LOG) - browser_pages} page(s) over HTTP, {browser_pages} with browser")
+
+    metrics.set_gauge(SCRAPE_METRICS, "scrape_data_changed", data_changed)
+    metrics.set_gauge(SCRAPE_METRICS, "scrape_duration_seconds", round(time.perf_counter() - run_start, 3))
+    metrics.set_gauge(SCRAPE_METRICS, "scrape_last_run_timestamp_seconds", int(time.time()))
+    write_json_atomic(REPORT_FILE, {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "data_changed": data_changed,
+        "pages": SCRAPE_REPORT,
+        "fetch": FETCH_LOG,
+        "metrics": metrics.to_json(SCRAPE_METRICS),
+    })
+    metrics.write_textfile(SCRAPE_METRICS, METRICS_FILE)
+    print_phase_summary()
+    print(f"📈 Metrics written to {REPORT_FILE} and {METRICS_FILE}")
+
+# Long-running mode: browsers are started once, kept warm and reused by
+# every scrape, one scrape per UPDATE_INTERVAL
+def serve(interval=UPDATE_INTERVAL):
+    global KEEP_WARM
+    KEEP_WARM = True
+    prewarm_driver_pool(get_driver_pool(SCRAPER_WORKERS))
+    while True:
+        try:
+            auto_update_scraper()
+        except Exception as e:
+            # A bad run must not stop the service
+            print(f"❌ Scrape failed: {e}")
+        print(f"😴 Next scrape in {interval / 60:.0f} min")
+        time.sleep(interval)
+
+
+# Derived stores for the API's mmap / sqlite backends, rebuilt from the
+# JSON data file. They're not committed: run this at deploy time.
+def build_stores(path=FINAL_FILE):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    snapshot_file.write_snapshot(data, SNAPSHOT_FILE)
+    print(f"🗜️  Binary snapshot written to {SNAPSHOT_FILE}")
+    inserted, updated = storage.save_dataset(data)
+    print(f"🗄️  SQLite store updated: {inserted} new Q&A post(s), {updated} updated")
 
-    print("✅ Data scraped & saved successfully (atomic write)")
 
 if __name__ == "__main__":
-
-    auto_update_scraper()
+    parser = argparse.ArgumentParser(description="Shiksha course scraper")
+    parser.add_argument("--replay", action="store_true",
+                        help="extract from stored HTML instead of scraping")
+    parser.add_argument("--at", help="replay the latest captures at or before this ISO timestamp")
+    parser.add_argument("--output", default="popular_mba_data.replay.json",
+                        help="where --replay writes its result")
+    parser.add_argument("--replay-all", metavar="DIR",
+                        help="re-extract every stored capture into DIR")
+    parser.add_argument("--serve", action="store_true",
+                        help="scrape every UPDATE_INTERVAL with warm browsers, until interrupted")
+    parser.add_argument("--build-stores", action="store_true",
+                        help=f"rebuild {SNAPSHOT_FILE} and the SQLite store from {FINAL_FILE}")
+    args = parser.parse_args()
+
+    if args.build_stores:
+        build_stores()
+    elif args.serve:
+        serve()
+    elif args.replay_all:
+        replay_history(args.replay_all)
+    elif args.replay:
+        write_json_atomic(args.output, replay(args.at))
+        print(f"✅ Replayed stored HTML into {args.output}")
+    else:
+        auto_update_scraper()
 
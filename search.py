@@ -0,0 +1,186 @@
+import math
+import re
+from collections import Counter
+
+# In-memory inverted index over one data snapshot.
+#
+# Documents are FAQ question/answer pairs (eligibility, specializations,
+# syllabus, salary…), every Q&A / discussion answer, and the plain text of
+# each course section. Built once per snapshot; queries touch only the
+# postings of their own terms and are ranked with BM25. The documents and
+# the scoring are shared with the SQLite store's text_fts (storage.py), so
+# every DATA_BACKEND answers /search alike.
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+BM25_MIN_IDF = 1e-6
+SNIPPET_WORDS = 30
+FAQ_SECTIONS = ("eligibility_admission", "popular_specializations", "btech_syllabus", "btech_salary_career")
+
+TOKEN_RE = re.compile(r"\w+")
+PHRASE_RE = re.compile(r'"([^"]+)"')
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def text_of(node):
+    if isinstance(node, str):
+        return [node]
+    if isinstance(node, dict):
+        node = list(node.values())
+    if isinstance(node, list):
+        return [text for item in node for text in text_of(item)]
+    return []
+
+
+def iter_faqs(node):
+    if isinstance(node, dict):
+        if "question" in node and "answer" in node:
+            yield node
+        for value in node.values():
+            yield from iter_faqs(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from iter_faqs(item)
+
+
+# 🔹 Documents
+# Each one: {"kind", "course", "ref", "title", "text", ...ids}. One course at
+# a time, so the mmap backend can feed it a single slice and the SQLite
+# store (storage.index_text) indexes exactly the same documents.
+def course_documents(course_key, course):
+    if not isinstance(course, dict):
+        return
+    overviews = course.get("overviews") or {}
+
+    for section, content in overviews.items():
+        if section in FAQ_SECTIONS:
+            for faq in iter_faqs(content):
+                yield {
+                    "kind": "faq",
+                    "course": course_key,
+                    "ref": f"{course_key}/overviews/{section}",
+                    "title": faq["question"] or "",
+                    "text": faq["answer"] or ""
+                }
+
+        text = " ".join(text_of(content))
+        if text and isinstance(content, (list, dict)):
+            yield {
+                "kind": "section",
+                "course": course_key,
+                "ref": f"{course_key}/overviews/{section}",
+                "title": section,
+                "text": text
+            }
+
+    qan = course.get("QAN") or {}
+    for source in ("QA", "QAD"):
+        for question in (qan.get(source) or {}).get("questions", []):
+            for answer in question.get("answers", [question]):
+                yield {
+                    "kind": "qa",
+                    "course": course_key,
+                    "ref": f"{course_key}/QAN/{source}",
+                    "source": source,
+                    "questionid": question.get("questionid"),
+                    "answerid": answer.get("answerid"),
+                    "title": question.get("question_text") or "",
+                    "text": answer.get("answer_text") or ""
+                }
+
+
+def collect_documents(data):
+    return [doc for course_key, course in (data or {}).items() for doc in course_documents(course_key, course)]
+
+
+def build_search_index(data):
+    return index_documents(collect_documents(data))
+
+
+def index_documents(docs):
+    postings = {}
+    lengths = []
+
+    for doc_id, doc in enumerate(docs):
+        tokens = tokenize(doc["title"]) + tokenize(doc["text"])
+        lengths.append(len(tokens))
+        for term, tf in Counter(tokens).items():
+            postings.setdefault(term, []).append((doc_id, tf))
+
+    return {
+        "docs": docs,
+        "postings": postings,
+        "lengths": lengths,
+        "avg_length": (sum(lengths) / len(lengths)) if lengths else 0.0
+    }
+
+
+# 🔹 Snippets
+# Window of SNIPPET_WORDS words around the first query hit, hits in <mark>
+def make_snippet(text, terms):
+    words = text.split()
+    hits = [i for i, word in enumerate(words) if set(tokenize(word)) & terms]
+    if not hits:
+        return " ".join(words[:SNIPPET_WORDS]) + (" …" if len(words) > SNIPPET_WORDS else "")
+
+    start = max(0, hits[0] - SNIPPET_WORDS // 3)
+    end = min(len(words), start + SNIPPET_WORDS)
+    out = [
+        f"<mark>{word}</mark>" if set(tokenize(word)) & terms else word
+        for word in words[start:end]
+    ]
+    return ("… " if start else "") + " ".join(out) + (" …" if end < len(words) else "")
+
+
+# 🔍 BM25 over the query terms. Quoted "phrases" must also appear verbatim
+# (case-insensitive) in the question/answer text. kind narrows to
+# "faq" | "qa" | "section". Returns (total, hits[offset:offset + limit]).
+def search(index, query, kind=None, limit=10, offset=0):
+    phrases = [" ".join(tokenize(p)) for p in PHRASE_RE.findall(query)]
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return 0, []
+
+    docs = index["docs"]
+    lengths = index["lengths"]
+    avg_length = index["avg_length"] or 1.0
+    n = len(docs)
+    scores = {}
+
+    for term in terms:
+        postings = index["postings"].get(term)
+        if not postings:
+            continue
+        # SQLite FTS5's bm25() idf, floored for terms in over half the
+        # documents, so the sqlite backend ranks the same
+        idf = max(math.log((n - len(postings) + 0.5) / (len(postings) + 0.5)), BM25_MIN_IDF)
+        for doc_id, tf in postings:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / avg_length)
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    matches = []
+    for doc_id, score in scores.items():
+        doc = docs[doc_id]
+        if kind and doc["kind"] != kind:
+            continue
+        if phrases:
+            normalized = " " + " ".join(tokenize(doc["title"] + " " + doc["text"])) + " "
+            if not all(f" {phrase} " in normalized for phrase in phrases):
+                continue
+        matches.append((score, doc_id))
+
+    matches.sort(key=lambda match: (-match[0], match[1]))
+
+    term_set = set(terms)
+    hits = []
+    for score, doc_id in matches[offset:offset + limit]:
+        doc = docs[doc_id]
+        hit = {key: value for key, value in doc.items() if key != "text"}
+        hit["score"] = round(score, 4)
+        hit["snippet"] = make_snippet(doc["text"] or doc["title"], term_set)
+        hits.append(hit)
+
+    return len(matches), hits
@@ -0,0 +1,146 @@
+import re
+
+# Projection / filtering / paging applied to a resolved section node.
+#
+#   fields=question,answer       keep only these keys ("author.name" reaches
+#                                into nested dicts) on every item
+#   filter=views>1000            compare an item field: = != > >= < <=
+#   filter=tags contains B.Tech  substring on strings, element / value match
+#                                on lists (e.g. [{"tag_name": ...}])
+#   limit / offset               page over the items of a list node
+#
+# Filters and paging need a list node; projection also applies to a dict.
+
+FILTER_RE = re.compile(r"^\s*([\w.]+)\s*(>=|<=|!=|=|>|<|\s+contains\s+)\s*(.*?)\s*$", re.IGNORECASE)
+NUMBER_RE = re.compile(r"^-?\d+(\.\d+)?$")
+
+
+class QueryError(ValueError):
+    pass
+
+
+def parse_filters(filters):
+    parsed = []
+    for text in filters or []:
+        match = FILTER_RE.match(text)
+        if not match:
+            raise QueryError(f"Invalid filter: {text!r}")
+        field, op, value = match.groups()
+        parsed.append((field.split("."), op.strip().lower(), value))
+    return parsed
+
+
+def parse_fields(fields):
+    if not fields:
+        return None
+    return [field.strip().split(".") for field in fields.split(",") if field.strip()]
+
+
+MISSING = object()
+
+
+def get_field(item, path, default=None):
+    for key in path:
+        if not isinstance(item, dict) or key not in item:
+            return default
+        item = item[key]
+    return item
+
+
+def as_number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+        if NUMBER_RE.match(value):
+            return float(value)
+    return None
+
+
+def contains(value, needle):
+    needle = needle.lower()
+    if isinstance(value, str):
+        return needle in value.lower()
+    if isinstance(value, list):
+        return any(
+            (isinstance(v, str) and v.lower() == needle)
+            or (isinstance(v, dict) and any(isinstance(x, str) and x.lower() == needle for x in v.values()))
+            for v in value
+        )
+    if isinstance(value, dict):
+        return any(isinstance(v, str) and v.lower() == needle for v in value.values())
+    return False
+
+
+def matches(item, filters):
+    for path, op, expected in filters:
+        value = get_field(item, path)
+
+        if op == "contains":
+            if not contains(value, expected):
+                return False
+            continue
+
+        left, right = as_number(value), as_number(expected)
+        if left is None or right is None:
+            # No numeric reading on one side → plain string comparison
+            if op in ("=", "!="):
+                equal = value is not None and str(value).lower() == expected.lower()
+                if equal != (op == "="):
+                    return False
+                continue
+            return False
+
+        if not {
+            "=": left == right, "!=": left != right,
+            ">": left > right, ">=": left >= right,
+            "<": left < right, "<=": left <= right
+        }[op]:
+            return False
+    return True
+
+
+def project(item, fields):
+    if not isinstance(item, dict):
+        return item
+    out = {}
+    for path in fields:
+        value = get_field(item, path, MISSING)
+        if value is MISSING:
+            continue
+        target = out
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+    return out
+
+
+# Returns (data, page info or None). Page info: {"total", "offset", "limit", "next_offset"}
+def apply_query(node, fields=None, filters=None, limit=None, offset=0):
+    fields = parse_fields(fields)
+    filters = parse_filters(filters)
+    paged = bool(filters) or limit is not None or offset
+
+    if not isinstance(node, list):
+        if paged:
+            raise QueryError("filter, limit and offset need a list section, e.g. QAN/QA/questions")
+        return (project(node, fields) if fields else node), None
+
+    items = [item for item in node if matches(item, filters)] if filters else node
+    total = len(items)
+    end = total if limit is None else offset + limit
+    items = items[offset:end]
+    if fields:
+        items = [project(item, fields) for item in items]
+
+    if not paged:
+        return items, None
+
+    return items, {
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "next_offset": end if end < total else None
+    }
@@ -0,0 +1,231 @@
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Binary snapshot of the scraped document, built to be mmap()ed by the API.
+#
+#   MAGIC | u32 header length | header (JSON)
+#   body        the exact bytes GET /Distance_btech_popular_course sends
+#   body.gz     gzip variant (and body.br when brotli is installed)
+#   strings     every section path / key name, utf-8, back to back
+#   paths       PATH_RECORD per node, sorted by path:
+#               (string offset, string length, start, end of the node's JSON in body)
+#   names       NAME_RECORD per named node, sorted by (name, document order):
+#               (name offset, name length, path offset, path length)
+#
+# A node's JSON is a contiguous slice of the body, so serving a section means
+# two binary searches over the mapped tables and one json.loads of that slice.
+# Nothing else is decoded, and every worker shares the same page-cache copy.
+
+MAGIC = b"MBASNAP1"
+PATH_RECORD = struct.Struct("<QIQQ")
+NAME_RECORD = struct.Struct("<QIQI")
+
+
+def dumps(value):
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+# Encode {"data": data} exactly like api.encode_body, recording the byte span
+# of every node under the same lowercased paths as api.build_section_index.
+# Returns (body bytes, {path: (start, end)}, [(name, path)] in document order)
+def encode_with_spans(data):
+    parts = []
+    size = 0
+    spans = {}
+    names = []
+
+    def emit(text):
+        nonlocal size
+        chunk = text.encode("utf-8")
+        parts.append(chunk)
+        size += len(chunk)
+
+    def encode(node, path):
+        start = size
+        if isinstance(node, dict):
+            emit("{")
+            for i, (key, value) in enumerate(node.items()):
+                emit(("," if i else "") + dumps(str(key)) + ":")
+                encode_child(node, key, value, path)
+            emit("}")
+        elif isinstance(node, list):
+            emit("[")
+            for i, value in enumerate(node):
+                if i:
+                    emit(",")
+                encode_child(node, i, value, path)
+            emit("]")
+        else:
+            emit(dumps(node))
+        return start, size
+
+    def encode_child(node, key, value, path):
+        key = str(key).lower()
+        child_path = f"{path}/{key}" if path else key
+        if isinstance(node, dict) and value is not None:
+            names.append((key, child_path))
+        spans[child_path] = encode(value, child_path)
+
+    emit('{"data":')
+    if isinstance(data, (dict, list)):
+        encode(data, "")
+    else:
+        emit(dumps(data))
+    emit("}")
+    return b"".join(parts), spans, names
+
+
+def write_snapshot(data, path):
+    body, spans, names = encode_with_spans(data)
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body)
+
+    strings = bytearray()
+    string_offsets = {}
+
+    def intern(text):
+        if text not in string_offsets:
+            raw = text.encode("utf-8")
+            string_offsets[text] = (len(strings), len(raw))
+            strings.extend(raw)
+        return string_offsets[text]
+
+    sorted_paths = sorted(spans, key=lambda p: p.encode("utf-8"))
+    path_records = [(intern(p), spans[p]) for p in sorted_paths]
+    # Stable sort keeps document order within a name
+    sorted_names = sorted(names, key=lambda item: item[0].encode("utf-8"))
+    name_records = [(intern(name), intern(p)) for name, p in sorted_names]
+
+    # Block offsets are relative to the end of the header
+    blocks = [("body", body)] + list(variants.items()) + [("strings", bytes(strings))]
+    offsets = {}
+    position = 0
+    for name, block in blocks:
+        offsets[name] = [position, len(block)]
+        position += len(block)
+    offsets["paths"] = [position, len(path_records)]
+    position += len(path_records) * PATH_RECORD.size
+    offsets["names"] = [position, len(name_records)]
+
+    header = dumps({
+        "etag": hashlib.sha256(body).hexdigest()[:32],
+        "roots": [key.lower() for key in data] if isinstance(data, dict) else [],
+        "courses": [str(key) for key in data] if isinstance(data, dict) else [],
+        "blocks": offsets
+    }).encode("utf-8")
+    base = len(MAGIC) + 4 + len(header)
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(header)) + header)
+        for _, block in blocks:
+            f.write(block)
+        for (string_offset, string_length), (start, end) in path_records:
+            f.write(PATH_RECORD.pack(string_offset, string_length, base + start, base + end))
+        for (name_offset, name_length), (path_offset, path_length) in name_records:
+            f.write(NAME_RECORD.pack(name_offset, name_length, path_offset, path_length))
+    os.replace(tmp, path)
+
+
+# ---------------- READING ----------------
+def open_snapshot(f):
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a snapshot file")
+    (header_length,) = struct.unpack_from("<I", mm, len(MAGIC))
+    base = len(MAGIC) + 4
+    header = json.loads(mm[base:base + header_length])
+    base += header_length
+
+    blocks = {name: (base + offset, length) for name, (offset, length) in header["blocks"].items()}
+    return {
+        "mm": mm,
+        "view": memoryview(mm),
+        "etag": header["etag"],
+        "roots": header["roots"],
+        "courses": header.get("courses", header["roots"]),
+        "blocks": blocks
+    }
+
+
+def block(snap, name):
+    if name not in snap["blocks"]:
+        return None
+    offset, length = snap["blocks"][name]
+    return snap["view"][offset:offset + length]
+
+
+def string_at(snap, offset, length):
+    start = snap["blocks"]["strings"][0] + offset
+    return snap["mm"][start:start + length]
+
+
+def record_at(snap, table, record, i):
+    return record.unpack_from(snap["mm"], snap["blocks"][table][0] + i * record.size)
+
+
+# Index of the first record whose string key (fields 0 / 1) is >= target
+def lower_bound(snap, table, record, target):
+    lo, hi = 0, snap["blocks"][table][1]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        fields = record_at(snap, table, record, mid)
+        if string_at(snap, fields[0], fields[1]) < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def path_span(snap, path):
+    target = path.encode("utf-8")
+    i = lower_bound(snap, "paths", PATH_RECORD, target)
+    if i < snap["blocks"]["paths"][1]:
+        string_offset, string_length, start, end = record_at(snap, "paths", PATH_RECORD, i)
+        if string_at(snap, string_offset, string_length) == target:
+            return start, end
+    return None
+
+
+def name_paths(snap, name):
+    target = name.encode("utf-8")
+    i = lower_bound(snap, "names", NAME_RECORD, target)
+    paths = []
+    while i < snap["blocks"]["names"][1]:
+        name_offset, name_length, path_offset, path_length = record_at(snap, "names", NAME_RECORD, i)
+        if string_at(snap, name_offset, name_length) != target:
+            break
+        paths.append(string_at(snap, path_offset, path_length).decode("utf-8"))
+        i += 1
+    return paths
+
+
+# Same contract as api.find_section
+def find_section(snap, section_name):
+    name = section_name.strip("/").lower()
+
+    if "/" not in name:
+        return name_paths(snap, name)
+
+    if path_span(snap, name):
+        return [name]
+
+    return [f"{root}/{name}" for root in snap["roots"] if path_span(snap, f"{root}/{name}")]
+
+
+def section_data(snap, path):
+    span = path_span(snap, path)
+    if span is None:
+        return None
+    start, end = span
+    return json.loads(snap["mm"][start:end])
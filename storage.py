@@ -0,0 +1,500 @@
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+import qa_store
+import search
+
+# SQLite storage engine for the scraped dataset.
+#
+# Lives in the same database file as the Q&A store (qa_store.DB_FILE):
+#
+#   documents   one row per course, the course subtree as compact JSON
+#   sections    one row per node of every document (path, lowercased key,
+#               depth-first order, JSON path into the document) so section
+#               lookups are an index hit + json_extract, never a tree walk
+#   faqs, data_tables / table_rows, exams, cutoffs, iit_seats, colleges
+#               the normalized content, for queries across courses
+#   questions / answers
+#               views over qa_posts
+#   text_fts    FTS5 over search.course_documents (FAQs, Q&A answers, section
+#               text; when available), answers /search on the sqlite
+#               backend (search_text) with the same documents as the
+#               in-memory index of the other backends
+#
+# save_dataset() replaces the rows of every changed course and drops the
+# courses no longer in the data, in a single transaction, and bumps
+# meta.generation, which readers use to invalidate their caches.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS documents (
+    course_key TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sections (
+    course_key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT,
+    ord INTEGER NOT NULL,
+    json_path TEXT NOT NULL,
+    PRIMARY KEY (course_key, path)
+);
+CREATE INDEX IF NOT EXISTS sections_path ON sections (path);
+CREATE INDEX IF NOT EXISTS sections_name ON sections (name, ord);
+
+CREATE TABLE IF NOT EXISTS faqs (
+    id INTEGER PRIMARY KEY,
+    course_key TEXT NOT NULL,
+    section TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT
+);
+CREATE INDEX IF NOT EXISTS faqs_course_section ON faqs (course_key, section);
+
+CREATE TABLE IF NOT EXISTS data_tables (
+    id INTEGER PRIMARY KEY,
+    course_key TEXT NOT NULL,
+    section TEXT NOT NULL,
+    title TEXT,
+    headers TEXT
+);
+CREATE INDEX IF NOT EXISTS data_tables_course_section ON data_tables (course_key, section);
+
+CREATE TABLE IF NOT EXISTS table_rows (
+    table_id INTEGER NOT NULL REFERENCES data_tables (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    cells TEXT NOT NULL,
+    PRIMARY KEY (table_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS exams (
+    course_key TEXT NOT NULL,
+    exam_name TEXT NOT NULL,
+    exam_dates TEXT,
+    exam_schedule_link TEXT
+);
+CREATE INDEX IF NOT EXISTS exams_course_name ON exams (course_key, exam_name);
+
+CREATE TABLE IF NOT EXISTS cutoffs (
+    course_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    row TEXT NOT NULL,
+    PRIMARY KEY (course_key, position)
+);
+
+CREATE TABLE IF NOT EXISTS iit_seats (
+    course_key TEXT NOT NULL,
+    institute TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    row TEXT NOT NULL,
+    PRIMARY KEY (course_key, institute, position)
+);
+
+CREATE TABLE IF NOT EXISTS colleges (
+    course_key TEXT NOT NULL,
+    section TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    row TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS colleges_course_name ON colleges (course_key, name);
+
+CREATE VIEW IF NOT EXISTS questions AS
+    SELECT source, questionid, MIN(type) AS type, MIN(question_text) AS question_text,
+           MAX(followers) AS followers, MAX(views) AS views, MIN(first_seen) AS first_seen
+    FROM qa_posts GROUP BY source, questionid;
+
+CREATE VIEW IF NOT EXISTS answers AS
+    SELECT id, source, questionid, answerid, answer_text, author_name, author_url,
+           posted_time, upvotes, downvotes, first_seen, updated_at
+    FROM qa_posts;
+"""
+
+# One indexed column holding title + text, tokenized like search.tokenize
+# (\w+ runs, lowercased, accents kept), so bm25() sees the same terms and
+# document lengths as the in-memory index. hit is the search hit minus
+# score / snippet, seq the document's position within its course.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS text_fts USING fts5 (
+    course_key UNINDEXED,
+    seq UNINDEXED,
+    kind UNINDEXED,
+    hit UNINDEXED,
+    body,
+    tokenize = "unicode61 remove_diacritics 0 tokenchars '_'"
+);
+"""
+
+COURSE_TABLES = ("documents", "sections", "faqs", "exams", "cutoffs", "iit_seats", "colleges")
+
+
+def now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def dumps(value):
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def has_fts5(conn):
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp._fts5_probe USING fts5 (x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def init_schema(conn):
+    qa_store.init_schema(conn)
+    conn.executescript(SCHEMA)
+    if has_fts5(conn):
+        # Stores written before text_fts followed search.course_documents
+        # get it rebuilt from the stored documents
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(text_fts)")]
+        if columns and "hit" not in columns:
+            with conn:
+                conn.execute("DROP TABLE text_fts")
+                conn.executescript(FTS_SCHEMA)
+                for course_key, document in documents(conn):
+                    index_text(conn, course_key, json.loads(document))
+        conn.executescript(FTS_SCHEMA)
+
+
+# Quoted JSON path label for a dict key. SQLite compares it with the key as
+# written in the stored JSON (escapes included), and a label can't contain
+# '"' at all: those keys get None.
+def json_path_key(key):
+    key = str(key)
+    if '"' in key:
+        return None
+    return '."' + dumps(key)[1:-1] + '"'
+
+
+# ---------------- NORMALIZATION ----------------
+# Same walk as api.build_section_index: every node gets a lowercased path,
+# dict keys with a non-None value are addressable by name, in depth-first order.
+# json_path is the SQLite JSON path of the node, or, under a key no path can
+# name, the JSON list of keys / indexes leading to it (see section_data).
+def section_rows(course_key, body, start_ord):
+    rows = []
+
+    def walk(node, path, json_path, steps):
+        if isinstance(node, dict):
+            items = ((key, json_path_key(key)) for key in node)
+        elif isinstance(node, list):
+            items = ((i, f"[{i}]") for i in range(len(node)))
+        else:
+            return
+
+        for key, path_key in items:
+            value = node[key]
+            child_path = f"{path}/{str(key).lower()}"
+            child_steps = steps + [key]
+            child_json_path = json_path + path_key if json_path is not None and path_key is not None else None
+            name = str(key).lower() if isinstance(node, dict) and value is not None else None
+            rows.append((course_key, child_path, name, start_ord + len(rows),
+                         child_json_path if child_json_path is not None else dumps(child_steps)))
+            walk(value, child_path, child_json_path, child_steps)
+
+    rows.append((course_key, course_key.lower(), course_key.lower(), start_ord, "$"))
+    walk(body, course_key.lower(), "$", [])
+    return rows
+
+
+def iter_nodes(node, section=None):
+    if isinstance(node, dict):
+        yield section, node
+        for key, value in node.items():
+            yield from iter_nodes(value, section)
+    elif isinstance(node, list):
+        for item in node:
+            yield from iter_nodes(item, section)
+
+
+def insert_table(conn, course_key, section, title, headers, rows):
+    if not rows:
+        return
+    table_id = conn.execute(
+        "INSERT INTO data_tables (course_key, section, title, headers) VALUES (?, ?, ?, ?)",
+        (course_key, section, title, dumps(headers) if headers is not None else None)
+    ).lastrowid
+    conn.executemany(
+        "INSERT INTO table_rows (table_id, position, cells) VALUES (?, ?, ?)",
+        [(table_id, position, dumps(row)) for position, row in enumerate(rows)]
+    )
+
+
+def save_course_content(conn, course_key, body):
+    overviews = body.get("overviews") or {}
+
+    for section, content in overviews.items():
+        for _, node in iter_nodes(content):
+            # FAQs: eligibility lists them inline, the other sections
+            # under a "questions" block
+            if "question" in node and "answer" in node:
+                conn.execute(
+                    "INSERT INTO faqs (course_key, section, question, answer) VALUES (?, ?, ?, ?)",
+                    (course_key, section, node["question"], node["answer"])
+                )
+                for table in node.get("tables", []):
+                    insert_table(conn, course_key, section, node["question"], None, table)
+
+            if isinstance(node.get("rows"), list):
+                insert_table(conn, course_key, section, node.get("title"),
+                             node.get("headers") or node.get("columns"), node["rows"])
+            for key in ("semester_tables", "recruiters_table", "placements_table"):
+                if isinstance(node.get(key), list):
+                    insert_table(conn, course_key, section, node.get("title") or key, None, node[key])
+
+    conn.executemany(
+        "INSERT INTO exams (course_key, exam_name, exam_dates, exam_schedule_link) VALUES (?, ?, ?, ?)",
+        [(course_key, e.get("exam_name"), e.get("exam_dates"), e.get("exam_schedule_link"))
+         for e in overviews.get("popular_exams") or []]
+    )
+    conn.executemany(
+        "INSERT INTO cutoffs (course_key, position, row) VALUES (?, ?, ?)",
+        [(course_key, i, dumps(row)) for i, row in enumerate(overviews.get("jee_main_cutoff_2025") or [])]
+    )
+    conn.executemany(
+        "INSERT INTO iit_seats (course_key, institute, position, row) VALUES (?, ?, ?, ?)",
+        [(course_key, institute, i, dumps(row))
+         for institute, rows in (overviews.get("iit_btech_seats") or {}).items()
+         for i, row in enumerate(rows)]
+    )
+
+    # Category page: every table row is a college
+    popular = body.get("popular_college") or {}
+    for section in popular.get("sections") or []:
+        heading = section.get("heading")
+        for item in section.get("content") or []:
+            rows = item.get("data")
+            if not isinstance(rows, list):
+                continue
+            insert_table(conn, course_key, "popular_college", heading, None, rows)
+            conn.executemany(
+                "INSERT INTO colleges (course_key, section, position, name, row) VALUES (?, ?, ?, ?, ?)",
+                [(course_key, heading, i, next(iter(row.values()), None), dumps(row))
+                 for i, row in enumerate(rows)]
+            )
+
+
+# Search documents of one course, the same ones search.build_search_index
+# collects for the json / mmap backends
+def index_text(conn, course_key, body):
+    conn.executemany(
+        "INSERT INTO text_fts (course_key, seq, kind, hit, body) VALUES (?, ?, ?, ?, ?)",
+        [(course_key, seq, doc["kind"], dumps({key: value for key, value in doc.items() if key != "text"}),
+          doc["title"] + "\n" + doc["text"])
+         for seq, doc in enumerate(search.course_documents(course_key, body))]
+    )
+
+
+def delete_course(conn, course_key, fts):
+    conn.execute(
+        "DELETE FROM table_rows WHERE table_id IN (SELECT id FROM data_tables WHERE course_key = ?)",
+        (course_key,)
+    )
+    conn.execute("DELETE FROM data_tables WHERE course_key = ?", (course_key,))
+    for table in COURSE_TABLES:
+        conn.execute(f"DELETE FROM {table} WHERE course_key = ?", (course_key,))
+    if fts:
+        conn.execute("DELETE FROM text_fts WHERE course_key = ?", (course_key,))
+
+
+# Replace every course in `data` (plus upsert its Q&A posts) and delete the
+# ones missing from it, atomically. qa_posts is append-only and keeps the
+# posts of deleted courses.
+# Returns (inserted, updated) Q&A post counts.
+def save_dataset(data, path=None):
+    conn = qa_store.connect(path)
+    try:
+        init_schema(conn)
+        fts = has_fts5(conn)
+        updated_at = now()
+        inserted = updated = 0
+        changed = False
+
+        with conn:
+            # Document order = position, kept stable for courses already stored
+            position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM documents").fetchone()[0]
+            ord_start = conn.execute("SELECT COALESCE(MAX(ord), -1) + 1 FROM sections").fetchone()[0]
+
+            for course_key, body in data.items():
+                document = dumps(body)
+                existing = conn.execute(
+                    "SELECT position, body FROM documents WHERE course_key = ?", (course_key,)
+                ).fetchone()
+                # Unchanged course → keep its rows (and readers' caches)
+                if existing and existing[1] == document:
+                    continue
+                changed = True
+                delete_course(conn, course_key, fts)
+
+                conn.execute(
+                    "INSERT INTO documents (course_key, position, body, updated_at) VALUES (?, ?, ?, ?)",
+                    (course_key, existing[0] if existing else position, document, updated_at)
+                )
+                if not existing:
+                    position += 1
+
+                rows = section_rows(course_key, body, ord_start)
+                ord_start += len(rows)
+                conn.executemany(
+                    "INSERT INTO sections (course_key, path, name, ord, json_path) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+
+                save_course_content(conn, course_key, body)
+                if fts:
+                    index_text(conn, course_key, body)
+
+                qan = (body or {}).get("QAN") or {}
+                for source in ("QA", "QAD"):
+                    posts = qa_store.posts_from_result(source, qan.get(source))
+                    i, u = qa_store.upsert_posts(conn, posts, updated_at)
+                    inserted += i
+                    updated += u
+
+            # Courses gone from the source data stop being served
+            stored = [row[0] for row in conn.execute("SELECT course_key FROM documents")]
+            for course_key in stored:
+                if course_key not in data:
+                    changed = True
+                    delete_course(conn, course_key, fts)
+
+            if changed:
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('generation', '1') "
+                    "ON CONFLICT (key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+                )
+
+        return inserted, updated
+    finally:
+        conn.close()
+
+
+# ---------------- READS ----------------
+def generation(conn):
+    row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+    return int(row[0]) if row else 0
+
+
+# [(course_key, body JSON text)] in document order
+def documents(conn):
+    return conn.execute("SELECT course_key, body FROM documents ORDER BY position").fetchall()
+
+
+def course_keys(conn):
+    return [row[0] for row in conn.execute("SELECT course_key FROM documents ORDER BY position")]
+
+
+def roots(conn):
+    return [course_key.lower() for course_key in course_keys(conn)]
+
+
+def has_path(conn, path):
+    return conn.execute("SELECT 1 FROM sections WHERE path = ?", (path,)).fetchone() is not None
+
+
+# Same contract as api.find_section, answered from the sections index
+def find_section(conn, section_name):
+    name = section_name.strip("/").lower()
+
+    if "/" not in name:
+        rows = conn.execute(
+            "SELECT s.path FROM sections s JOIN documents d ON d.course_key = s.course_key "
+            "WHERE s.name = ? ORDER BY d.position, s.ord",
+            (name,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    if has_path(conn, name):
+        return [name]
+
+    return [f"{root}/{name}" for root in roots(conn) if has_path(conn, f"{root}/{name}")]
+
+
+# Node at `path`; only that subtree is extracted and parsed, except under
+# keys no JSON path can name, where the document is walked step by step.
+# KeyError when there is no such node.
+def section_data(conn, path):
+    row = conn.execute(
+        "SELECT s.json_path, CASE WHEN s.json_path LIKE '$%' THEN d.body -> s.json_path ELSE d.body END "
+        "FROM sections s JOIN documents d ON d.course_key = s.course_key WHERE s.path = ?",
+        (path,)
+    ).fetchone()
+    if row is None or row[1] is None:
+        raise KeyError(path)
+    if row[0].startswith("$"):
+        return json.loads(row[1])
+
+    node = json.loads(row[1])
+    try:
+        for step in json.loads(row[0]):
+            node = node[step]
+    except (KeyError, IndexError, TypeError):
+        raise KeyError(path)
+    return node
+
+
+# ---------------- SEARCH ----------------
+def has_search(conn):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'text_fts'").fetchone() is not None
+
+
+# FTS5 queries with the same semantics as search.search: (any of the
+# terms, every quoted "phrase" or None). Phrases only filter, they are
+# matched apart so bm25() scores the terms alone.
+def fts_query(query):
+    terms = list(dict.fromkeys(search.tokenize(query)))
+    if not terms:
+        return None, None
+    phrases = [
+        '"' + " ".join(tokens) + '"'
+        for tokens in map(search.tokenize, search.PHRASE_RE.findall(query)) if tokens
+    ]
+    return " OR ".join(f'"{term}"' for term in terms), " AND ".join(phrases) or None
+
+
+# Hit in the shape search.search returns it
+def fts_hit(row):
+    hit, rank, snippet = row
+    hit = json.loads(hit)
+    hit["score"] = round(-rank, 4)
+    hit["snippet"] = snippet
+    return hit
+
+
+# search.search answered by text_fts: bm25() ranks (ties in document
+# order, like the in-memory index), snippet() marks the hits, and nothing
+# is loaded into the worker. Returns (total, hits).
+def search_text(conn, query, kind=None, limit=10, offset=0):
+    match, phrases = fts_query(query)
+    if match is None:
+        return 0, []
+
+    where = "text_fts MATCH ?"
+    params = (match,)
+    if phrases:
+        where += " AND text_fts.rowid IN (SELECT rowid FROM text_fts WHERE text_fts MATCH ?)"
+        params += (phrases,)
+    if kind:
+        where += " AND kind = ?"
+        params += (kind,)
+    total = conn.execute(f"SELECT count(*) FROM text_fts WHERE {where}", params).fetchone()[0]
+    rows = conn.execute(
+        "SELECT hit, bm25(text_fts) AS rank, snippet(text_fts, 4, '<mark>', '</mark>', '…', 30) "
+        f"FROM text_fts JOIN documents d USING (course_key) WHERE {where} "
+        "ORDER BY rank, d.position, seq LIMIT ? OFFSET ?",
+        params + (limit, offset)
+    ).fetchall()
+    return total, [fts_hit(row) for row in rows]